@@ -0,0 +1,85 @@
+# BAS6 package for MODFLOW-2005 generated by Flopy 3.3.6
+FREE
+INTERNAL               1    (75I10) -1 #ibound layer 1                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+   -999.99
+INTERNAL               1  (75E15.6) -1 #strt layer 1                  
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
+   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02   4.800000E+02
@@ -0,0 +1,331 @@
+# BAS6 package for MODFLOW-2005 generated by Flopy 3.3.6
+FREE
+INTERNAL               1    (75I10) -1 #ibound layer 1                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1    (75I10) -1 #ibound layer 2                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1    (75I10) -1 #ibound layer 3                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+INTERNAL               1    (75I10) -1 #ibound layer 4                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+   -999.99
+INTERNAL               1  (75E15.6) -1 #strt layer 1                  
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+INTERNAL               1  (75E15.6) -1 #strt layer 2                  
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+INTERNAL               1  (75E15.6) -1 #strt layer 3                  
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+INTERNAL               1  (75E15.6) -1 #strt layer 4                  
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
+   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.100000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.200000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.400000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02   1.600000E+02
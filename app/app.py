@@ -2,7 +2,8 @@ from datetime import datetime
 import numpy as np
 import matplotlib.pyplot as plt
 
-from utils.FlopyAdapter.Read import ReadBudget, ReadHead, ReadConcentration, ReadDrawdown
+from utils.FlopyAdapter.Encoding import ArrayEncoding
+from utils.FlopyAdapter.Read import ReadBudget, ReadHead, ReadConcentration, ReadDrawdown, ResultFileCache
 from flask import abort, Flask, request, redirect, render_template, Response, send_file, make_response, jsonify
 from flask_cors import CORS, cross_origin
 import pandas as pd
@@ -10,8 +11,8 @@ import os
 from pathlib import Path
 
 import prometheus_client
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
 from prometheus_flask_exporter import PrometheusMetrics
-import sqlite3 as sql
 import urllib.request
 import json
 import jsonschema
@@ -19,37 +20,76 @@ import shutil
 import uuid
 import zipfile
 import io
+import builtins
 import glob
+import hashlib
+import threading
+
+import configuration
+import db
+import deduplication
+import ensemble
+import scheduler
+import wakeup
 
-DB_LOCATION = '/db/modflow.db'
 MODFLOW_FOLDER = '/modflow'
 UPLOAD_FOLDER = './uploads'
 SCHEMA_SERVER_URL = 'https://schema.inowas.com'
 
+# Memory budget in MB and number of the result files kept open by every app process
+READER_CACHE_SIZE = float(os.environ.get('READER_CACHE_SIZE', 256))
+READER_CACHE_ENTRIES = int(os.environ.get('READER_CACHE_ENTRIES', 128))
+ResultFileCache.shared.max_bytes = int(READER_CACHE_SIZE * 1024 ** 2)
+ResultFileCache.shared.max_entries = READER_CACHE_ENTRIES
+
 app = Flask(__name__)
 CORS(app)
-metrics = PrometheusMetrics(app)
+# The /metrics endpoint below exposes the default registry including the request metrics
+metrics = PrometheusMetrics(app, path=None)
 
 g_0 = prometheus_client.Gauge('number_of_calculated_models_0', 'Calculations in queue')
 g_100 = prometheus_client.Gauge('number_of_calculated_models_100', 'Calculations in progress')
 g_200 = prometheus_client.Gauge('number_of_calculated_models_200', 'Calculations finished with success')
 g_400 = prometheus_client.Gauge('number_of_calculated_models_400', 'Calculations finished with error')
-
-
-def db_init():
-    conn = db_connect()
-
-    sql_command = """
-        CREATE TABLE IF NOT EXISTS calculations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT, 
-            calculation_id STRING, 
-            state INTEGER, 
-            message TEXT, 
-            created_at DATE, 
-            updated_at DATE
-        )
-    """
-    conn.execute(sql_command)
+g_499 = prometheus_client.Gauge('number_of_calculated_models_499', 'Calculations cancelled')
+
+h_stages = prometheus_client.Histogram(
+    'calculation_stage_duration_seconds', 'Duration of the calculation stages by model type',
+    ['model_type', 'stage'],
+    buckets=(0.01, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 1800, 3600, 7200, float('inf'))
+)
+h_solver_iterations = prometheus_client.Histogram(
+    'calculation_solver_iterations', 'Solver iterations of all time steps of a calculation by solver package',
+    ['solver', 'kind'],
+    buckets=(1, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000, float('inf'))
+)
+h_percent_discrepancy = prometheus_client.Histogram(
+    'calculation_percent_discrepancy', 'Largest absolute percent discrepancy of a calculation by solver package',
+    ['solver'],
+    buckets=(0.01, 0.1, 0.5, 1, 5, 10, float('inf'))
+)
+c_failed_time_steps = prometheus_client.Counter(
+    'calculation_solver_failed_time_steps', 'Time steps which did not converge by solver package', ['solver']
+)
+
+
+class ReaderCacheCollector:
+    """The counters of the result file cache of this process"""
+
+    def collect(self):
+        cache = ResultFileCache.shared
+        yield CounterMetricFamily('reader_cache_hits', 'Result files served from the reader cache', value=cache.hits)
+        yield CounterMetricFamily('reader_cache_misses', 'Result files opened by the readers', value=cache.misses)
+        yield CounterMetricFamily('reader_cache_evictions', 'Result files removed from the full reader cache',
+                                  value=cache.evictions)
+        yield GaugeMetricFamily('reader_cache_bytes', 'Estimated memory of the cached result files', value=cache.bytes)
+        yield GaugeMetricFamily('reader_cache_entries', 'Cached result files', value=len(cache))
+
+
+prometheus_client.REGISTRY.register(ReaderCacheCollector())
+
+h_stages_lock = threading.Lock()
+h_stages_last_id = 0
 
 
 def fs_init():
@@ -57,14 +97,9 @@ def fs_init():
         os.makedirs(UPLOAD_FOLDER)
 
 
-def db_connect():
-    return sql.connect(DB_LOCATION)
-
-
 # noinspection SqlResolve
 def get_calculation_by_id(calculation_id):
-    conn = db_connect()
-    conn.row_factory = sql.Row
+    conn = db.connect()
     cursor = conn.cursor()
 
     cursor.execute(
@@ -75,7 +110,7 @@ def get_calculation_by_id(calculation_id):
 
 
 def get_number_of_calculations(state=200):
-    conn = db_connect()
+    conn = db.connect()
     cursor = conn.cursor()
 
     cursor.execute(
@@ -85,6 +120,53 @@ def get_number_of_calculations(state=200):
     return cursor.fetchone()[0]
 
 
+# noinspection SqlResolve
+def observe_calculation_timings():
+    """
+    Adds the stage timings and the solver convergence of all calculations finished since the last call
+    to the metrics. Every app process observes all calculations finished after it started,
+    see start_observing_calculation_timings.
+    """
+    global h_stages_last_id
+
+    with h_stages_lock:
+        cursor = db.connect().execute(
+            'SELECT timings_id, timings, convergence FROM calculations WHERE timings_id > ? ORDER BY timings_id',
+            (h_stages_last_id,)
+        )
+        for row in cursor:
+            for model_type, stages in json.loads(row['timings']).items():
+                for stage, seconds in stages.items():
+                    h_stages.labels(model_type=model_type, stage=stage).observe(seconds)
+            if row['convergence']:
+                observe_convergence(json.loads(row['convergence']))
+            h_stages_last_id = row['timings_id']
+
+
+# noinspection SqlResolve
+def start_observing_calculation_timings():
+    """
+    Skips the calculations finished before the process started,
+    every restart and every new app process would count them again.
+    """
+    global h_stages_last_id
+
+    with h_stages_lock:
+        cursor = db.connect().execute('SELECT COALESCE(MAX(timings_id), 0) FROM calculations')
+        h_stages_last_id = cursor.fetchone()[0]
+
+
+def observe_convergence(convergence):
+    solver = convergence.get('solver') or 'unknown'
+    for kind in ['outer', 'inner']:
+        if convergence.get(kind) is not None:
+            h_solver_iterations.labels(solver=solver, kind=kind).observe(convergence[kind])
+    if convergence.get('max_percent_discrepancy') is not None:
+        h_percent_discrepancy.labels(solver=solver).observe(convergence['max_percent_discrepancy'])
+    if convergence.get('failed_time_steps'):
+        c_failed_time_steps.labels(solver=solver).inc(convergence['failed_time_steps'])
+
+
 def get_calculation_details_json(calculation_id, data, path):
     target_directory = os.path.join(app.config['MODFLOW_FOLDER'], calculation_id)
     calculation = get_calculation_by_id(calculation_id)
@@ -231,10 +313,13 @@ def read_json(file):
 def assert_is_valid(content):
     try:
         data = content.get('data')
-        mf = data.get('mf')
-        mt = data.get('mt')
+        # The schema only knows arrays as lists, encoded arrays are validated with their first value
+        mf = ArrayEncoding.with_placeholders(data.get('mf'))
+        mt = ArrayEncoding.with_placeholders(data.get('mt'))
     except AttributeError as e:
         raise e
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise jsonschema.exceptions.ValidationError('Invalid encoded array: {}'.format(e))
 
     try:
         mf_schema_data = urllib.request.urlopen('{}/modflow/packages/mfPackages.json'.format(SCHEMA_SERVER_URL))
@@ -255,8 +340,8 @@ def assert_is_valid(content):
 
 
 # noinspection SqlResolve
-def insert_new_calculation(calculation_id):
-    with db_connect() as con:
+def insert_new_calculation(calculation_id, content=None):
+    with db.connect() as con:
         cur = con.cursor()
         cur.execute('SELECT * FROM calculations WHERE calculation_id = ? AND state < ?', (calculation_id, 200))
 
@@ -264,11 +349,71 @@ def insert_new_calculation(calculation_id):
         if len(result) > 0:
             return
 
+        if content is None:
+            content = configuration.read_configuration(
+                os.path.join(app.config['MODFLOW_FOLDER'], calculation_id, 'configuration.json')
+            )
+
         cur.execute(
-            'INSERT INTO calculations (calculation_id, state, created_at, updated_at) VALUES ( ?, ?, ?, ?)',
-            (calculation_id, 0, datetime.now(), datetime.now())
+            'INSERT INTO calculations '
+            '(calculation_id, state, priority, cost, author, project, content_hash, created_at, updated_at) '
+            'VALUES ( ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (calculation_id, 0, scheduler.get_priority(content), scheduler.estimate_cost(content),
+             content.get('author'), content.get('project'), deduplication.content_hash(content),
+             datetime.now(), datetime.now())
         )
 
+    wakeup.notify()
+
+
+# noinspection SqlResolve
+def get_finished_calculations_by_hash(content_hash):
+    conn = db.connect()
+    cursor = conn.cursor()
+
+    cursor.execute(
+        'SELECT calculation_id, message FROM calculations WHERE content_hash = ? AND state = ? ORDER BY id DESC',
+        (content_hash, 200)
+    )
+    return cursor.fetchall()
+
+
+# noinspection SqlResolve
+def publish_identical_calculation(calculation_id, content):
+    """
+    Publishes the results of a successfully finished calculation with identical data
+    to the given calculation instead of queueing it. Returns False if there is none.
+    """
+    content_hash = deduplication.content_hash(content)
+    target_directory = os.path.join(app.config['MODFLOW_FOLDER'], calculation_id)
+
+    for source in get_finished_calculations_by_hash(content_hash):
+        if source['calculation_id'] == calculation_id:
+            continue
+
+        source_directory = os.path.join(app.config['MODFLOW_FOLDER'], source['calculation_id'])
+        state_file = os.path.join(source_directory, 'state.log')
+        if not os.path.isfile(state_file) or Path(state_file).read_text().strip() != '200':
+            continue
+
+        deduplication.publish_results(source_directory, target_directory)
+
+        with db.connect() as con:
+            con.execute(
+                'INSERT INTO calculations '
+                '(calculation_id, state, message, author, project, content_hash, created_at, updated_at) '
+                'VALUES ( ?, ?, ?, ?, ?, ?, ?, ?)',
+                (calculation_id, 200, source['message'], content.get('author'), content.get('project'),
+                 content_hash, datetime.now(), datetime.now())
+            )
+
+        if app.config['DEBUG']:
+            print('Published results of identical calculation {}.'.format(source['calculation_id']))
+
+        return True
+
+    return False
+
 
 def is_binary(filename):
     """
@@ -322,7 +467,8 @@ def upload_file():
             with open(modflow_file, 'w') as outfile:
                 json.dump(content, outfile)
 
-            insert_new_calculation(calculation_id)
+            if not publish_identical_calculation(calculation_id, content):
+                insert_new_calculation(calculation_id, content)
 
             return redirect('/' + calculation_id)
 
@@ -365,7 +511,8 @@ def upload_file():
                 with open(modflow_file, 'w') as outfile:
                     json.dump(content, outfile)
 
-                insert_new_calculation(calculation_id)
+                if not publish_identical_calculation(calculation_id, content):
+                    insert_new_calculation(calculation_id, content)
 
             return json.dumps({
                 'status': 200,
@@ -377,6 +524,164 @@ def upload_file():
         return render_template('upload.html')
 
 
+@app.route('/batch', methods=['POST'])
+@cross_origin()
+def upload_batch():
+    """
+    Queues one calculation per scenario of a base configuration.
+    The base is stored once, the scenarios only store their package-level overrides
+    and are validated merged with the base.
+    """
+    content = request.get_json(force=True, silent=True) or {}
+    base = content.get('base')
+    scenarios = content.get('scenarios')
+
+    if not scenarios:
+        abort(make_response(jsonify(message='No scenarios given.'), 422))
+
+    try:
+        assert_is_valid(base)
+        for scenario in scenarios:
+            overrides = scenario.get('overrides', {})
+            configuration.validate_overrides(base, overrides)
+            if overrides:
+                assert_is_valid(configuration.apply_overrides(base, overrides))
+    except (jsonschema.exceptions.ValidationError, AttributeError, ValueError) as e:
+        abort(make_response(jsonify(message=str(e)), 422))
+
+    batch_id = uuid.uuid4().hex
+    batch_directory = os.path.join(app.config['MODFLOW_FOLDER'], configuration.BATCH_FOLDER, batch_id)
+    os.makedirs(batch_directory)
+    with open(os.path.join(batch_directory, 'configuration.json'), 'w') as outfile:
+        json.dump(base, outfile)
+
+    calculations = []
+    for scenario in scenarios:
+        calculation_id = scenario.get('calculation_id') or uuid.uuid4().hex
+        scenario = dict(scenario, calculation_id=calculation_id)
+        target_directory = os.path.join(app.config['MODFLOW_FOLDER'], calculation_id)
+        modflow_file = os.path.join(target_directory, 'configuration.json')
+
+        if not os.path.exists(modflow_file):
+            os.makedirs(target_directory, exist_ok=True)
+            # The other scenarios start from the input files of the first one
+            input_from = calculations[0]['calculation_id'] if calculations else None
+            with open(modflow_file, 'w') as outfile:
+                json.dump(configuration.create_reference(scenario, batch_id, input_from), outfile)
+
+            scenario_content = configuration.read_configuration(modflow_file)
+            if not publish_identical_calculation(calculation_id, scenario_content):
+                insert_new_calculation(calculation_id, scenario_content)
+
+        calculations.append({
+            'calculation_id': calculation_id,
+            'link': '/' + calculation_id
+        })
+
+    return json.dumps({
+        'status': 200,
+        'batch_id': batch_id,
+        'calculations': calculations
+    })
+
+
+@app.route('/ensemble', methods=['POST'])
+@cross_origin()
+def upload_ensemble():
+    """
+    Queues one calculation running all members of a parameter ensemble of the base configuration.
+    """
+    content = request.get_json(force=True, silent=True) or {}
+    base = content.get('base')
+
+    try:
+        assert_is_valid(base)
+        ensemble_content = ensemble.create_configuration(base, content.get('sampling'))
+    except (jsonschema.exceptions.ValidationError, AttributeError, ValueError) as e:
+        abort(make_response(jsonify(message=str(e)), 422))
+
+    calculation_id = content.get('calculation_id') or uuid.uuid4().hex
+    ensemble_content['calculation_id'] = calculation_id
+    target_directory = os.path.join(app.config['MODFLOW_FOLDER'], calculation_id)
+    modflow_file = os.path.join(target_directory, 'configuration.json')
+
+    if not os.path.exists(modflow_file):
+        os.makedirs(target_directory, exist_ok=True)
+        with open(modflow_file, 'w') as outfile:
+            json.dump(ensemble_content, outfile)
+
+        if not publish_identical_calculation(calculation_id, ensemble_content):
+            insert_new_calculation(calculation_id, ensemble_content)
+
+    return json.dumps({
+        'status': 200,
+        'calculation_id': calculation_id,
+        'members': len(ensemble.members(ensemble_content)),
+        'link': '/' + calculation_id + '/ensemble'
+    })
+
+
+@app.route('/<calculation_id>/ensemble', methods=['GET'])
+@cross_origin()
+def get_ensemble_summary(calculation_id):
+    summary_file = os.path.join(app.config['MODFLOW_FOLDER'], calculation_id, ensemble.SUMMARY_FILE)
+    if not os.path.isfile(summary_file):
+        abort(404, {'message': 'Ensemble summary of calculation {} not found.'.format(calculation_id)})
+
+    return send_file(summary_file, mimetype='application/json', etag=False)
+
+
+@app.route('/<calculation_id>/convergence', methods=['GET'])
+@cross_origin()
+def get_convergence(calculation_id):
+    """
+    Returns the solver convergence parsed from the list file:
+    iterations, head change and percent discrepancy of every time step and their summary.
+    """
+    convergence_file = os.path.join(app.config['MODFLOW_FOLDER'], calculation_id, 'convergence.json')
+    if not os.path.isfile(convergence_file):
+        abort(404, {'message': 'Convergence of calculation {} not found.'.format(calculation_id)})
+
+    return send_file(convergence_file, mimetype='application/json', etag=False)
+
+
+@app.route('/arrays', methods=['POST'])
+@cross_origin()
+def upload_array():
+    """
+    Stores an uploaded .npy file, which configurations can reference as encoded array.
+    The file is named by its content hash, so identical arrays are stored once.
+    """
+    if request.content_type and 'multipart/form-data' in request.content_type:
+        if 'file' not in request.files:
+            abort(415, 'No file uploaded')
+        content = request.files['file'].read()
+    else:
+        content = request.get_data()
+
+    try:
+        array = np.load(io.BytesIO(content), allow_pickle=False)
+    except (OSError, ValueError) as e:
+        abort(make_response(jsonify(message='Invalid .npy file: {}'.format(e)), 422))
+
+    os.makedirs(ArrayEncoding.npy_folder, exist_ok=True)
+    filename = hashlib.sha256(content).hexdigest() + '.npy'
+    target_file = os.path.join(ArrayEncoding.npy_folder, filename)
+    if not os.path.exists(target_file):
+        temp_file = target_file + '.' + uuid.uuid4().hex
+        with open(temp_file, 'wb') as f:
+            f.write(content)
+        os.replace(temp_file, target_file)
+
+    return json.dumps({
+        'status': 200,
+        'encoding': 'npy',
+        'file': filename,
+        'dtype': str(array.dtype),
+        'shape': [int(size) for size in array.shape]
+    })
+
+
 @app.route('/<calculation_id>', methods=['GET'])
 @cross_origin()
 def calculation_details(calculation_id):
@@ -385,10 +690,12 @@ def calculation_details(calculation_id):
     if not os.path.exists(modflow_file):
         abort(404, 'Calculation with id: {} not found.'.format(calculation_id))
 
-    if not glob.glob(path + '/*.list'):
+    calculation = get_calculation_by_id(calculation_id)
+    cancelled = calculation is not None and calculation['state'] == 499
+    if not glob.glob(path + '/*.list') and not cancelled:
         insert_new_calculation(calculation_id)
 
-    data = read_json(modflow_file).get('data').get('mf')
+    data = configuration.read_configuration(modflow_file).get('data').get('mf')
     path = os.path.join(app.config['MODFLOW_FOLDER'], calculation_id)
 
     if request.headers.get('Accept') == 'application/json':
@@ -404,6 +711,37 @@ def calculation_details(calculation_id):
     return render_template('details.html', id=str(calculation_id), data=data, path=path)
 
 
+# noinspection SqlResolve
+@app.route('/<calculation_id>', methods=['DELETE'])
+@app.route('/<calculation_id>/cancel', methods=['POST'])
+@cross_origin()
+def cancel_calculation(calculation_id):
+    path = os.path.join(app.config['MODFLOW_FOLDER'], calculation_id)
+    if get_calculation_by_id(calculation_id) is None:
+        abort(404, 'Calculation with id: {} not found.'.format(calculation_id))
+
+    # Queued calculations are never claimed, running calculations are stopped by their worker
+    with db.connect() as con:
+        cur = con.cursor()
+        cur.execute(
+            'UPDATE calculations SET state = ?, message = ?, updated_at = ? WHERE calculation_id = ? AND state IN (?, ?)',
+            (499, 'Calculation cancelled.', datetime.now(), calculation_id, 0, 100)
+        )
+        cancelled = cur.rowcount > 0
+
+    if not cancelled:
+        abort(409, 'Calculation with id: {} is neither queued nor running.'.format(calculation_id))
+
+    if os.path.isdir(path):
+        Path(os.path.join(path, 'state.log')).write_text('499')
+
+    return json.dumps({
+        'status': 200,
+        'calculation_id': calculation_id,
+        'state': 499
+    })
+
+
 @app.route('/<calculation_id>/files/<file_name>', methods=['GET'])
 @cross_origin()
 def get_file(calculation_id, file_name):
@@ -477,7 +815,7 @@ def get_results_head_drawdown_by_totim(calculation_id, type, layer, totim):
 def create_png_image(data: [], vmin=None, vmax=None, cmap='jet_r'):
     bytes_image = io.BytesIO()
 
-    data = np.array(data, dtype=np.float32)
+    data = np.asarray(data, dtype=np.float32)
 
     if vmin is None:
         vmin = np.nanmin(data) - np.nanstd(data)
@@ -493,7 +831,7 @@ def create_png_image(data: [], vmin=None, vmax=None, cmap='jet_r'):
 def create_png_colorbar(data: [], vmin=None, vmax=None, cmap='jet_r'):
     bytes_image = io.BytesIO()
 
-    data = np.array(data, dtype=np.float32)
+    data = np.asarray(data, dtype=np.float32)
     if vmin is None:
         vmin = np.nanmin(data) - np.nanstd(data)
 
@@ -547,10 +885,12 @@ def get_results_head_drawdown_by_idx(calculation_id, type='head', layer=0, idx=0
         if layer >= nlay:
             abort(404, 'Layer must be less then the overall number of layers ({}).'.format(nlay))
 
-        data = heads.read_layer_by_idx(idx, layer)
-        [min, max] = heads.read_min_max_by_idx(idx)
         cmap = 'jet_r'
 
+        if output in ['image', 'colorbar']:
+            data = heads.read_layer_array(idx, layer)
+            [min, max] = heads.read_min_max_by_idx(idx)
+
         if output == 'image':
             return send_file(create_png_image(data, cmap=cmap, vmin=min, vmax=max), mimetype='image/png',
                              etag=True,
@@ -561,7 +901,7 @@ def get_results_head_drawdown_by_idx(calculation_id, type='head', layer=0, idx=0
                              etag=True,
                              max_age=3600)
 
-        return json.dumps(data)
+        return json.dumps(heads.read_layer_by_idx(idx, layer))
 
     if type == 'drawdown':
         drawdown = ReadDrawdown(target_folder)
@@ -573,10 +913,12 @@ def get_results_head_drawdown_by_idx(calculation_id, type='head', layer=0, idx=0
         if layer >= nlay:
             abort(404, 'Layer must be less then the overall number of layers ({}).'.format(nlay))
 
-        data = drawdown.read_layer_by_idx(idx, layer)
-        [min, max] = drawdown.read_min_max_by_idx(idx)
         cmap = 'jet_r'
 
+        if output in ['image', 'colorbar']:
+            data = drawdown.read_layer_array(idx, layer)
+            [min, max] = drawdown.read_min_max_by_idx(idx)
+
         if output == 'image':
             return send_file(create_png_image(data, cmap=cmap, vmin=min, vmax=max), mimetype='image/png',
                              etag=True,
@@ -587,7 +929,7 @@ def get_results_head_drawdown_by_idx(calculation_id, type='head', layer=0, idx=0
                              etag=True,
                              max_age=3600)
 
-        return json.dumps(data)
+        return json.dumps(drawdown.read_layer_by_idx(idx, layer))
 
 
 @app.route('/<calculation_id>/timeseries/types/<type>/layers/<layer>/rows/<row>/columns/<column>', methods=['GET'])
@@ -620,6 +962,50 @@ def get_results_time_series(calculation_id, type, layer, row, column):
         return json.dumps(drawdown.read_ts(layer, row, col))
 
 
+@app.route('/<calculation_id>/timeseries/types/<type>', methods=['POST'])
+@cross_origin()
+def get_results_time_series_of_cells(calculation_id, type):
+    """
+    The time series of many cells at once, posted as {"cells": [[layer, row, column], ...], "substance": 0}.
+    Returns the rows [totim, value of the first cell, value of the second cell, ...].
+    """
+    target_folder = os.path.join(app.config['MODFLOW_FOLDER'], calculation_id)
+    modflow_file = os.path.join(target_folder, 'configuration.json')
+
+    if not os.path.exists(modflow_file):
+        abort(404, 'Calculation with id: {} not found.'.format(calculation_id))
+
+    permitted_types = ['head', 'drawdown', 'concentration']
+    if type not in permitted_types:
+        abort(404, 'Type: {} not in the list of permitted types. Permitted types are: {}.'.format(
+            type, ", ".join(permitted_types)))
+
+    content = request.get_json(force=True, silent=True) or {}
+    try:
+        cells = [tuple(int(value) for value in cell) for cell in content['cells']]
+        substance = int(content.get('substance', 0))
+    except (KeyError, TypeError, ValueError):
+        cells = []
+    if len(cells) == 0 or any(len(cell) != 3 for cell in cells):
+        abort(make_response(jsonify(message='The cells must be a list of [layer, row, column].'), 422))
+
+    if type == 'head':
+        data = ReadHead(target_folder).read_ts_by_cells(cells)
+    elif type == 'drawdown':
+        data = ReadDrawdown(target_folder).read_ts_by_cells(cells)
+    else:
+        concentrations = ReadConcentration(target_folder)
+        nsub = concentrations.read_number_of_substances()
+        if substance >= nsub:
+            abort(404, 'Substance: {} not available. Number of substances: {}.'.format(substance, nsub))
+        data = concentrations.read_ts_by_cells(cells, substance=substance)
+
+    if len(data) == 0:
+        abort(404, 'No {} results for the cells, all cells must be within the model grid.'.format(type))
+
+    return json.dumps(data)
+
+
 @app.route('/<calculation_id>/results/types/budget/totims/<totim>', methods=['GET'])
 @cross_origin()
 def get_results_budget_by_totim(calculation_id, totim):
@@ -754,6 +1140,10 @@ def get_download_model(calculation_id):
     with zipfile.ZipFile(data, mode='w') as z:
         for root, dirs, files in os.walk("."):
             for filename in files:
+                if filename == 'configuration.json':
+                    # batch calculations only reference their base configuration
+                    z.writestr(filename, json.dumps(configuration.read_configuration(filename)))
+                    continue
                 z.write(filename)
 
     data.seek(0)
@@ -802,18 +1192,20 @@ def get_package_data(calculation_id: str, package: str, prop: str = None, idx: i
     if not os.path.exists(filename):
         raise FileNotFoundError(f'Calculation with id: {calculation_id} not found.')
 
-    content = read_json(filename)
+    content = configuration.read_configuration(filename)
     data: dict = content.get('data').get('mf') or content.get('data').get('mt') or content.get('data').get('swt')
 
     if not data:
         raise FileNotFoundError(f'Calculation data with id: {calculation_id} not found.')
 
     if not prop:
+        if isinstance(data.get(package), dict):
+            return {key: ArrayEncoding.decode_to_list(value) for key, value in data.get(package).items()}
         return data.get(package)
 
     if data.get(package) and data.get(package).get(prop):
-        prop_data = data.get(package).get(prop)
-        if isinstance(prop_data, __builtins__.list):
+        prop_data = ArrayEncoding.decode_to_list(data.get(package).get(prop))
+        if isinstance(prop_data, builtins.list):
             if idx is None:
                 return prop_data
             if prop_data[int(idx)]:
@@ -888,8 +1280,7 @@ def get_elevation_image(calculation_id: str, type: str, layer_idx: str = 0):
 # noinspection SqlResolve
 @app.route('/list')
 def list():
-    con = db_connect()
-    con.row_factory = sql.Row
+    con = db.connect()
 
     cur = con.cursor()
     cur.execute('select * from calculations')
@@ -904,6 +1295,8 @@ def metrics():
     g_100.set(get_number_of_calculations(100))
     g_200.set(get_number_of_calculations(200))
     g_400.set(get_number_of_calculations(400))
+    g_499.set(get_number_of_calculations(499))
+    observe_calculation_timings()
     CONTENT_TYPE_LATEST = str('text/plain; version=0.0.4; charset=utf-8')
     return Response(prometheus_client.generate_latest(), mimetype=CONTENT_TYPE_LATEST)
 
@@ -925,7 +1318,10 @@ app.config['MODFLOW_FOLDER'] = MODFLOW_FOLDER
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
 app.config['DEBUG'] = False
 
-db_init()
+ArrayEncoding.npy_folder = os.path.join(app.config['MODFLOW_FOLDER'], configuration.ARRAY_FOLDER)
+
+db.init()
+start_observing_calculation_timings()
 fs_init()
 
 if __name__ == '__main__':
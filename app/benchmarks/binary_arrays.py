@@ -0,0 +1,62 @@
+"""
+Writing and reading the input files of a large multi-layer model
+with arrays as formatted text against arrays as external binary files.
+Reading is measured with the flopy loader, which parses the arrays like Modflow.
+
+Usage (from the app folder):
+    python -m benchmarks.binary_arrays [nlay] [nrow] [ncol]
+"""
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import flopy
+import numpy as np
+
+from benchmarks.incremental_input import model_data
+from utils.FlopyAdapter.Calculation import InowasFlopyCalculationAdapter, BinaryArrays
+
+
+def measure(nlay, nrow, ncol, binary_array_threshold):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        data = model_data(nlay, nrow, ncol, tmp_dir)
+        # Realistic models have few uniform arrays
+        rng = np.random.default_rng(1)
+        data['dis']['botm'] = (np.array(data['dis']['botm']) + rng.uniform(-1, 1, (nlay, nrow, ncol))).tolist()
+        data['bas']['strt'] = rng.uniform(90, 99, (nlay, nrow, ncol)).tolist()
+        adapter = InowasFlopyCalculationAdapter('3.2.10', {}, 'benchmark')
+        with contextlib.redirect_stdout(io.StringIO()):
+            adapter.create_model(adapter.mf_package_order, adapter.read_packages(data))
+
+        def write():
+            if binary_array_threshold:
+                BinaryArrays(binary_array_threshold).apply(adapter._model)
+            adapter._model.write_input()
+
+        def read():
+            with contextlib.redirect_stdout(io.StringIO()):
+                flopy.modflow.Modflow.load('mf.nam', model_ws=tmp_dir, check=False, load_only=['dis', 'bas6', 'lpf'])
+
+        write_time = timeit.timeit(write, number=1)
+        read_time = timeit.timeit(read, number=1)
+        size = sum(os.path.getsize(os.path.join(tmp_dir, file)) for file in os.listdir(tmp_dir))
+        return write_time, read_time, size
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def main(nlay, nrow, ncol):
+    print('Cells: {} ({} x {} x {})'.format(nlay * nrow * ncol, nlay, nrow, ncol))
+    for label, threshold in [('text arrays', None), ('binary arrays', 10000)]:
+        write_time, read_time, size = measure(nlay, nrow, ncol, threshold)
+        print('{:<15} write: {:8.3f} s, read: {:8.3f} s, size: {:8.1f} MB'.format(
+            label, write_time, read_time, size / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:4])) if len(sys.argv) > 3 else main(10, 300, 300)
@@ -0,0 +1,56 @@
+"""
+Opening a head file with thousands of time steps and reading one layer,
+flopy scanning all record headers against the sidecar index.
+
+Usage (from the app folder):
+    python -m benchmarks.binary_index [ntimes] [nlay] [nrow] [ncol]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import flopy.utils.binaryfile as bf
+import numpy as np
+
+from utils.FlopyAdapter.Read import BinaryFileIndex
+
+
+def write_head_file(filename, ntimes, nlay, nrow, ncol):
+    header_dtype = bf.BinaryHeader.set_dtype(bintype='Head', precision='single')
+    data = np.ones((nrow, ncol), dtype=np.float32).tobytes()
+    with open(filename, 'wb') as f:
+        for time in range(ntimes):
+            for layer in range(nlay):
+                header = np.array([(time + 1, 1, 1.0, float(time + 1), b'            HEAD', ncol, nrow, layer + 1)],
+                                  dtype=header_dtype)
+                f.write(header.tobytes())
+                f.write(data)
+
+
+def main(ntimes, nlay, nrow, ncol):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmp_dir, 'mf.hds')
+        write_head_file(filename, ntimes, nlay, nrow, ncol)
+
+        def read(open_file):
+            heads = open_file()
+            heads.get_data(idx=ntimes // 2, mflay=nlay - 1)
+            heads.close()
+
+        scan = min(timeit.repeat(lambda: read(lambda: bf.HeadFile(filename, precision='single')), number=1, repeat=5))
+        build = timeit.timeit(lambda: BinaryFileIndex.build(tmp_dir), number=1)
+        indexed = min(timeit.repeat(lambda: read(lambda: BinaryFileIndex.head_file(filename)), number=1, repeat=5))
+
+        print('Records: {} ({} time steps x {} layers), {} x {} cells'.format(ntimes * nlay, ntimes, nlay, nrow, ncol))
+        print('{:<40} {:10.4f} s'.format('open and read a layer, flopy', scan))
+        print('{:<40} {:10.4f} s'.format('build the index (once)', build))
+        print('{:<40} {:10.4f} s'.format('open and read a layer, indexed', indexed))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:5])) if len(sys.argv) > 4 else main(5000, 5, 50, 50)
@@ -0,0 +1,62 @@
+"""
+Cold start of the worker and the app: a fresh interpreter importing the module,
+and for the worker also creating a first Modflow model.
+
+Usage (from the app folder):
+    python -m benchmarks.cold_start [repeat]
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER = """
+import worker
+"""
+
+WORKER_FIRST_MODEL = """
+import worker
+from utils.FlopyAdapter.Calculation import InowasFlopyCalculationAdapter
+adapter = InowasFlopyCalculationAdapter('3.2.10', {}, 'cold_start')
+adapter.create_model(adapter.mf_package_order, {
+    'mf': {'modelname': 'mf', 'model_ws': '.'}, 'dis': {'nlay': 1, 'nrow': 10, 'ncol': 10},
+    'bas': {}, 'lpf': {}, 'pcg': {}, 'oc': {}
+})
+"""
+
+APP = """
+import db
+import wakeup
+db.DB_LOCATION = 'modflow.db'
+wakeup.WAKEUP_FIFO = 'worker.fifo'
+import app
+"""
+
+
+def measure(code, repeat):
+    durations = []
+    for _ in range(repeat):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            env = dict(os.environ, PYTHONPATH=APP_FOLDER)
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], cwd=tmp_dir, env=env, check=True,
+                           stdout=subprocess.DEVNULL)
+            durations.append(time.perf_counter() - start)
+        finally:
+            shutil.rmtree(tmp_dir)
+    return statistics.median(durations)
+
+
+def main(repeat):
+    for label, code in [('worker import', WORKER), ('worker first model', WORKER_FIRST_MODEL), ('app import', APP)]:
+        print('{:<25} {:8.3f} s'.format(label, measure(code, repeat)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,69 @@
+"""
+Lookup latency of the calculations table with and without the indexes.
+
+Usage (from the app folder):
+    python -m benchmarks.db_lookup [number_of_rows]
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+import uuid
+from datetime import datetime
+
+import db
+
+
+def fill(conn, number_of_rows):
+    now = datetime.now()
+    rows = ((uuid.uuid4().hex, random.choice([0, 100, 200, 400]), now, now) for _ in range(number_of_rows))
+    conn.executemany('INSERT INTO calculations (calculation_id, state, created_at, updated_at) VALUES (?, ?, ?, ?)',
+                     rows)
+    conn.commit()
+
+
+def measure(conn, calculation_ids, repeat=1000):
+    def lookup():
+        conn.execute(
+            'SELECT calculation_id, state, message FROM calculations WHERE calculation_id = ? ORDER BY id DESC LIMIT 1',
+            (random.choice(calculation_ids),)
+        ).fetchone()
+
+    def count():
+        conn.execute('SELECT Count() FROM calculations WHERE state = ?', (random.choice([0, 100]),)).fetchone()
+
+    return {
+        'get_calculation_by_id': timeit.timeit(lookup, number=repeat) / repeat,
+        'get_number_of_calculations': timeit.timeit(count, number=10) / 10,
+    }
+
+
+def main(number_of_rows):
+    tmp_dir = tempfile.mkdtemp()
+    db.DB_LOCATION = os.path.join(tmp_dir, 'modflow.db')
+    try:
+        conn = db.connect()
+        # Schema without indexes, as before the migrations
+        db.migration_create_calculations(conn)
+        db.migration_add_worker_id(conn)
+        fill(conn, number_of_rows)
+        calculation_ids = [row[0] for row in conn.execute(
+            'SELECT calculation_id FROM calculations ORDER BY random() LIMIT 1000')]
+
+        before = measure(conn, calculation_ids, repeat=20)
+        db.init()
+        after = measure(conn, calculation_ids)
+
+        print('Rows: {}'.format(number_of_rows))
+        for key in before:
+            print('{:<30} without indexes: {:10.3f} ms, with indexes: {:10.3f} ms'.format(
+                key, before[key] * 1000, after[key] * 1000))
+    finally:
+        db.close()
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
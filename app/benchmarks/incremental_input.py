@@ -0,0 +1,74 @@
+"""
+Writing the input files of a large multi-layer model,
+all packages against only the packages changed since the last write.
+
+Usage (from the app folder):
+    python -m benchmarks.incremental_input [nlay] [nrow] [ncol]
+"""
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+from utils.FlopyAdapter.Calculation import InowasFlopyCalculationAdapter, IncrementalWriter
+
+
+def model_data(nlay, nrow, ncol, model_ws):
+    rng = np.random.default_rng(0)
+    top = np.full((nrow, ncol), 100.0)
+    botm = np.array([np.full((nrow, ncol), 100.0 - 10.0 * (layer + 1)) for layer in range(nlay)])
+    return {
+        'packages': ['mf', 'dis', 'bas', 'lpf', 'wel', 'oc', 'pcg'],
+        'mf': {'modelname': 'mf', 'model_ws': model_ws},
+        'dis': {'nlay': nlay, 'nrow': nrow, 'ncol': ncol, 'nper': 1, 'delr': 100.0, 'delc': 100.0,
+                'top': top.tolist(), 'botm': botm.tolist(), 'perlen': [1], 'nstp': [1], 'steady': [True]},
+        'bas': {'ibound': np.ones((nlay, nrow, ncol), dtype=int).tolist(),
+                'strt': np.full((nlay, nrow, ncol), 95.0).tolist()},
+        'lpf': {'hk': rng.uniform(1, 100, (nlay, nrow, ncol)).tolist(),
+                'vka': rng.uniform(0.1, 10, (nlay, nrow, ncol)).tolist(),
+                'laytyp': [0] * nlay},
+        'wel': {'stress_period_data': {'0': [[0, nrow // 2, ncol // 2, -1000.0]]}},
+        'oc': {},
+        'pcg': {},
+    }
+
+
+def write(data, incremental):
+    flopy = InowasFlopyCalculationAdapter('3.2.10', {}, 'benchmark')
+    with contextlib.redirect_stdout(io.StringIO()):
+        package_content = flopy.read_packages(data)
+        flopy.create_model(flopy.mf_package_order, package_content)
+
+    def write_input():
+        if incremental:
+            IncrementalWriter(data['mf']['model_ws'], 'mf').write(flopy._model, flopy._packages, package_content)
+        else:
+            flopy._model.write_input()
+
+    return timeit.timeit(write_input, number=1)
+
+
+def main(nlay, nrow, ncol):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        data = model_data(nlay, nrow, ncol, tmp_dir)
+        full = write(data, incremental=False)
+        first = write(data, incremental=True)
+
+        data['wel']['stress_period_data']['0'][0][3] = -2000.0
+        changed_wel = write(data, incremental=True)
+
+        print('Cells: {} ({} x {} x {})'.format(nlay * nrow * ncol, nlay, nrow, ncol))
+        print('{:<40} {:10.3f} s'.format('write_input, all packages', full))
+        print('{:<40} {:10.3f} s'.format('incremental, first write', first))
+        print('{:<40} {:10.3f} s'.format('incremental, changed wel', changed_wel))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:4])) if len(sys.argv) > 3 else main(10, 300, 300)
@@ -0,0 +1,44 @@
+"""
+Rounding a layer and replacing dry and inactive cells with None for the json response,
+the loops over the cells of the readers against the numpy operations.
+
+Usage (from the app folder):
+    python -m benchmarks.layer_rounding [nrow] [ncol]
+"""
+import json
+import sys
+import timeit
+
+import numpy as np
+
+from utils.FlopyAdapter.Read import ReadHead
+
+
+def layer_to_list_loops(data):
+    data = data.tolist()
+    for i in range(len(data)):
+        for j in range(len(data[i])):
+            data[i][j] = round(data[i][j], 2)
+            if data[i][j] < -999:
+                data[i][j] = None
+    return data
+
+
+def main(nrow, ncol):
+    data = (np.random.default_rng(1).random((nrow, ncol), dtype=np.float32) * 100).astype(np.float32)
+    data[::7, ::3] = -1e30
+
+    assert ReadHead.layer_to_list(data) == layer_to_list_loops(data)
+
+    loops = min(timeit.repeat(lambda: layer_to_list_loops(data), number=1, repeat=3))
+    vectorized = min(timeit.repeat(lambda: ReadHead.layer_to_list(data), number=1, repeat=3))
+    encoding = min(timeit.repeat(lambda: json.dumps(ReadHead.layer_to_list(data)), number=1, repeat=3))
+
+    print('Layer: {} x {} cells'.format(nrow, ncol))
+    print('{:<40} {:10.4f} s'.format('round and mask, loops', loops))
+    print('{:<40} {:10.4f} s'.format('round and mask, numpy', vectorized))
+    print('{:<40} {:10.4f} s'.format('round, mask and json encoding, numpy', encoding))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3])) if len(sys.argv) > 2 else main(1000, 1000)
@@ -0,0 +1,94 @@
+"""
+Reading a layer and the min/max of a time step of a large head file,
+flopy reading all layers of the time step into memory against views of a memory map.
+Every read runs in a forked process to measure its peak memory (RSS).
+
+Usage (from the app folder):
+    python -m benchmarks.memmap_reader [ntimes] [nlay] [nrow] [ncol] [folder]
+"""
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+import flopy.utils.binaryfile as bf
+import numpy as np
+
+from utils.FlopyAdapter.Read import BinaryFileIndex, MemmapLayerFile
+
+
+def write_head_file(filename, ntimes, nlay, nrow, ncol):
+    header_dtype = bf.BinaryHeader.set_dtype(bintype='Head', precision='single')
+    data = np.random.default_rng(1).random((nrow, ncol), dtype=np.float32).tobytes()
+    with open(filename, 'wb') as f:
+        for step in range(ntimes):
+            for layer in range(nlay):
+                header = np.array([(step + 1, 1, 1.0, float(step + 1), b'            HEAD', ncol, nrow, layer + 1)],
+                                  dtype=header_dtype)
+                f.write(header.tobytes())
+                f.write(data)
+
+
+def measure(function):
+    """The duration in seconds and the peak RSS in MB of the function in a forked process"""
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        start = time.perf_counter()
+        function()
+        os.write(write, str(time.perf_counter() - start).encode())
+        os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read) as f:
+        duration = float(f.read())
+    _, _, usage = os.wait4(pid, 0)
+    return duration, usage.ru_maxrss / 1024
+
+
+def main(ntimes, nlay, nrow, ncol, folder=None):
+    tmp_dir = tempfile.mkdtemp(dir=folder)
+    try:
+        filename = os.path.join(tmp_dir, 'mf.hds')
+        write_head_file(filename, ntimes, nlay, nrow, ncol)
+        BinaryFileIndex.build(tmp_dir)
+        idx = ntimes // 2
+        totim = float(idx + 1)
+
+        def flopy_layer():
+            BinaryFileIndex.head_file(filename).get_data(totim=totim, mflay=nlay - 1).sum()
+
+        def memmap_layer():
+            MemmapLayerFile(BinaryFileIndex.head_file(filename)).get_data(idx=idx, mflay=nlay - 1).sum()
+
+        def flopy_min_max():
+            data = BinaryFileIndex.head_file(filename).get_data(totim=totim)
+            np.max(data), np.min(data, where=data >= -999, initial=np.inf)
+
+        def memmap_min_max():
+            data = MemmapLayerFile(BinaryFileIndex.head_file(filename)).get_data(idx=idx)
+            np.max(data), np.min(data, where=data >= -999, initial=np.inf)
+
+        baseline = measure(lambda: BinaryFileIndex.head_file(filename).get_times())
+        print('File: {:.2f} GB, {} time steps x {} layers of {} x {} cells'.format(
+            os.path.getsize(filename) / 1024 ** 3, ntimes, nlay, nrow, ncol))
+        print('{:<32} {:>10} {:>14}'.format('', 'time', 'peak RSS'))
+        print('{:<32} {:10.4f} s {:10.1f} MB'.format('open the file', *baseline))
+        for name, function in [('read a layer, flopy', flopy_layer), ('read a layer, memmap', memmap_layer),
+                               ('min/max of a time, flopy', flopy_min_max),
+                               ('min/max of a time, memmap', memmap_min_max)]:
+            # The first run reads the pages from disk, the best of three from the page cache
+            durations, rss = zip(*[measure(function) for _ in range(3)])
+            print('{:<32} {:10.4f} s {:10.1f} MB'.format(name, min(durations), max(rss)))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 4:
+        main(*(int(arg) for arg in sys.argv[1:5]), *sys.argv[5:6])
+    else:
+        main(50, 10, 1000, 1000)
@@ -0,0 +1,91 @@
+"""
+Writing and running a model directly in the calculation folder against a scratch workspace
+whose files are moved into the calculation folder afterwards.
+
+The model run is emulated by writing the head and budget records of every time step and layer,
+as Modflow does, so no Modflow executable is needed. The speedup depends on the file system
+of the calculation folder, pass a folder on the shared volume (e.g. the network storage) to measure it.
+
+Usage (from the app folder):
+    python -m benchmarks.scratch_workspace [calculation_folder] [scratch_folder]
+"""
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+import worker
+from benchmarks.incremental_input import model_data
+from utils.FlopyAdapter.Calculation import InowasFlopyCalculationAdapter
+
+MODELS = {
+    'small': (1, 50, 50, 10),
+    'large': (10, 300, 300, 20),
+}
+
+
+def write_outputs(model_ws, nlay, nrow, ncol, nstp):
+    """Writes a record with header per time step and layer, like the binary output of Modflow"""
+    array = np.zeros((nrow, ncol), dtype=np.float32)
+    header = np.zeros(11, dtype=np.int32).tobytes()
+    for file in ['mf.hds', 'mf.cbc']:
+        with open(os.path.join(model_ws, file), 'wb') as f:
+            for _ in range(nstp):
+                for _ in range(nlay):
+                    f.write(header)
+                    f.write(array.tobytes())
+                    f.flush()
+
+
+def run(data, model_ws, nstp):
+    data['mf']['model_ws'] = model_ws
+    dis = data['dis']
+    flopy = InowasFlopyCalculationAdapter('3.2.10', {}, 'benchmark')
+    with contextlib.redirect_stdout(io.StringIO()):
+        package_content = flopy.read_packages(data)
+        flopy.create_model(flopy.mf_package_order, package_content)
+        flopy._model.write_input()
+    write_outputs(model_ws, dis['nlay'], dis['nrow'], dis['ncol'], nstp)
+
+
+def main(calculation_folder=None, scratch_folder=None):
+    calculation_folder = tempfile.mkdtemp(dir=calculation_folder)
+    scratch_folder = tempfile.mkdtemp(dir=scratch_folder or ('/dev/shm' if os.path.isdir('/dev/shm') else None))
+    try:
+        print('Calculation folder: {}'.format(calculation_folder))
+        print('Scratch folder: {}'.format(scratch_folder))
+        for name, (nlay, nrow, ncol, nstp) in MODELS.items():
+            data = model_data(nlay, nrow, ncol, calculation_folder)
+            target_directory = os.path.join(calculation_folder, name)
+            scratch_directory = os.path.join(scratch_folder, name)
+
+            def direct():
+                shutil.rmtree(target_directory, ignore_errors=True)
+                os.makedirs(target_directory)
+                run(data, target_directory, nstp)
+
+            def scratch():
+                shutil.rmtree(target_directory, ignore_errors=True)
+                os.makedirs(target_directory)
+                os.makedirs(scratch_directory)
+                run(data, scratch_directory, nstp)
+                worker.move_scratch_directory(scratch_directory, target_directory)
+
+            print('{} model: {} cells, {} time steps'.format(name, nlay * nrow * ncol, nstp))
+            direct_time = min(timeit.repeat(direct, number=1, repeat=3))
+            scratch_time = min(timeit.repeat(scratch, number=1, repeat=3))
+            print('{:<40} {:10.3f} s'.format('calculation folder', direct_time))
+            print('{:<40} {:10.3f} s'.format('scratch workspace and move', scratch_time))
+            print('{:<40} {:10.2f} x'.format('speedup', direct_time / scratch_time))
+    finally:
+        shutil.rmtree(calculation_folder)
+        shutil.rmtree(scratch_folder)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:3])
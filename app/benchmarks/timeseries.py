@@ -0,0 +1,59 @@
+"""
+Time series of many observation cells of a head file,
+one flopy get_ts per cell against the cells gathered from every record at once
+and against the cell-major copy of the file.
+
+Usage (from the app folder):
+    python -m benchmarks.timeseries [ncells] [ntimes] [nlay] [nrow] [ncol]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+from benchmarks.binary_index import write_head_file
+from utils.FlopyAdapter.Read import BinaryFileIndex, CellMajorFile, ReadHead, ResultFileCache
+
+
+def main(ncells, ntimes, nlay, nrow, ncol):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmp_dir, 'mf.hds')
+        write_head_file(filename, ntimes, nlay, nrow, ncol)
+        BinaryFileIndex.build(tmp_dir)
+        rng = np.random.default_rng(1)
+        cells = list(zip(rng.integers(0, nlay, ncells).tolist(), rng.integers(0, nrow, ncells).tolist(),
+                         rng.integers(0, ncol, ncells).tolist()))
+
+        def flopy_per_cell():
+            for cell in cells:
+                heads = BinaryFileIndex.head_file(filename)
+                heads.get_ts(idx=cell)
+                heads.close()
+
+        reader = ReadHead(tmp_dir)
+        ResultFileCache.shared.clear()
+        per_cell = min(timeit.repeat(flopy_per_cell, number=1, repeat=3))
+        per_request = min(timeit.repeat(lambda: [reader.read_ts(*cell) for cell in cells], number=1, repeat=3))
+        batch = min(timeit.repeat(lambda: reader.read_ts_by_cells(cells), number=1, repeat=3))
+        build = timeit.timeit(lambda: CellMajorFile.build(tmp_dir), number=1)
+        per_request_cell_major = min(timeit.repeat(lambda: [reader.read_ts(*cell) for cell in cells], number=1,
+                                                   repeat=3))
+        batch_cell_major = min(timeit.repeat(lambda: reader.read_ts_by_cells(cells), number=1, repeat=3))
+
+        print('{} cells, {} time steps x {} layers of {} x {} cells'.format(ncells, ntimes, nlay, nrow, ncol))
+        print('{:<40} {:10.4f} s'.format('flopy get_ts per cell', per_cell))
+        print('{:<40} {:10.4f} s'.format('read_ts per cell', per_request))
+        print('{:<40} {:10.4f} s'.format('read_ts_by_cells', batch))
+        print('{:<40} {:10.4f} s'.format('build the cell-major copy (once)', build))
+        print('{:<40} {:10.4f} s'.format('read_ts per cell, cell-major', per_request_cell_major))
+        print('{:<40} {:10.4f} s'.format('read_ts_by_cells, cell-major', batch_cell_major))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:6])) if len(sys.argv) > 5 else main(200, 1000, 3, 100, 100)
@@ -0,0 +1,99 @@
+"""
+Reading of calculation configurations.
+
+The configuration.json of a calculation is either a complete configuration
+or, for calculations submitted as batch, a reference to the base configuration
+shared by all calculations of the batch plus package-level overrides:
+
+    {
+        "calculation_id": "...",
+        "base": "../batches/<batch_id>/configuration.json",
+        "overrides": {"mf": {"wel": {...}, "rch": {...}}}
+    }
+"""
+import json
+import os
+
+BATCH_FOLDER = 'batches'
+
+# Uploaded .npy files referenced by encoded arrays, see ArrayEncoding
+ARRAY_FOLDER = 'arrays'
+
+# Keys of a scenario which are not copied into the configuration
+REFERENCE_KEYS = ['base', 'overrides']
+
+
+def read_json(file):
+    with open(file) as filedata:
+        data = json.loads(filedata.read())
+    return data
+
+
+def validate_overrides(base, overrides):
+    """
+    Raises a ValueError if the overrides do not fit the base configuration.
+    """
+    if not isinstance(overrides, dict):
+        raise ValueError('Overrides must be an object of model types.')
+
+    data = base.get('data') or {}
+    for model_type, packages in overrides.items():
+        if model_type not in data:
+            raise ValueError('Model type: {} not in the base configuration.'.format(model_type))
+        if not isinstance(packages, dict):
+            raise ValueError('Overrides of model type: {} must be an object of packages.'.format(model_type))
+        for package, package_data in packages.items():
+            if package == 'packages' or not isinstance(package_data, dict):
+                raise ValueError('Override of package: {} must be an object.'.format(package))
+
+
+def apply_overrides(base, overrides):
+    """
+    Returns the base configuration with the packages replaced by the overrides.
+    Only the overridden parts are copied, everything else is shared with the base.
+    """
+    content = dict(base)
+    data = dict(base.get('data') or {})
+    for model_type, packages in (overrides or {}).items():
+        model = dict(data[model_type])
+        model['packages'] = list(model.get('packages', []))
+        for package, package_data in packages.items():
+            model[package] = package_data
+            if package not in model['packages']:
+                model['packages'].append(package)
+        data[model_type] = model
+
+    content['data'] = data
+    return content
+
+
+def create_reference(scenario, batch_id, input_from=None):
+    """
+    The configuration of a scenario referencing the base configuration of the batch.
+    With input_from, the worker starts from the input files of that calculation, e.g. the first scenario,
+    and only writes the overridden packages.
+    """
+    reference = {key: value for key, value in scenario.items() if key != 'base'}
+    reference['base'] = os.path.join('..', BATCH_FOLDER, batch_id, 'configuration.json')
+    if input_from is not None and input_from != reference.get('calculation_id'):
+        reference.setdefault('input_from', input_from)
+    return reference
+
+
+def resolve(content, filename):
+    if 'base' not in content:
+        return content
+
+    base_filename = os.path.normpath(os.path.join(os.path.dirname(filename), content['base']))
+    resolved = apply_overrides(read_json(base_filename), content.get('overrides'))
+    for key, value in content.items():
+        if key not in REFERENCE_KEYS:
+            resolved[key] = value
+    return resolved
+
+
+def read_configuration(filename):
+    """
+    Reads the configuration.json of a calculation and resolves batch references.
+    """
+    return resolve(read_json(filename), filename)
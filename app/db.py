@@ -0,0 +1,145 @@
+"""
+Database access shared by the app and the worker.
+
+Connections are opened once per process and thread and reused,
+the database runs in WAL mode, so readers do not block the worker.
+The schema is versioned with PRAGMA user_version, see MIGRATIONS.
+"""
+import math
+import os
+import sqlite3 as sql
+import threading
+
+DB_LOCATION = '/db/modflow.db'
+DB_TIMEOUT = 30
+
+_local = threading.local()
+
+
+def connect():
+    """
+    Returns the connection of the current thread, a new one is opened
+    on first use and after the process was forked.
+    """
+    if getattr(_local, 'pid', None) != os.getpid():
+        _local.pid = os.getpid()
+        _local.connections = {}
+
+    conn = _local.connections.get(DB_LOCATION)
+    if conn is None:
+        conn = open_connection()
+        _local.connections[DB_LOCATION] = conn
+
+    return conn
+
+
+def open_connection(timeout=DB_TIMEOUT):
+    """
+    Opens a new connection which is not shared with the thread,
+    e.g. for a signal handler interrupting a transaction of the thread's connection.
+    """
+    conn = sql.connect(DB_LOCATION, timeout=timeout)
+    conn.row_factory = sql.Row
+    # The aging of the scheduler, SQLite is not always built with its math functions
+    conn.create_function('pow', 2, math.pow, deterministic=True)
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = NORMAL')
+    return conn
+
+
+def close():
+    conn = getattr(_local, 'connections', {}).pop(DB_LOCATION, None)
+    if conn is not None:
+        conn.close()
+
+
+def column_exists(conn, table, column):
+    return column in [row[1] for row in conn.execute('PRAGMA table_info({})'.format(table))]
+
+
+def add_column(conn, table, column, definition):
+    if not column_exists(conn, table, column):
+        conn.execute('ALTER TABLE {} ADD COLUMN {} {}'.format(table, column, definition))
+
+
+def migration_create_calculations(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS calculations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            calculation_id TEXT,
+            state INTEGER,
+            message TEXT,
+            created_at DATE,
+            updated_at DATE
+        )
+    """)
+
+
+def migration_add_worker_id(conn):
+    add_column(conn, 'calculations', 'worker_id', 'TEXT')
+
+
+def migration_add_indexes(conn):
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_calculations_calculation_id ON calculations (calculation_id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_calculations_state ON calculations (state)')
+
+
+def migration_add_scheduling_columns(conn):
+    add_column(conn, 'calculations', 'priority', 'INTEGER DEFAULT 0')
+    add_column(conn, 'calculations', 'cost', 'REAL')
+    add_column(conn, 'calculations', 'author', 'TEXT')
+    add_column(conn, 'calculations', 'project', 'TEXT')
+
+
+def migration_add_content_hash(conn):
+    add_column(conn, 'calculations', 'content_hash', 'TEXT')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_calculations_content_hash ON calculations (content_hash)')
+
+
+def migration_add_leases(conn):
+    add_column(conn, 'calculations', 'lease_expires_at', 'DATE')
+    add_column(conn, 'calculations', 'heartbeat_at', 'DATE')
+    add_column(conn, 'calculations', 'attempts', 'INTEGER DEFAULT 0')
+
+
+def migration_add_timings(conn):
+    add_column(conn, 'calculations', 'timings', 'TEXT')
+    # Sequence in order of saving the timings, calculations finish out of order
+    add_column(conn, 'calculations', 'timings_id', 'INTEGER')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_calculations_timings_id ON calculations (timings_id)')
+
+
+def migration_add_convergence(conn):
+    add_column(conn, 'calculations', 'convergence', 'TEXT')
+
+
+# Append only, the position in the list is the schema version
+MIGRATIONS = [
+    migration_create_calculations,
+    migration_add_worker_id,
+    migration_add_indexes,
+    migration_add_scheduling_columns,
+    migration_add_content_hash,
+    migration_add_leases,
+    migration_add_timings,
+    migration_add_convergence,
+]
+
+
+def init():
+    """
+    Applies all pending migrations.
+    Each migration runs in its own immediate transaction,
+    so the app and several workers can start at the same time.
+    """
+    conn = connect()
+    for version, migration in enumerate(MIGRATIONS, start=1):
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if conn.execute('PRAGMA user_version').fetchone()[0] < version:
+                migration(conn)
+                conn.execute('PRAGMA user_version = {}'.format(version))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
@@ -0,0 +1,71 @@
+"""
+Content-addressed deduplication of calculations.
+
+Calculations are identified by the hash of the normalized data section
+and the warm start of their configuration. Results of a finished calculation are published
+to identical calculations as hardlinks instead of running the model again.
+"""
+import copy
+import hashlib
+import json
+import os
+import shutil
+
+MODEL_TYPES = ['mf', 'mt', 'mp', 'swt']
+
+# Set by the worker for every calculation, irrelevant for the results
+WORKER_SETTINGS = ['modelname', 'model_ws']
+
+# Files which belong to the calculation itself and are never shared
+PRIVATE_FILES = ['configuration.json', 'calculation_details.json']
+
+
+def normalize(data):
+    data = copy.deepcopy(data)
+    for model_type in MODEL_TYPES:
+        model = (data.get(model_type) or {}).get(model_type)
+        if isinstance(model, dict):
+            for key in WORKER_SETTINGS:
+                model.pop(key, None)
+    return data
+
+
+def content_hash(content):
+    data = normalize(content.get('data') or {})
+    if content.get('ensemble'):
+        # An ensemble differs from the single calculation of its base by the members
+        data = {'data': data, 'ensemble': content['ensemble'].get('members')}
+    if content.get('warm_start_from'):
+        # The initial heads of a warm start change the results
+        data = {'data': data, 'warm_start_from': os.path.basename(str(content['warm_start_from'])),
+                'warm_start_heads': content.get('warm_start_heads', 'steady')}
+    serialized = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def link_or_copy(source, target):
+    try:
+        os.link(source, target)
+    except OSError:
+        # e.g. different file systems
+        shutil.copy2(source, target)
+
+
+def publish_results(source_directory, target_directory):
+    for file in os.listdir(source_directory):
+        source = os.path.join(source_directory, file)
+        target = os.path.join(target_directory, file)
+        if file in PRIVATE_FILES or not os.path.isfile(source) or os.path.exists(target):
+            continue
+        link_or_copy(source, target)
+
+
+def unshare_files(directory):
+    """
+    Removes files which are hardlinked into other calculations,
+    so a new run cannot overwrite the results of another calculation.
+    """
+    for file in os.listdir(directory):
+        path = os.path.join(directory, file)
+        if file not in PRIVATE_FILES and os.path.isfile(path) and os.stat(path).st_nlink > 1:
+            os.remove(path)
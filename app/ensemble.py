@@ -0,0 +1,110 @@
+"""
+Parameter ensembles: one base configuration run with many multiplier variants.
+
+The parameters multiply package arrays of the Modflow model, named <package>.<key>.
+The sampling gives the multipliers of the members:
+
+    {"method": "list", "members": [{"lpf.hk": 0.5, "rch.rech": 1.1}, ...]}
+    {"method": "grid", "parameters": {"lpf.hk": [0.5, 1, 2], "rch.rech": [0.8, 1.2]}}  (all combinations)
+    {"method": "lhs", "size": 100, "seed": 1, "parameters": {"lpf.hk": [0.5, 2], "rch.rech": [0.8, 1.2]}}
+        (Latin hypercube of the given size between the given bounds, seed is optional)
+
+The configuration of an ensemble is the base configuration with the key ensemble:
+    {"sampling": {...}, "members": [{"lpf.hk": 0.5, ...}, ...]}
+"""
+import itertools
+import os
+
+import numpy as np
+
+KEY = 'ensemble'
+
+# Summary table of the members, written by the InowasFlopyEnsembleAdapter
+SUMMARY_FILE = 'ensemble_summary.json'
+
+ENSEMBLE_MAX_MEMBERS = int(os.environ.get('ENSEMBLE_MAX_MEMBERS', 1000))
+
+METHODS = ['list', 'grid', 'lhs']
+
+
+def sample_grid(parameters):
+    names = list(parameters)
+    return [dict(zip(names, values)) for values in itertools.product(*(parameters[name] for name in names))]
+
+
+def sample_lhs(parameters, size, seed=None):
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, (low, high) in parameters.items():
+        # One value in each of the size strata, in random order
+        strata = (rng.permutation(size) + rng.uniform(size=size)) / size
+        columns[name] = low + strata * (high - low)
+    return [{name: float(columns[name][member]) for name in parameters} for member in range(size)]
+
+
+def sample(sampling):
+    """
+    Returns the parameters of the members, raises a ValueError for invalid samplings.
+    """
+    if not isinstance(sampling, dict) or sampling.get('method') not in METHODS:
+        raise ValueError('Sampling method must be one of: {}.'.format(', '.join(METHODS)))
+
+    method = sampling['method']
+    if method == 'list':
+        members = sampling.get('members')
+        if not isinstance(members, list) or not all(isinstance(member, dict) for member in members):
+            raise ValueError('Sampling method list needs members as list of objects.')
+        members = [{name: float(value) for name, value in member.items()} for member in members]
+    else:
+        parameters = sampling.get('parameters')
+        if not isinstance(parameters, dict) or len(parameters) == 0:
+            raise ValueError('Sampling method {} needs parameters.'.format(method))
+        for name, values in parameters.items():
+            if not isinstance(values, list) or len(values) == 0:
+                raise ValueError('Values of parameter {} must be a list.'.format(name))
+            if method == 'lhs' and len(values) != 2:
+                raise ValueError('Values of parameter {} must be the bounds [min, max].'.format(name))
+        parameters = {name: [float(value) for value in values] for name, values in parameters.items()}
+
+        if method == 'grid':
+            members = sample_grid(parameters)
+        else:
+            size = sampling.get('size')
+            if not isinstance(size, int) or size < 1:
+                raise ValueError('Sampling method lhs needs the size as positive integer.')
+            members = sample_lhs(parameters, size, sampling.get('seed'))
+
+    if len(members) == 0:
+        raise ValueError('The sampling has no members.')
+    if len(members) > ENSEMBLE_MAX_MEMBERS:
+        raise ValueError('The sampling has {} members, the maximum is {}.'.format(len(members), ENSEMBLE_MAX_MEMBERS))
+    return members
+
+
+def validate_parameters(base, members):
+    """
+    Raises a ValueError if the parameters do not name packages of the Modflow model.
+    """
+    data = base.get('data') or {}
+    if 'mf' not in data or any(model_type in data for model_type in ['mt', 'mp', 'swt']):
+        raise ValueError('Ensembles need a Modflow model without MT3D, ModPath or Seawat.')
+
+    packages = [package.lower() for package in data['mf'].get('packages', [])]
+    for member in members:
+        for name in member:
+            package, _, key = name.partition('.')
+            if not key or package not in packages or package in ['mf', 'dis']:
+                raise ValueError('Parameter {} must be <package>.<key> of a Modflow package.'.format(name))
+
+
+def create_configuration(base, sampling):
+    """
+    Returns the configuration of the ensemble, raises a ValueError for invalid samplings.
+    """
+    members = sample(sampling)
+    validate_parameters(base, members)
+    return dict(base, **{KEY: {'sampling': sampling, 'members': members}})
+
+
+def members(content):
+    return (content.get(KEY) or {}).get('members') or []
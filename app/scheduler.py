@@ -0,0 +1,68 @@
+"""
+Cost-aware scheduling of the calculation queue.
+
+Queued calculations are claimed by
+  1. priority (higher first),
+  2. fairness: authors and projects with fewer running calculations first,
+  3. estimated cost (cheaper first), where the cost of a waiting job
+     halves every SCHEDULER_AGING seconds, so big models are not starved,
+  4. queue order.
+"""
+import os
+
+# Waiting this many seconds halves the effective cost of a calculation
+SCHEDULER_AGING = float(os.environ.get('SCHEDULER_AGING', 600))
+
+# Relative extra cost of the models running after the flow model
+MODEL_COST_FACTORS = {
+    'mt': 2.0,
+    'mp': 0.2,
+    'swt': 3.0,
+}
+
+CLAIM_ORDER = """
+    priority DESC,
+    (SELECT Count() FROM calculations running WHERE running.state = 100 AND running.author = queued.author) ASC,
+    (SELECT Count() FROM calculations running WHERE running.state = 100 AND running.project = queued.project) ASC,
+    COALESCE(cost, 0) * pow(0.5, (julianday(:now) - julianday(created_at)) * 86400.0 / :aging) ASC,
+    id ASC
+"""
+
+
+def number_of_time_steps(nstp, nper):
+    if isinstance(nstp, list):
+        return sum(nstp)
+    return nstp * nper
+
+
+def estimate_cost(content):
+    """
+    Estimates the calculation cost from the configuration
+    as number of cells times number of time steps.
+    """
+    data = content.get('data') or {}
+    mf = data.get('mf') or {}
+    dis = mf.get('dis') or {}
+
+    try:
+        cells = int(dis.get('nlay', 1)) * int(dis.get('nrow', 1)) * int(dis.get('ncol', 1))
+        time_steps = number_of_time_steps(dis.get('nstp', 1), int(dis.get('nper', 1)))
+    except (TypeError, ValueError):
+        return None
+
+    factor = 1.0
+    for model_type, model_factor in MODEL_COST_FACTORS.items():
+        if data.get(model_type) is not None:
+            factor += model_factor
+
+    # Ensembles run the model once per member
+    factor *= max(len((content.get('ensemble') or {}).get('members') or []), 1)
+
+    return float(cells * time_steps * factor)
+
+
+def get_priority(content):
+    try:
+        return int(content.get('priority', 0))
+    except (TypeError, ValueError):
+        return 0
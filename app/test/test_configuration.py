@@ -0,0 +1,81 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import configuration
+
+
+class ConfigurationTest(unittest.TestCase):
+    base = {
+        'calculation_id': 'base',
+        'author': 'author',
+        'data': {
+            'mf': {
+                'packages': ['mf', 'dis', 'wel'],
+                'mf': {'modelname': 'mf'},
+                'dis': {'nlay': 1},
+                'wel': {'stress_period_data': {'0': [[0, 1, 1, -100]]}},
+            }
+        }
+    }
+
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def test_it_overrides_and_adds_packages_test(self):
+        overrides = {'mf': {
+            'wel': {'stress_period_data': {'0': [[0, 1, 1, -200]]}},
+            'rch': {'stress_period_data': {'0': 0.001}},
+        }}
+        content = configuration.apply_overrides(self.base, overrides)
+
+        self.assertEqual(content['data']['mf']['packages'], ['mf', 'dis', 'wel', 'rch'])
+        self.assertEqual(content['data']['mf']['wel'], overrides['mf']['wel'])
+        self.assertIs(content['data']['mf']['dis'], self.base['data']['mf']['dis'])
+        self.assertEqual(self.base['data']['mf']['packages'], ['mf', 'dis', 'wel'])
+
+    def test_it_rejects_overrides_not_matching_the_base_test(self):
+        configuration.validate_overrides(self.base, {'mf': {'rch': {}}})
+        for overrides in [[], {'mt': {'btn': {}}}, {'mf': []}, {'mf': {'wel': []}}, {'mf': {'packages': {}}}]:
+            with self.assertRaises(ValueError):
+                configuration.validate_overrides(self.base, overrides)
+
+    def test_scenarios_start_from_the_input_files_of_another_scenario_test(self):
+        scenario = {'calculation_id': 'scenario_1', 'overrides': {'mf': {'dis': {'nlay': 2}}}}
+        self.assertEqual(configuration.create_reference(scenario, 'batch', 'scenario_0')['input_from'], 'scenario_0')
+        self.assertNotIn('input_from', configuration.create_reference(scenario, 'batch', 'scenario_1'))
+        self.assertEqual(configuration.create_reference(
+            dict(scenario, input_from='previous'), 'batch', 'scenario_0')['input_from'], 'previous')
+
+    def test_it_resolves_batch_references_test(self):
+        batch_directory = os.path.join(self._tmp_dir, configuration.BATCH_FOLDER, 'batch')
+        target_directory = os.path.join(self._tmp_dir, 'scenario')
+        os.makedirs(batch_directory)
+        os.makedirs(target_directory)
+
+        with open(os.path.join(batch_directory, 'configuration.json'), 'w') as f:
+            json.dump(self.base, f)
+
+        scenario = {'calculation_id': 'scenario', 'overrides': {'mf': {'dis': {'nlay': 2}}}}
+        filename = os.path.join(target_directory, 'configuration.json')
+        with open(filename, 'w') as f:
+            json.dump(configuration.create_reference(scenario, 'batch'), f)
+
+        content = configuration.read_configuration(filename)
+        self.assertEqual(content['calculation_id'], 'scenario')
+        self.assertEqual(content['author'], 'author')
+        self.assertEqual(content['data']['mf']['dis'], {'nlay': 2})
+        self.assertNotIn('base', content)
+        self.assertNotIn('overrides', content)
+        self.assertNotIn('input_from', content)
+        self.assertEqual(configuration.read_configuration(os.path.join(batch_directory, 'configuration.json')),
+                         self.base)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import shutil
+import sqlite3 as sql
+import tempfile
+import threading
+import unittest
+
+import db
+
+
+class DbTest(unittest.TestCase):
+    def setUp(self):
+        self._db_location = db.DB_LOCATION
+        self._tmp_dir = tempfile.mkdtemp()
+        db.DB_LOCATION = os.path.join(self._tmp_dir, 'modflow.db')
+
+    def tearDown(self):
+        db.close()
+        db.DB_LOCATION = self._db_location
+        shutil.rmtree(self._tmp_dir)
+
+    def test_it_migrates_a_legacy_database_test(self):
+        conn = sql.connect(db.DB_LOCATION)
+        conn.execute(
+            'CREATE TABLE calculations (id INTEGER PRIMARY KEY AUTOINCREMENT, calculation_id TEXT, state INTEGER, '
+            'message TEXT, created_at DATE, updated_at DATE, worker_id TEXT)'
+        )
+        conn.close()
+
+        db.init()
+        db.init()
+
+        conn = db.connect()
+        self.assertEqual(conn.execute('PRAGMA user_version').fetchone()[0], len(db.MIGRATIONS))
+        self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        indexes = [row['name'] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")]
+        self.assertIn('idx_calculations_calculation_id', indexes)
+        self.assertIn('idx_calculations_state', indexes)
+
+    def test_it_reuses_one_connection_per_thread_test(self):
+        self.assertIs(db.connect(), db.connect())
+
+        connections = []
+        thread = threading.Thread(target=lambda: connections.append(db.connect()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(connections[0], db.connect())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import deduplication
+
+
+class DeduplicationTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def test_the_hash_ignores_worker_settings_and_key_order_test(self):
+        content_1 = {'calculation_id': 'a', 'data': {'mf': {'mf': {'model_ws': '/modflow/a'}, 'dis': {'nlay': 1}}}}
+        content_2 = {'calculation_id': 'b', 'data': {'mf': {'dis': {'nlay': 1}, 'mf': {'model_ws': '.'}}}}
+        content_3 = {'calculation_id': 'a', 'data': {'mf': {'mf': {'model_ws': '/modflow/a'}, 'dis': {'nlay': 2}}}}
+
+        self.assertEqual(deduplication.content_hash(content_1), deduplication.content_hash(content_2))
+        self.assertNotEqual(deduplication.content_hash(content_1), deduplication.content_hash(content_3))
+        self.assertEqual(content_1['data']['mf']['mf']['model_ws'], '/modflow/a')
+
+    def test_the_hash_includes_the_warm_start_test(self):
+        content = {'data': {'mf': {'dis': {'nlay': 1}}}}
+        warm_start = {**content, 'warm_start_from': 'a'}
+
+        self.assertNotEqual(deduplication.content_hash(content), deduplication.content_hash(warm_start))
+        self.assertNotEqual(deduplication.content_hash(warm_start),
+                            deduplication.content_hash({**warm_start, 'warm_start_from': 'b'}))
+        self.assertNotEqual(deduplication.content_hash(warm_start),
+                            deduplication.content_hash({**warm_start, 'warm_start_heads': 'final'}))
+        self.assertEqual(deduplication.content_hash(warm_start),
+                         deduplication.content_hash({**warm_start, 'warm_start_heads': 'steady'}))
+        self.assertEqual(deduplication.content_hash(content),
+                         deduplication.content_hash({**content, 'warm_start_heads': 'final'}))
+
+    def test_it_publishes_and_unshares_results_test(self):
+        source = os.path.join(self._tmp_dir, 'source')
+        target = os.path.join(self._tmp_dir, 'target')
+        os.makedirs(source)
+        os.makedirs(target)
+        for file in ['configuration.json', 'mf.hds', 'state.log']:
+            with open(os.path.join(source, file), 'w') as f:
+                f.write(file)
+        with open(os.path.join(target, 'configuration.json'), 'w') as f:
+            f.write('target')
+
+        deduplication.publish_results(source, target)
+        self.assertEqual(sorted(os.listdir(target)), ['configuration.json', 'mf.hds', 'state.log'])
+        self.assertTrue(os.path.samefile(os.path.join(source, 'mf.hds'), os.path.join(target, 'mf.hds')))
+        with open(os.path.join(target, 'configuration.json')) as f:
+            self.assertEqual(f.read(), 'target')
+
+        deduplication.unshare_files(target)
+        self.assertEqual(os.listdir(target), ['configuration.json'])
+        self.assertEqual(sorted(os.listdir(source)), ['configuration.json', 'mf.hds', 'state.log'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import deduplication
+import ensemble
+import scheduler
+
+
+class EnsembleTest(unittest.TestCase):
+    base = {
+        'calculation_id': 'base',
+        'data': {
+            'mf': {
+                'packages': ['mf', 'dis', 'lpf', 'rch'],
+                'mf': {'modelname': 'mf'},
+                'dis': {'nlay': 1, 'nrow': 10, 'ncol': 10},
+                'lpf': {'hk': 10},
+                'rch': {'rech': {'0': 0.001}},
+            }
+        }
+    }
+
+    def test_it_samples_the_members_test(self):
+        self.assertEqual(ensemble.sample({'method': 'list', 'members': [{'lpf.hk': 2}, {'rch.rech': '0.5'}]}),
+                         [{'lpf.hk': 2.0}, {'rch.rech': 0.5}])
+
+        self.assertEqual(ensemble.sample({'method': 'grid', 'parameters': {'lpf.hk': [1, 2], 'rch.rech': [3, 4, 5]}}), [
+            {'lpf.hk': 1.0, 'rch.rech': 3.0}, {'lpf.hk': 1.0, 'rch.rech': 4.0}, {'lpf.hk': 1.0, 'rch.rech': 5.0},
+            {'lpf.hk': 2.0, 'rch.rech': 3.0}, {'lpf.hk': 2.0, 'rch.rech': 4.0}, {'lpf.hk': 2.0, 'rch.rech': 5.0},
+        ])
+
+        sampling = {'method': 'lhs', 'size': 10, 'seed': 3, 'parameters': {'lpf.hk': [0.5, 1.5], 'rch.rech': [1, 2]}}
+        members = ensemble.sample(sampling)
+        self.assertEqual(members, ensemble.sample(sampling))
+        self.assertEqual(len(members), 10)
+        # One member in each tenth of each parameter range
+        self.assertEqual(sorted(int((member['lpf.hk'] - 0.5) * 10) for member in members), list(range(10)))
+        self.assertEqual(sorted(int((member['rch.rech'] - 1) * 10) for member in members), list(range(10)))
+
+    def test_it_rejects_invalid_samplings_test(self):
+        for sampling in [
+            None,
+            {'method': 'sobol'},
+            {'method': 'list', 'members': [1, 2]},
+            {'method': 'grid', 'parameters': {}},
+            {'method': 'grid', 'parameters': {'lpf.hk': 2}},
+            {'method': 'lhs', 'parameters': {'lpf.hk': [1, 2, 3]}, 'size': 3},
+            {'method': 'lhs', 'parameters': {'lpf.hk': [1, 2]}},
+            {'method': 'grid', 'parameters': {'lpf.hk': list(range(ensemble.ENSEMBLE_MAX_MEMBERS + 1))}},
+        ]:
+            with self.assertRaises(ValueError):
+                ensemble.sample(sampling)
+
+        for name in ['hk', 'upw.hk', 'dis.top', 'lpf.']:
+            with self.assertRaises(ValueError):
+                ensemble.create_configuration(self.base, {'method': 'list', 'members': [{name: 1}]})
+
+    def test_it_stores_the_members_in_the_configuration_test(self):
+        content = ensemble.create_configuration(self.base, {'method': 'grid', 'parameters': {'lpf.hk': [1, 2]}})
+        self.assertEqual(ensemble.members(content), [{'lpf.hk': 1.0}, {'lpf.hk': 2.0}])
+        self.assertEqual(ensemble.members(self.base), [])
+        self.assertNotIn('ensemble', self.base)
+
+        # An ensemble is not identical to its base and costs one run per member
+        self.assertNotEqual(deduplication.content_hash(content), deduplication.content_hash(self.base))
+        self.assertEqual(scheduler.estimate_cost(content), 2 * scheduler.estimate_cost(self.base))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+import scheduler
+
+
+class SchedulerTest(unittest.TestCase):
+    def test_it_estimates_the_cost_from_the_discretization_test(self):
+        content = {'data': {'mf': {'dis': {'nlay': 2, 'nrow': 10, 'ncol': 20, 'nper': 3, 'nstp': [1, 10, 10]}}}}
+        self.assertEqual(scheduler.estimate_cost(content), 2 * 10 * 20 * 21)
+
+        content = {'data': {'mf': {'dis': {'nlay': 2, 'nrow': 10, 'ncol': 20, 'nper': 3, 'nstp': 2}}}}
+        self.assertEqual(scheduler.estimate_cost(content), 2 * 10 * 20 * 6)
+
+    def test_transport_models_increase_the_cost_test(self):
+        content = {'data': {'mf': {'dis': {'nlay': 1, 'nrow': 10, 'ncol': 10}}, 'mt': {}}}
+        self.assertEqual(scheduler.estimate_cost(content), 100 * (1 + scheduler.MODEL_COST_FACTORS['mt']))
+
+    def test_it_handles_incomplete_configurations_test(self):
+        self.assertEqual(scheduler.estimate_cost({}), 1.0)
+        self.assertIsNone(scheduler.estimate_cost({'data': {'mf': {'dis': {'nlay': 'abc'}}}}))
+        self.assertEqual(scheduler.get_priority({}), 0)
+        self.assertEqual(scheduler.get_priority({'priority': '5'}), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
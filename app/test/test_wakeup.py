@@ -0,0 +1,32 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import wakeup
+
+
+class WakeupChannelTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        self._fifo = os.path.join(self._tmp_dir, 'worker.fifo')
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def test_notify_without_listening_worker_does_not_fail_test(self):
+        self.assertFalse(wakeup.notify(self._fifo))
+
+    def test_it_wakes_up_a_waiting_worker_test(self):
+        channel = wakeup.open_channel(self._fifo)
+        try:
+            self.assertFalse(wakeup.wait(channel, 0.01))
+            self.assertTrue(wakeup.notify(self._fifo))
+            self.assertTrue(wakeup.wait(channel, 1))
+            self.assertFalse(wakeup.wait(channel, 0.01))
+        finally:
+            os.close(channel)
+
+
+if __name__ == "__main__":
+    unittest.main()
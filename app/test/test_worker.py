@@ -0,0 +1,406 @@
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import signal
+import sqlite3 as sql
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from time import monotonic, sleep
+
+import db
+import scheduler
+import worker
+from utils.FlopyAdapter.Calculation import IncrementalWriter
+
+
+class WorkerJobClaimTest(unittest.TestCase):
+    def setUp(self):
+        self._db_location = db.DB_LOCATION
+        self._tmp_dir = tempfile.mkdtemp()
+        db.DB_LOCATION = os.path.join(self._tmp_dir, 'modflow.db')
+        db.init()
+        self._modflow_folder = worker.MODFLOW_FOLDER
+        worker.MODFLOW_FOLDER = self._tmp_dir
+
+    def tearDown(self):
+        db.close()
+        db.DB_LOCATION = self._db_location
+        worker.MODFLOW_FOLDER = self._modflow_folder
+        shutil.rmtree(self._tmp_dir)
+
+    @staticmethod
+    def insert_calculations(number, cost=None, priority=0, author=None, state=0, created_at=None):
+        conn = sql.connect(db.DB_LOCATION)
+        for i in range(number):
+            calculation_id = 'calculation_{}'.format(i) if cost is None else 'calculation_{}_{}'.format(cost, i)
+            conn.execute(
+                'INSERT INTO calculations (calculation_id, state, priority, cost, author, created_at, updated_at) '
+                'VALUES ( ?, ?, ?, ?, ?, ?, ?)',
+                (calculation_id, state, priority, cost, author, created_at or datetime.now(), datetime.now())
+            )
+        conn.commit()
+        conn.close()
+
+    def test_it_claims_the_oldest_job_test(self):
+        self.insert_calculations(2)
+        row = worker.claim_next_calculation_job('worker_a')
+        self.assertEqual(row['calculation_id'], 'calculation_0')
+        row = worker.claim_next_calculation_job('worker_b')
+        self.assertEqual(row['calculation_id'], 'calculation_1')
+        self.assertIsNone(worker.claim_next_calculation_job('worker_c'))
+
+    def test_it_returns_the_claimed_job_and_not_an_older_claim_test(self):
+        self.insert_calculations(2)
+        # Left behind by a crashed worker with the same id
+        with db.connect() as conn:
+            conn.execute('UPDATE calculations SET state = ?, worker_id = ? WHERE calculation_id = ?',
+                         (100, 'worker_a', 'calculation_1'))
+
+        row = worker.claim_next_calculation_job('worker_a')
+        self.assertEqual(row['calculation_id'], 'calculation_0')
+        self.assertEqual(self.get_calculation(row['id'])['worker_id'], 'worker_a')
+        self.assertIsNone(worker.claim_next_calculation_job('worker_a'))
+
+    def test_it_claims_cheap_and_high_priority_jobs_first_test(self):
+        self.insert_calculations(1, cost=1e9)
+        self.insert_calculations(1, cost=1e3)
+        self.insert_calculations(1, cost=1e6, priority=1)
+        self.assertEqual(worker.claim_next_calculation_job('worker_a')['calculation_id'], 'calculation_1000000.0_0')
+        self.assertEqual(worker.claim_next_calculation_job('worker_b')['calculation_id'], 'calculation_1000.0_0')
+        self.assertEqual(worker.claim_next_calculation_job('worker_c')['calculation_id'], 'calculation_1000000000.0_0')
+
+    def test_the_cost_of_waiting_jobs_decays_exponentially_test(self):
+        # About a thousand times the cost of a new job, after waiting 9 and 12 halving periods
+        waited = timedelta(seconds=scheduler.SCHEDULER_AGING)
+        self.insert_calculations(1, cost=1e6, created_at=datetime.now() - 9 * waited)
+        self.insert_calculations(1, cost=1e3)
+        self.assertEqual(worker.claim_next_calculation_job('worker_a')['calculation_id'], 'calculation_1000.0_0')
+
+        self.insert_calculations(1, cost=1e3)
+        self.insert_calculations(1, cost=2e6, created_at=datetime.now() - 12 * waited)
+        self.assertEqual(worker.claim_next_calculation_job('worker_b')['calculation_id'], 'calculation_2000000.0_0')
+
+    def test_it_prefers_authors_with_fewer_running_jobs_test(self):
+        self.insert_calculations(1, cost=1e3, author='busy', state=100)
+        self.insert_calculations(1, cost=1e3, author='busy')
+        self.insert_calculations(1, cost=1e6, author='idle')
+        self.assertEqual(worker.claim_next_calculation_job('worker_a')['calculation_id'], 'calculation_1000000.0_0')
+
+    def test_concurrent_workers_never_claim_the_same_job_test(self):
+        self.insert_calculations(50)
+        claimed = []
+
+        def claim_all(worker_id):
+            while True:
+                row = worker.claim_next_calculation_job(worker_id)
+                if row is None:
+                    return
+                claimed.append(row['id'])
+                # Finish the job, so the next claim of this worker is unambiguous
+                conn = sql.connect(db.DB_LOCATION)
+                conn.execute('UPDATE calculations SET state = ? WHERE id = ?', (200, row['id']))
+                conn.commit()
+                conn.close()
+
+        threads = [threading.Thread(target=claim_all, args=('worker_{}'.format(i),)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(claimed), 50)
+        self.assertEqual(len(set(claimed)), 50)
+
+    @staticmethod
+    def expire_leases():
+        conn = db.connect()
+        with conn:
+            conn.execute('UPDATE calculations SET lease_expires_at = ?', (datetime.now() - timedelta(seconds=1),))
+
+    @staticmethod
+    def get_calculation(idx):
+        return db.connect().execute('SELECT * FROM calculations WHERE id = ?', (idx,)).fetchone()
+
+    def test_it_renews_the_lease_of_running_calculations_test(self):
+        self.insert_calculations(1)
+        row = worker.claim_next_calculation_job('worker_a')
+        self.expire_leases()
+        self.assertTrue(worker.renew_lease(row['id'], 'worker_a'))
+        self.assertFalse(worker.renew_lease(row['id'], 'worker_b'))
+        self.assertEqual(worker.reap_expired_leases(), 0)
+
+    def test_it_requeues_and_finally_fails_calculations_with_expired_leases_test(self):
+        self.insert_calculations(1)
+        os.makedirs(os.path.join(self._tmp_dir, 'calculation_0'))
+
+        for attempt in range(worker.WORKER_MAX_ATTEMPTS):
+            row = worker.claim_next_calculation_job('worker_{}'.format(attempt))
+            self.assertEqual(row['calculation_id'], 'calculation_0')
+            self.expire_leases()
+            self.assertEqual(worker.reap_expired_leases(), 1)
+
+        calculation = self.get_calculation(row['id'])
+        self.assertEqual(calculation['state'], 500)
+        self.assertEqual(calculation['attempts'], worker.WORKER_MAX_ATTEMPTS)
+        with open(os.path.join(self._tmp_dir, 'calculation_0', 'state.log')) as f:
+            self.assertEqual(f.read(), '500')
+
+    def test_stopping_workers_release_their_calculations_test(self):
+        self.insert_calculations(1)
+        row = worker.claim_next_calculation_job('worker_a')
+        worker.release_calculation_jobs('worker_a')
+
+        calculation = self.get_calculation(row['id'])
+        self.assertEqual(calculation['state'], 0)
+        self.assertEqual(calculation['attempts'], 0)
+        self.assertIsNone(calculation['worker_id'])
+
+    def test_it_saves_the_solver_convergence_with_the_timings_test(self):
+        self.insert_calculations(1)
+        target_directory = os.path.join(self._tmp_dir, 'calculation_0')
+        os.makedirs(target_directory)
+        with open(os.path.join(target_directory, 'mf.list'), 'w') as f:
+            f.write('\n'.join([
+                '    50 CALLS TO PCG ROUTINE FOR TIME STEP   1 IN STRESS PERIOD    1',
+                '  1500 TOTAL ITERATIONS',
+                ' FAILURE TO MEET SOLVER CONVERGENCE CRITERIA',
+                ' PERCENT DISCREPANCY =           1.50     PERCENT DISCREPANCY =           2.50',
+            ]))
+
+        data = {'mf': {'packages': ['mf', 'dis', 'bas6', 'PCG', 'oc']}}
+        convergence = worker.report_convergence(target_directory, data)
+        self.assertEqual(convergence['solver'], 'pcg')
+        self.assertEqual((convergence['outer'], convergence['inner']), (50, 1500))
+        self.assertEqual(convergence['failed_time_steps'], 1)
+        with open(os.path.join(target_directory, 'convergence.json')) as f:
+            self.assertEqual(json.load(f)['steps'][0]['percent_discrepancy'], {'cumulative': 1.5, 'rate': 2.5})
+
+        row = worker.claim_next_calculation_job('worker_a')
+        worker.save_timings(row['id'], {'mf': {'run_model': 1.0}}, convergence)
+        self.assertEqual(json.loads(self.get_calculation(row['id'])['convergence']), convergence)
+        self.assertIsNone(worker.report_convergence(self._tmp_dir, data))
+
+    def test_failed_calculations_are_only_set_to_500_while_running_test(self):
+        self.insert_calculations(2)
+        for calculation_id in ['calculation_0', 'calculation_1']:
+            os.makedirs(os.path.join(self._tmp_dir, calculation_id))
+            with open(os.path.join(self._tmp_dir, calculation_id, 'configuration.json'), 'w') as f:
+                # The adapter fails to create the discretization
+                json.dump({'calculation_id': calculation_id, 'version': '3.2.6', 'data': {
+                    'mf': {'packages': ['mf', 'dis'], 'mf': {}, 'dis': {'nlay': 'a'}}
+                }}, f)
+
+        running = worker.claim_next_calculation_job('worker_a')
+        cancelled = worker.claim_next_calculation_job('worker_a')
+        with db.connect() as conn:
+            conn.execute('UPDATE calculations SET state = ? WHERE id = ?', (499, cancelled['id']))
+
+        logger = logging.getLogger('test_worker')
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        for row in [running, cancelled]:
+            worker.calculate(row['id'], row['calculation_id'], logger)
+
+        calculation = self.get_calculation(running['id'])
+        self.assertEqual(calculation['state'], 500)
+        self.assertIn('TypeError', calculation['message'])
+        with open(os.path.join(self._tmp_dir, running['calculation_id'], 'state.log')) as f:
+            self.assertEqual(f.read(), '500')
+        self.assertEqual(self.get_calculation(cancelled['id'])['state'], 499)
+        with open(os.path.join(self._tmp_dir, cancelled['calculation_id'], 'state.log')) as f:
+            self.assertNotEqual(f.read(), '500')
+
+    def test_scratch_workspaces_only_write_changed_packages_test(self):
+        scratch_folder = worker.WORKER_SCRATCH_FOLDER
+        worker.WORKER_SCRATCH_FOLDER = os.path.join(self._tmp_dir, 'scratch')
+        self.addCleanup(setattr, worker, 'WORKER_SCRATCH_FOLDER', scratch_folder)
+
+        self.insert_calculations(1)
+        target_directory = os.path.join(self._tmp_dir, 'calculation_0')
+        os.makedirs(target_directory)
+        with open(os.path.join(os.path.dirname(__file__), '..', 'utils', 'FlopyAdapter', 'test', 'Calculation',
+                               'data', 'test_1.json')) as f:
+            content = {**json.load(f), 'calculation_id': 'calculation_0'}
+        with open(os.path.join(target_directory, 'configuration.json'), 'w') as f:
+            json.dump(content, f)
+
+        logger = logging.getLogger('test_worker')
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        row = worker.claim_next_calculation_job('worker_a')
+        worker.calculate(row['id'], row['calculation_id'], logger)
+        self.assertFalse(os.path.exists(os.path.join(worker.WORKER_SCRATCH_FOLDER, 'calculation_0')))
+        self.assertIn('mf.dis', IncrementalWriter.input_files(target_directory))
+
+        # Only the changed wel package is written again in the new workspace
+        for file in ['mf.dis', 'mf.wel']:
+            with open(os.path.join(target_directory, file), 'a') as f:
+                f.write('# previous run')
+        content['data']['mf']['wel']['stress_period_data']['0'][0][3] = -1234
+        with open(os.path.join(target_directory, 'configuration.json'), 'w') as f:
+            json.dump(content, f)
+        worker.calculate(row['id'], row['calculation_id'], logger)
+
+        with open(os.path.join(target_directory, 'mf.dis')) as f:
+            self.assertIn('# previous run', f.read())
+        with open(os.path.join(target_directory, 'mf.wel')) as f:
+            self.assertNotIn('# previous run', f.read())
+
+    def test_new_calculations_start_from_the_input_files_of_input_from_test(self):
+        self.insert_calculations(2)
+        with open(os.path.join(os.path.dirname(__file__), '..', 'utils', 'FlopyAdapter', 'test', 'Calculation',
+                               'data', 'test_1.json')) as f:
+            content = json.load(f)
+
+        # The resubmission only changes the wel package
+        resubmission = json.loads(json.dumps(content))
+        resubmission['data']['mf']['wel']['stress_period_data']['0'][0][3] = -1234
+        resubmission['input_from'] = 'calculation_0'
+
+        logger = logging.getLogger('test_worker')
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        for calculation_id, calculation in [('calculation_0', content), ('calculation_1', resubmission)]:
+            os.makedirs(os.path.join(self._tmp_dir, calculation_id))
+            with open(os.path.join(self._tmp_dir, calculation_id, 'configuration.json'), 'w') as f:
+                json.dump({**calculation, 'calculation_id': calculation_id}, f)
+            row = worker.claim_next_calculation_job('worker_a')
+            worker.calculate(row['id'], row['calculation_id'], logger)
+            with open(os.path.join(self._tmp_dir, calculation_id, 'mf.dis'), 'a') as f:
+                f.write('# written by {}'.format(calculation_id))
+
+        with open(os.path.join(self._tmp_dir, 'calculation_1', 'mf.dis')) as f:
+            self.assertIn('# written by calculation_0', f.read())
+        with open(os.path.join(self._tmp_dir, 'calculation_1', 'mf.wel')) as f:
+            self.assertIn('-1234', f.read())
+
+    def write_post_flow_calculation(self, calculation_id, mt_script, **settings):
+        """A Modflow model terminating normally and a Mt3d model running the given script"""
+        target_directory = os.path.join(self._tmp_dir, calculation_id)
+        os.makedirs(target_directory)
+        executables = {}
+        for model_type, script in [('mf', 'echo "Normal termination of simulation"'), ('mt', mt_script)]:
+            executables[model_type] = os.path.join(self._tmp_dir, model_type + '.sh')
+            with open(executables[model_type], 'w') as f:
+                f.write('#!/bin/sh\n' + script + '\n')
+            os.chmod(executables[model_type], 0o755)
+
+        with open(os.path.join(os.path.dirname(__file__), '..', 'utils', 'FlopyAdapter', 'test', 'Calculation',
+                               'data', 'test_1.json')) as f:
+            content = {**json.load(f), 'calculation_id': calculation_id, **settings}
+        content['data']['mf']['mf']['exe_name'] = executables['mf']
+        content['data']['mf']['packages'].append('lmt')
+        content['data']['mf']['lmt'] = {}
+        content['data']['mt'] = {
+            'packages': ['mt', 'btn', 'adv', 'dsp', 'gcg', 'ssm'], 'mt': {'exe_name': executables['mt']},
+            'btn': {}, 'adv': {}, 'dsp': {}, 'gcg': {}, 'ssm': {}
+        }
+        with open(os.path.join(target_directory, 'configuration.json'), 'w') as f:
+            json.dump(content, f)
+
+    def test_failed_post_flow_models_fail_the_calculation_test(self):
+        self.insert_calculations(1)
+        self.write_post_flow_calculation('calculation_0', 'echo "Error in the transport model"')
+
+        logger = logging.getLogger('test_worker')
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        row = worker.claim_next_calculation_job('worker_a')
+        with contextlib.redirect_stdout(io.StringIO()):
+            worker.calculate(row['id'], row['calculation_id'], logger)
+
+        calculation = self.get_calculation(row['id'])
+        self.assertEqual(calculation['state'], 400)
+        self.assertIn('Normal termination of simulation', calculation['message'])
+        self.assertIn('Error in the transport model', calculation['message'])
+        with open(os.path.join(self._tmp_dir, 'calculation_0', 'state.log')) as f:
+            self.assertEqual(f.read(), '400')
+
+    def test_post_flow_models_exceeding_the_time_limit_fail_the_calculation_test(self):
+        self.insert_calculations(1)
+        self.write_post_flow_calculation('calculation_0', 'sleep 30; echo "Program completed"', time_limit=3)
+
+        logger = logging.getLogger('test_worker')
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        row = worker.claim_next_calculation_job('worker_a')
+        with contextlib.redirect_stdout(io.StringIO()):
+            worker.calculate(row['id'], row['calculation_id'], logger)
+
+        calculation = self.get_calculation(row['id'])
+        self.assertEqual(calculation['state'], 400)
+        self.assertTrue(calculation['message'].startswith('Time limit exceeded.'))
+        with open(os.path.join(self._tmp_dir, 'calculation_0', 'state.log')) as f:
+            self.assertEqual(f.read(), '400')
+
+    @staticmethod
+    def is_running(pid):
+        try:
+            with open('/proc/{}/stat'.format(pid)) as f:
+                return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+        except FileNotFoundError:
+            return False
+
+    def test_stopping_workers_kill_their_models_before_releasing_the_calculations_test(self):
+        self.insert_calculations(1)
+        self.write_post_flow_calculation('calculation_0', 'echo $$ > mt.pid; sleep 30; echo "Program completed"')
+        pid_file = os.path.join(self._tmp_dir, 'calculation_0', 'mt.pid')
+        process_folder = os.path.join(self._tmp_dir, 'processes')
+        os.makedirs(process_folder)
+
+        def run_slot():
+            with contextlib.redirect_stdout(io.StringIO()):
+                worker.run_slot(process_folder)
+
+        slot = multiprocessing.get_context('fork').Process(target=run_slot)
+        slot.start()
+        start = monotonic()
+        while not (os.path.exists(pid_file) and os.path.getsize(pid_file) > 0) and monotonic() - start < 30:
+            sleep(0.1)
+        with open(pid_file) as f:
+            pid = int(f.read())
+        self.assertTrue(self.is_running(pid))
+
+        os.kill(slot.pid, signal.SIGTERM)
+        slot.join()
+        self.assertEqual(slot.exitcode, 0)
+        self.assertFalse(self.is_running(pid))
+        self.assertEqual(os.listdir(process_folder), [])
+
+        calculation = self.get_calculation(1)
+        self.assertEqual(calculation['state'], 0)
+        self.assertIsNone(calculation['worker_id'])
+
+    def test_it_moves_the_scratch_workspace_into_the_calculation_folder_test(self):
+        scratch_directory = os.path.join(self._tmp_dir, 'scratch', 'calculation')
+        target_directory = os.path.join(self._tmp_dir, 'calculation')
+        os.makedirs(os.path.join(scratch_directory, 'shared'))
+        os.makedirs(target_directory)
+        for file, content in [('mf.hds', 'new heads'), ('shared/mf.dis', 'dis')]:
+            with open(os.path.join(scratch_directory, file), 'w') as f:
+                f.write(content)
+        os.link(os.path.join(scratch_directory, 'shared', 'mf.dis'), os.path.join(scratch_directory, 'mf.dis'))
+
+        # Results of the previous run, shared with another calculation
+        with open(os.path.join(target_directory, 'mf.hds'), 'w') as f:
+            f.write('old heads')
+        os.link(os.path.join(target_directory, 'mf.hds'), os.path.join(self._tmp_dir, 'other.hds'))
+
+        worker.move_scratch_directory(scratch_directory, target_directory)
+        self.assertFalse(os.path.exists(scratch_directory))
+        with open(os.path.join(target_directory, 'mf.hds')) as f:
+            self.assertEqual(f.read(), 'new heads')
+        with open(os.path.join(self._tmp_dir, 'other.hds')) as f:
+            self.assertEqual(f.read(), 'old heads')
+        self.assertTrue(os.path.samefile(os.path.join(target_directory, 'mf.dis'),
+                                         os.path.join(target_directory, 'shared', 'mf.dis')))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Writes big arrays of a Modflow model as external binary files
+instead of formatted text inside the package files.
+"""
+import os
+
+from flopy.utils import Util2d, Util3d, Transient2d
+
+
+class BinaryArrays:
+    """
+    Switches the arrays with at least threshold values to external binary files,
+    uniform arrays to constants
+    """
+
+    def __init__(self, threshold):
+        self._threshold = int(threshold)
+
+    @staticmethod
+    def arrays(flopy_package):
+        for value in vars(flopy_package).values():
+            if isinstance(value, Util2d):
+                yield value
+            elif isinstance(value, Util3d):
+                yield from value.util_2ds
+            elif isinstance(value, Transient2d):
+                yield from value.transient_2ds.values()
+
+    def apply(self, model) -> int:
+        """Returns the number of arrays written as binary files"""
+        number_of_arrays = 0
+        for flopy_package in model.packagelist:
+            for array in self.arrays(flopy_package):
+                if array.how != 'internal' or array.format.binary or array.array.size < self._threshold:
+                    continue
+
+                values = array.array
+                if (values == values.flat[0]).all():
+                    # Uniform arrays fit in one CONSTANT record
+                    array.how = 'constant'
+                    continue
+
+                # The names of the arrays are only unique within the package
+                name = os.path.splitext(array.filename)[0]
+                array.ext_filename = '{}.{}.{}.bin'.format(model.name, flopy_package.name[0], name).lower()
+                array.format.binary = True
+                array.how = 'openclose' if array.format.array_free_format else 'external'
+                number_of_arrays += 1
+
+        return number_of_arrays
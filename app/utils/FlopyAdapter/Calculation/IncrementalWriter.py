@@ -0,0 +1,161 @@
+"""
+Writes only the input files of the packages whose content changed
+since the last write in the same workspace.
+
+The content hashes of the written packages are kept per model type
+in the file input_hashes.json in the workspace, with the input files of the models.
+"""
+import hashlib
+import json
+import os
+import pickle
+
+import flopy
+
+from .BinaryArrays import BinaryArrays
+
+
+class IncrementalWriter:
+    """Writes the changed packages of one model"""
+
+    hash_file = 'input_hashes.json'
+
+    # Key of the input files of the models in the hash file
+    files_key = 'files'
+
+    # Model-level packages, the files of all other packages depend on them
+    context_packages = ['mf', 'mt', 'mp', 'swt', 'dis', 'bas', 'bas6', 'btn']
+
+    # Packages written from the data of other packages, always written
+    dependent_packages = ['ssm', 'lkt', 'sft', 'uzt']
+
+    def __init__(self, model_ws, model_type, options=None):
+        self._filename = os.path.join(model_ws, self.hash_file)
+        self._model_type = model_type
+        # Write options changing the files of all packages
+        self._options = options
+
+    def read_hashes(self) -> dict:
+        return self.read_hash_file(self._filename)
+
+    @staticmethod
+    def read_hash_file(filename) -> dict:
+        try:
+            with open(filename) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def input_files(cls, model_ws) -> list:
+        """The input files of the models last written into the workspace, relative to it, with the hash file"""
+        files = cls.read_hash_file(os.path.join(model_ws, cls.hash_file)).get(cls.files_key, {})
+        return [cls.hash_file] + sorted(set(file for model_files in files.values() for file in model_files))
+
+    @staticmethod
+    def model_files(model) -> list:
+        """The input files of the packages of the model, relative to the workspace"""
+        files = [flopy_package.file_name[0] for flopy_package in model.packagelist]
+        for flopy_package in model.packagelist:
+            for array in BinaryArrays.arrays(flopy_package):
+                if array.format.binary:
+                    files.append(os.path.relpath(array.python_file_path, model.model_ws))
+        return files
+
+    def write_hashes(self, hashes):
+        with open(self._filename, 'w') as f:
+            json.dump(hashes, f)
+
+    @staticmethod
+    def without_workspace(content):
+        """The workspace of the model packages is not written into the files, the files can be moved"""
+        if isinstance(content, dict) and 'model_ws' in content:
+            return {key: value for key, value in content.items() if key != 'model_ws'}
+        return content
+
+    @staticmethod
+    def digest(content) -> str:
+        # Pickle serializes the arrays of big models much faster than json,
+        # a different key order can only cause an unnecessary write
+        return hashlib.sha256(pickle.dumps(content, protocol=4)).hexdigest()
+
+    def context(self, package_content) -> dict:
+        context = {
+            package: self.digest(self.without_workspace(package_content[package]))
+            for package in self.context_packages if package in package_content
+        }
+        context['packages'] = sorted(package for package in package_content if package != 'packages')
+        return context
+
+    def package_hashes(self, package_content, upstream_content=None) -> dict:
+        """
+        The hash of a package covers its own content and the content of the model-level packages,
+        for models depending on the Modflow model also the model-level packages of the Modflow model.
+        """
+        context = self.digest({
+            'flopy': flopy.__version__,
+            'options': self._options,
+            'model': self.context(package_content),
+            'upstream': self.context(upstream_content) if upstream_content else None
+        })
+        return {
+            package: self.digest([context, self.without_workspace(content)])
+            for package, content in package_content.items()
+        }
+
+    @staticmethod
+    def files_exist(model, flopy_packages) -> bool:
+        for flopy_package in flopy_packages:
+            if not os.path.isfile(os.path.join(model.model_ws, flopy_package.file_name[0])):
+                return False
+            for array in BinaryArrays.arrays(flopy_package):
+                if array.format.binary and not os.path.isfile(array.python_file_path):
+                    return False
+        return True
+
+    @staticmethod
+    def write_package(flopy_package):
+        try:
+            flopy_package.write_file(check=False)
+        except TypeError:
+            flopy_package.write_file()
+
+    def write(self, model, packages, package_content, upstream_content=None) -> list:
+        """
+        Writes the name file and the flopy packages of all changed packages.
+        packages maps the package names of the configuration to the flopy packages they created,
+        flopy packages of the model missing in this map are always written.
+        Returns the names of the written packages.
+        """
+        hashes = self.package_hashes(package_content, upstream_content)
+        stored_hashes = self.read_hashes()
+        previous_hashes = stored_hashes.pop(self._model_type, {})
+        stored_files = stored_hashes.setdefault(self.files_key, {})
+        stored_files.pop(self._model_type, None)
+
+        # The hashes are only valid again after all files are written
+        self.write_hashes(stored_hashes)
+
+        written = []
+        known = set()
+        for package, flopy_packages in packages.items():
+            known.update(id(flopy_package) for flopy_package in flopy_packages)
+            unchanged = package in hashes and previous_hashes.get(package) == hashes[package]
+            if unchanged and package not in self.dependent_packages and self.files_exist(model, flopy_packages):
+                continue
+
+            for flopy_package in flopy_packages:
+                self.write_package(flopy_package)
+            written.append(package)
+
+        for flopy_package in model.packagelist:
+            if id(flopy_package) not in known:
+                self.write_package(flopy_package)
+                written.append(flopy_package.name[0].lower())
+
+        model.write_name_file()
+
+        stored_hashes[self._model_type] = hashes
+        stored_files[self._model_type] = self.model_files(model)
+        self.write_hashes(stored_hashes)
+        return written
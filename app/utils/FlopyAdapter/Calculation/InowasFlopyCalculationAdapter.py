@@ -5,14 +5,20 @@ and the inowas-modflow-configuration format.
 Author: Ralf Junghanns
 EMail: ralf.junghanns@gmail.com
 """
-from ...FlopyAdapter import MfPackages as mf
-from ...FlopyAdapter import MtPackages as mt
-from ...FlopyAdapter import MpPackages as mp
-from ...FlopyAdapter import SwtPackages as swt
+import threading
+from contextlib import contextmanager
+from time import monotonic, perf_counter
+
+import numpy as np
 
 from ...FlopyAdapter import Read as read
 from ...FlopyAdapter import Statistics as stat
 
+from .BinaryArrays import BinaryArrays
+from .IncrementalWriter import IncrementalWriter
+from .ModelRunner import ModelRunner
+from .PackageRegistry import PackageRegistry
+
 
 class InowasFlopyCalculationAdapter:
     """The Flopy Class"""
@@ -25,6 +31,21 @@ class InowasFlopyCalculationAdapter:
     _report = ''
     _success = False
 
+    _deadline = None
+    _binary_array_threshold = None
+    _warm_start_heads = None
+    warm_start_cells = None
+    _cpu_time_limit = None
+    _cancel_event = None
+    cancelled = False
+    timed_out = False
+
+    _model_type = None
+    _timings = None
+
+    # Flopy packages created by each package of the current model
+    _packages = None
+
     mf_package_order = [
         'mf', 'dis', 'bas', 'bas6',
         'chd', 'evt', 'drn', 'fhb', 'ghb', 'hob', 'lak', 'rch', 'riv', 'wel',
@@ -51,7 +72,8 @@ class InowasFlopyCalculationAdapter:
         'mp', 'bas', 'sim'
     ]
 
-    def __init__(self, version, data, uuid):
+    def __init__(self, version, data, uuid, time_limit=None, cpu_time_limit=None, cancel_event=None,
+                 binary_array_threshold=None, warm_start_heads=None):
         self._mf_data = data.get('mf')
         self._mp_data = data.get('mp')
         self._mt_data = data.get('mt')
@@ -59,6 +81,17 @@ class InowasFlopyCalculationAdapter:
         self._version = version
         self._uuid = uuid
 
+        # The time limit (seconds) applies to all model runs of the calculation together
+        if time_limit:
+            self._deadline = monotonic() + time_limit
+        self._cpu_time_limit = cpu_time_limit
+        self._cancel_event = cancel_event
+        # Arrays of the Modflow model with at least this number of values are written as binary files
+        self._binary_array_threshold = binary_array_threshold
+        # Heads of a previous calculation (nlay, nrow, ncol) as initial heads of the Modflow model
+        self._warm_start_heads = warm_start_heads
+        self._timings = {}
+
         # Model calculation if Seawat is enabled
         if self._swt_data is not None:
             package_data = {
@@ -68,45 +101,121 @@ class InowasFlopyCalculationAdapter:
                 'packages': self._mf_data['packages'] + self._mt_data['packages'] + self._swt_data['packages']
             }
 
-            package_content = self.read_packages(package_data)
-            self.create_model(self.swt_package_order, package_content)
-            self.write_input_model(self._model)
-            self._success, report = self.run_model(self._model, model_type='swt')
+            self._model_type = 'swt'
+            with self.timer('read_packages'):
+                package_content = self.read_packages(package_data)
+            with self.timer('create_model'):
+                self.create_model(self.swt_package_order, package_content)
+            if self._warm_start_heads is not None:
+                with self.timer('warm_start'):
+                    self.warm_start(self._model, package_content)
+            with self.timer('write_input'):
+                self.write_input_model(self._model, package_content)
+            with self.timer('run_model'):
+                self._success, report = self.run_model(self._model, model_type='swt')
             self._report += report
 
             if 'hob' in self._mf_data['packages']:
                 print('Calculate hob-statistics and write to file %s.hob.stat' % uuid)
-                self.run_hob_statistics(self._model)
+                with self.timer('run_hob_statistics'):
+                    self.run_hob_statistics(self._model)
 
             return
 
         # Normal Modflow calculation
         if self._mf_data is not None:
-            package_content = self.read_packages(self._mf_data)
-            self.create_model(self.mf_package_order, package_content)
-            self.write_input_model(self._model)
-            self.success, report = self.run_model(self._model, model_type='mf')
+            self._model_type = 'mf'
+            with self.timer('read_packages'):
+                package_content = self.read_packages(self._mf_data)
+            with self.timer('create_model'):
+                self.create_model(self.mf_package_order, package_content)
+            if self._warm_start_heads is not None:
+                with self.timer('warm_start'):
+                    self.warm_start(self._model, package_content)
+            with self.timer('write_input'):
+                self.write_input_model(self._model, package_content)
+            with self.timer('run_model'):
+                self._success, report = self.run_model(self._model, model_type='mf')
             self._report += report
 
+            if self.aborted():
+                return
+
             if 'hob' in self._mf_data['packages']:
                 print('Calculate hob-statistics and write to file %s.hob.stat' % uuid)
-                self.run_hob_statistics(self._model)
+                with self.timer('run_hob_statistics'):
+                    self.run_hob_statistics(self._model)
+
+            # Mt3d and ModPath6 only depend on the Modflow results and run concurrently
+            post_flow_models = []
 
             # Mt3d calculation
             if self._mt_data is not None:
-                package_content = self.read_packages(self._mt_data)
-                self.create_model(self.mt_package_order, package_content)
-                self.write_input_model(self._model)
-                self._success, report = self.run_model(self._model, model_type='mt')
-                self._report += report
+                post_flow_models.append(self.prepare_model('mt', self._mt_data, self.mt_package_order))
 
             # ModPath6 calculation
             if self._mp_data is not None:
-                package_content = self.read_packages(self._mp_data)
-                self.create_model(self.mp_package_order, package_content)
-                self.write_input_model(self._model)
-                self._success, report = self.run_model(self._model, model_type='mp')
-                self._report += report
+                post_flow_models.append(self.prepare_model('mp', self._mp_data, self.mp_package_order))
+
+            if post_flow_models:
+                # The calculation only succeeds if all models terminate normally
+                post_flow_success = self.run_models_concurrently(post_flow_models)
+                self._success = self._success and post_flow_success
+
+    def prepare_model(self, model_type, data, package_order):
+        self._model_type = model_type
+        with self.timer('read_packages'):
+            package_content = self.read_packages(data)
+        with self.timer('create_model'):
+            self.create_model(package_order, package_content)
+        with self.timer('write_input'):
+            self.write_input_model(self._model, package_content)
+        return model_type, self._model
+
+    def run_models_concurrently(self, models) -> bool:
+        """
+        Runs the models in parallel processes and appends their reports in the given order.
+        Returns True if all models terminated normally.
+        """
+        results = {}
+        errors = []
+
+        def run(model_type, model):
+            try:
+                with self.timer('run_model', model_type):
+                    results[model_type] = self.run_model(model, model_type=model_type)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=model) for model in models]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        success = True
+        for model_type, model in models:
+            model_success, report = results[model_type]
+            success = success and model_success
+            self._report += report
+        return success
+
+    @contextmanager
+    def timer(self, stage, model_type=None):
+        """Adds the duration of the enclosed stage to the timings of the given or current model type"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            stages = self._timings.setdefault(model_type or self._model_type, {})
+            stages[stage] = stages.get(stage, 0.0) + perf_counter() - start
+
+    def timings(self):
+        """Durations in seconds by model type and stage, e.g. {'mf': {'run_model': 1.2, ...}}"""
+        return self._timings
 
     @staticmethod
     def read_packages(data):
@@ -117,28 +226,78 @@ class InowasFlopyCalculationAdapter:
         return package_content
 
     def create_model(self, package_order, package_content):
+        self._packages = {}
         for package in package_order:
             if package in package_content:
                 print('Create Flopy Package: %s' % package)
+                known = [id(flopy_package) for flopy_package in self.flopy_packages(self._model)]
                 self.create_package(package, package_content[package])
+                self._packages[package] = [
+                    flopy_package for flopy_package in self.flopy_packages(self._model) if id(flopy_package) not in known
+                ]
+
+    def warm_start(self, model, package_content):
+        """
+        Replaces the initial heads of the active, variable-head cells with the warm start heads,
+        dry and inactive cells of the previous calculation keep their initial heads.
+        """
+        bas = model.get_package('BAS6')
+        if bas is None:
+            return
+
+        strt = bas.strt.array
+        heads = np.asarray(self._warm_start_heads, dtype=strt.dtype)
+        if heads.shape != strt.shape:
+            print('Warm start heads with shape %s do not fit the model grid %s.' % (heads.shape, strt.shape))
+            return
+
+        cells = (bas.ibound.array > 0) & (heads > -999) & (np.abs(heads) < 1e29)
+        strt = np.where(cells, heads, strt)
+        bas.strt = strt
+        # The package content decides which input files are rewritten
+        name = 'bas' if 'bas' in package_content else 'bas6'
+        package_content[name] = {**package_content[name], 'strt': strt}
+        self.warm_start_cells = int(cells.sum())
+        print('Warm start heads in %d cells.' % self.warm_start_cells)
 
     @staticmethod
-    def write_input_model(model):
+    def flopy_packages(model):
+        return getattr(model, 'packagelist', None) or []
+
+    def write_input_model(self, model, package_content):
         print('Write input files.')
-        model.write_input()
+        options = None
+        if self._binary_array_threshold and self._model_type == 'mf':
+            BinaryArrays(self._binary_array_threshold).apply(model)
+            options = {'binary_array_threshold': self._binary_array_threshold}
 
-    @staticmethod
-    def run_model(model, model_type) -> (bool, str):
+        upstream_content = self._mf_data if self._model_type in ['mt', 'mp'] else None
+        writer = IncrementalWriter(model.model_ws, self._model_type, options)
+        written = writer.write(model, self._packages, package_content, upstream_content)
+        print('Written packages: %s' % ', '.join(written))
+
+    def run_model(self, model, model_type) -> (bool, str):
         normal_msg = 'normal termination'
         if model_type == 'mt':
             normal_msg = 'Program completed'
 
+        time_limit = None
+        if self._deadline is not None:
+            time_limit = max(self._deadline - monotonic(), 0.001)
+
         print('Run model type: %s.' % model_type)
         print('Model nam-file: %s.' % model.namefile)
         print('Model executable: %s.' % model.exe_name)
-        success, report = model.run_model(report=True, silent=True, normal_msg=normal_msg)
+        runner = ModelRunner(time_limit=time_limit, cpu_time_limit=self._cpu_time_limit,
+                             cancel_event=self._cancel_event)
+        success, report = runner.run(model.exe_name, model.namefile, model.model_ws, normal_msg=normal_msg)
+        self.cancelled = self.cancelled or runner.cancelled
+        self.timed_out = self.timed_out or runner.timed_out
         return success, '\n'.join(str(line) for line in report)
 
+    def aborted(self):
+        return self.cancelled or self.timed_out
+
     @staticmethod
     def run_hob_statistics(model):
         model_ws = model.model_ws
@@ -149,91 +308,12 @@ class InowasFlopyCalculationAdapter:
 
     def check_model(self, f):
         if self._model is not None:
-            self._model.check(f)
+            with self.timer('model_check'):
+                self._model.check(f)
 
     def create_package(self, name, content):
-
-        # Modflow packages
-        if name == 'mf':
-            self._model = mf.MfAdapter(content).get_package()
-        if name == 'dis':
-            mf.DisAdapter(content).get_package(self._model)
-        if name == 'drn':
-            mf.DrnAdapter(content).get_package(self._model)
-        if name == 'bas' or name == 'bas6':
-            mf.BasAdapter(content).get_package(self._model)
-        if name == 'lpf':
-            mf.LpfAdapter(content).get_package(self._model)
-        if name == 'upw':
-            mf.UpwAdapter(content).get_package(self._model)
-        if name == 'pcg':
-            mf.PcgAdapter(content).get_package(self._model)
-        if name == 'nwt':
-            mf.NwtAdapter(content).get_package(self._model)
-        if name == 'oc':
-            mf.OcAdapter(content).get_package(self._model)
-        if name == 'riv':
-            mf.RivAdapter(content).get_package(self._model)
-        if name == 'lak':
-            mf.LakAdapter(content).get_package(self._model)
-        if name == 'wel':
-            mf.WelAdapter(content).get_package(self._model)
-        if name == 'rch':
-            mf.RchAdapter(content).get_package(self._model)
-        if name == 'evt':
-            mf.EvtAdapter(content).get_package(self._model)
-        if name == 'chd':
-            mf.ChdAdapter(content).get_package(self._model)
-        if name == 'fhb':
-            mf.FhbAdapter(content).get_package(self._model)
-        if name == 'ghb':
-            mf.GhbAdapter(content).get_package(self._model)
-        if name == 'hob':
-            mf.HobAdapter(content).get_package(self._model)
-        if name == 'lmt':
-            mf.LmtAdapter(content).get_package(self._model)
-
-        # MT3D packages
-        if name == 'mt':
-            self._model = mt.MtAdapter(content).get_package(self._model)
-        if name == 'adv':
-            mt.AdvAdapter(content).get_package(self._model)
-        if name == 'btn':
-            mt.BtnAdapter(content).get_package(self._model)
-        if name == 'dsp':
-            mt.DspAdapter(content).get_package(self._model)
-        if name == 'gcg':
-            mt.GcgAdapter(content).get_package(self._model)
-        if name == 'lkt':
-            mt.LktAdapter(content).get_package(self._model)
-        if name == 'phc':
-            mt.PhcAdapter(content).get_package(self._model)
-        if name == 'rct':
-            mt.RctAdapter(content).get_package(self._model)
-        if name == 'sft':
-            mt.SftAdapter(content).get_package(self._model)
-        if name == 'ssm':
-            mt.SsmAdapter(content).get_package(self._model)
-        if name == 'tob':
-            mt.TobAdapter(content).get_package(self._model)
-        if name == 'uzt':
-            mt.UztAdapter(content).get_package(self._model)
-
-        # ModPath packages
-        if name == 'mp':
-            self._model = mp.MpAdapter(content).get_package()
-        if name == 'mpbas':
-            self._model = mp.BasAdapter(content).get_package(self._model)
-        if name == 'mpsim':
-            self._model = mp.SimAdapter(content).get_package(self._model)
-
-        # Seawat packages
-        if name == 'swt':
-            self._model = swt.SwtAdapter(content).get_package()
-        if name == 'vdf':
-            swt.VdfAdapter(content).get_package(self._model)
-        if name == 'vsc':
-            swt.VscAdapter(content).get_package(self._model)
+        if PackageRegistry.has(name):
+            self._model = PackageRegistry.create(name, content, self._model)
 
     def response(self):
         key = 'mf'
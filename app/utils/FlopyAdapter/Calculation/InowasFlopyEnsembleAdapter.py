@@ -0,0 +1,262 @@
+"""
+Runs an ensemble of parameter variants of one Modflow model.
+
+The members multiply package arrays of the base model, e.g. {"lpf.hk": 1.5, "rch.rech": 0.8}.
+The input files of the base model are written once into the folder shared/,
+each member in members/<n>/ only writes the input files of its varied packages
+and links the other files from the shared folder.
+The members run in a process pool, their hob-statistics are collected into one summary table.
+"""
+import csv
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ..Encoding import ArrayEncoding
+from .BinaryArrays import BinaryArrays
+from .InowasFlopyCalculationAdapter import InowasFlopyCalculationAdapter
+from .PackageRegistry import PackageRegistry
+
+# The ensemble of a member process, set by the initializer of the pool
+_ensemble = None
+
+
+def _init_member_process(ensemble):
+    global _ensemble
+    _ensemble = ensemble
+
+
+def _run_member(member, parameters):
+    return _ensemble.run_member(member, parameters)
+
+
+class InowasFlopyEnsembleAdapter(InowasFlopyCalculationAdapter):
+    """The Flopy Ensemble Class"""
+
+    shared_folder = 'shared'
+    members_folder = 'members'
+    summary_file = 'ensemble_summary'
+
+    # Packages the varied packages of a member are created with
+    context_packages = ['mf', 'dis', 'bas', 'bas6']
+
+    # Files of the shared folder which are not linked into the members
+    private_files = ['input_hashes.json', 'check.log']
+
+    statistics = ['n', 'rMax', 'rMin', 'rMean', 'absRMean', 'sse', 'rmse', 'nrmse', 'R', 'R2']
+
+    _members = None
+    _processes = None
+    _shared_ws = None
+    _members_ws = None
+    _rows = None
+
+    def __init__(self, version, data, uuid, members, processes=None, time_limit=None, cpu_time_limit=None,
+                 cancel_event=None, binary_array_threshold=None):
+        super().__init__(version, {}, uuid, time_limit=time_limit, cpu_time_limit=cpu_time_limit,
+                         cancel_event=cancel_event, binary_array_threshold=binary_array_threshold)
+        self._mf_data = data['mf']
+        self._members = members
+        self._processes = processes or os.cpu_count() or 1
+
+        model_ws = self._mf_data['mf']['model_ws']
+        self._shared_ws = os.path.join(model_ws, self.shared_folder)
+        self._members_ws = os.path.join(model_ws, self.members_folder)
+
+        with self.timer('write_shared_input', 'mf'):
+            os.makedirs(self._shared_ws, exist_ok=True)
+            shared_data = {**self._mf_data, 'mf': {**self._mf_data['mf'], 'model_ws': self._shared_ws}}
+            self.prepare_model('mf', shared_data, self.mf_package_order)
+
+        with self.timer('run_members', 'mf'):
+            self._rows = self.run_members()
+
+        succeeded = len([row for row in self._rows if row['success']])
+        self._success = succeeded == len(members)
+        self._report = 'Ensemble: {} of {} members terminated normally.\n{}'.format(
+            succeeded, len(members), self._report)
+
+        with self.timer('write_summary', 'mf'):
+            self.write_summary(model_ws, self._rows)
+
+    def run_members(self):
+        """Runs the members in a process pool, returns their summary rows in member order"""
+        # Not forked from the worker, a fork can inherit locks held by its heartbeat and database threads.
+        # The processes are forked from a single-threaded server and get the ensemble pickled.
+        context = multiprocessing.get_context('forkserver')
+        # Flopy is imported once by the server, not by every member process
+        context.set_forkserver_preload([__name__])
+        parent_cancel_event = self._cancel_event
+        finished = threading.Event()
+
+        # The member processes see the cancellation through an event of the pool context
+        self._cancel_event = context.Event()
+        if parent_cancel_event is not None:
+            if parent_cancel_event.is_set():
+                self._cancel_event.set()
+            threading.Thread(target=self.forward_cancellation, daemon=True,
+                             args=(parent_cancel_event, self._cancel_event, finished)).start()
+
+        rows = []
+        try:
+            processes = max(min(self._processes, len(self._members)), 1)
+            with ProcessPoolExecutor(max_workers=processes, mp_context=context,
+                                     initializer=_init_member_process, initargs=(self,)) as executor:
+                futures = [executor.submit(_run_member, member, parameters)
+                           for member, parameters in enumerate(self._members)]
+                for future in futures:
+                    row, report, timings, cancelled, timed_out = future.result()
+                    rows.append(row)
+                    self._report += 'Member {}: {}\n'.format(row['member'], report)
+                    self.cancelled = self.cancelled or cancelled
+                    self.timed_out = self.timed_out or timed_out
+                    stages = self._timings.setdefault('members', {})
+                    for stage, duration in timings.get('mf', {}).items():
+                        stages[stage] = stages.get(stage, 0.0) + duration
+        finally:
+            finished.set()
+            self._cancel_event = parent_cancel_event
+        return rows
+
+    def __getstate__(self):
+        # The member processes create their own models from the data of the ensemble
+        state = dict(vars(self))
+        state.pop('_model', None)
+        state.pop('_packages', None)
+        return state
+
+    @staticmethod
+    def forward_cancellation(source, target, finished):
+        while not finished.is_set():
+            if source.wait(0.5):
+                target.set()
+                return
+
+    def run_member(self, member, parameters):
+        """Runs one member in a process of the pool"""
+        row = {'member': member, 'parameters': parameters, 'success': False}
+        if self._cancel_event.is_set():
+            return row, 'cancelled', {}, True, False
+
+        self._timings = {}
+        report = ''
+        try:
+            member_ws = os.path.join(self._members_ws, str(member))
+            shutil.rmtree(member_ws, ignore_errors=True)
+            os.makedirs(member_ws)
+
+            with self.timer('create_model'):
+                data = self.apply_parameters(self._mf_data, parameters)
+                data['mf'] = {**data['mf'], 'model_ws': member_ws}
+                varied = self.varied_packages(parameters)
+                package_content = {
+                    name: content for name, content in self.read_packages(data).items()
+                    if name in self.context_packages or name in varied
+                }
+                self.create_model(self.mf_package_order, package_content)
+
+            with self.timer('write_input'):
+                self.write_member_input(self._model, varied)
+
+            with self.timer('run_model'):
+                row['success'], report = self.run_model(self._model, model_type='mf')
+
+            if 'hob' in data['packages'] and not self.aborted():
+                with self.timer('run_hob_statistics'):
+                    self.run_hob_statistics(self._model)
+                    row.update(self.read_statistics(member_ws, self._model.name))
+
+            report = report.strip().split('\n')[-1]
+        except Exception as e:
+            traceback.print_exc()
+            row['error'] = str(e)
+            report = 'error: {}'.format(e)
+
+        return row, report, self._timings, self.cancelled, self.timed_out
+
+    def write_member_input(self, model, varied):
+        """Writes the input files of the varied packages and links the other files from the shared folder"""
+        if self._binary_array_threshold:
+            BinaryArrays(self._binary_array_threshold).apply(model)
+
+        for name in varied:
+            for flopy_package in self._packages.get(name, []):
+                try:
+                    flopy_package.write_file(check=False)
+                except TypeError:
+                    flopy_package.write_file()
+
+        for file in os.listdir(self._shared_ws):
+            source = os.path.join(self._shared_ws, file)
+            target = os.path.join(model.model_ws, file)
+            if file in self.private_files or not os.path.isfile(source) or os.path.exists(target):
+                continue
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+
+    @staticmethod
+    def varied_packages(parameters):
+        return sorted({name.split('.', 1)[0] for name in parameters})
+
+    @classmethod
+    def apply_parameters(cls, data, parameters):
+        """Returns the model data with the arrays given by <package>.<key> multiplied by the parameter values"""
+        data = dict(data)
+        for name, factor in parameters.items():
+            package, key = name.split('.', 1)
+            value = data[package].get(key)
+            if value is None:
+                value = PackageRegistry.adapter(package).default().get(key)
+            if value is None:
+                raise ValueError('Parameter {} has no value to multiply.'.format(name))
+            data[package] = {**data[package], key: cls.multiply(value, factor)}
+        return data
+
+    @classmethod
+    def multiply(cls, value, factor):
+        value = ArrayEncoding.decode(value)
+        if isinstance(value, dict):
+            # Values by stress period, e.g. rch.rech
+            return {key: cls.multiply(item, factor) for key, item in value.items()}
+        if isinstance(value, list):
+            try:
+                return np.asarray(value, dtype=float) * factor
+            except (TypeError, ValueError):
+                # Layers given as constants and arrays
+                return [cls.multiply(item, factor) for item in value]
+        return value * factor
+
+    @classmethod
+    def read_statistics(cls, model_ws, name):
+        with open(os.path.join(model_ws, name + '.hob.stat')) as f:
+            statistics = json.load(f)
+        if 'error' in statistics:
+            return {'error': statistics['error']}
+        return {key: statistics.get(key) for key in cls.statistics}
+
+    def write_summary(self, model_ws, rows):
+        """Writes the summary table of the members as json and csv"""
+        with open(os.path.join(model_ws, self.summary_file + '.json'), 'w') as f:
+            json.dump(rows, f)
+
+        parameters = []
+        for row in rows:
+            parameters += [name for name in row['parameters'] if name not in parameters]
+        header = ['member'] + parameters + ['success'] + self.statistics + ['error']
+        with open(os.path.join(model_ws, self.summary_file + '.csv'), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for row in rows:
+                values = {**row, **row['parameters']}
+                writer.writerow([values.get(column, '') for column in header])
+
+    def summary(self):
+        return self._rows
@@ -9,7 +9,7 @@ import json
 import flopy.modflow
 import flopy.mt3d
 
-from ...FlopyAdapter import MfPackages, MtPackages
+from .PackageRegistry import PackageRegistry
 
 
 class InowasFlopyImportAdapter:
@@ -77,65 +77,26 @@ class InowasFlopyImportAdapter:
         except:
             self._report += "Could not save input to %s \n" % self.json_file
 
+    # Packages with a checked read_package of their adapter
+    mf_packages = ['MF', 'DIS', 'BAS', 'BAS6', 'LPF', 'PCG', 'OC', 'WEL', 'CHD', 'LMT', 'LMT6', 'NWT']
+    mt_packages = ['MT', 'ADV', 'BTN', 'DSP', 'GCG', 'SSM']
+
     def read_packages(self, name, data):
-        # Modflow packages
-        if name == 'MF':
-            data["mf"][name] = MfPackages.MfAdapter(data=None).read_package(self.mf_model)
-        if name == 'DIS':
-            data["mf"][name] = MfPackages.DisAdapter(data=None).read_package(self.mf_model.get_package(name))
-        if name == 'BAS' or name == 'BAS6':
-            data["mf"][name] = MfPackages.BasAdapter(data=None).read_package(self.mf_model.get_package(name))
-        if name == 'LPF':
-            data["mf"][name] = MfPackages.LpfAdapter(data=None).read_package(self.mf_model.get_package(name))
-        if name == 'PCG':
-            data["mf"][name] = MfPackages.PcgAdapter(data=None).read_package(self.mf_model.get_package(name))
+        if name in self.mf_packages:
+            data["mf"][name] = self.read_package(name, self.mf_model)
+        if name in self.mt_packages:
+            data["mt"][name] = self.read_package(name, self.mt_model)
+
+    @staticmethod
+    def read_package(name, model):
         if name == 'OC':
-            data["mf"][name] = {}
-            # data["mf"][name] = MfPackages.OcAdapter(data=None).read_package(self.mf_model.get_package(name))
-        if name == 'WEL':
-            data["mf"][name] = MfPackages.WelAdapter(data=None).read_package(self.mf_model.get_package(name))
-        if name == 'CHD':
-            data["mf"][name] = MfPackages.ChdAdapter(data=None).read_package(self.mf_model.get_package(name))
-        if name == 'LMT' or name == 'LMT6':
-            data["mf"][name] = MfPackages.LmtAdapter(data=None).read_package(self.mf_model.get_package(name))
-        if name == 'NWT':
-            data["mf"][name] = MfPackages.NwtAdapter(data=None).read_package(self.mf_model.get_package(name))
-        # Not checked:
-        # if name == 'UPW':
-        #     data["mf"][name] = MfPackages.UpwAdapter(data=None).read_package(self.mf_model.get_package(name))
-        # if name == 'RIV':
-        #     data["mf"][name] = MfPackages.RivAdapter(data=None).read_package(self.mf_model.get_package(name))
-        # if name == 'RCH':
-        #     data["mf"][name] = MfPackages.RchAdapter(data=None).read_package(self.mf_model.get_package(name))
-        # if name == 'GHB':
-        #     data["mf"][name] = MfPackages.GhbAdapter(data=None).read_package(self.mf_model.get_package(name))
+            # The OcAdapter can not read packages yet
+            return {}
 
-        # MT3D packages
-        if name == 'MT':
-            data["mt"][name] = MtPackages.MtAdapter(data=None).read_package(self.mt_model)
-        if name == 'ADV':
-            data["mt"][name] = MtPackages.AdvAdapter(data=None).read_package(self.mt_model.get_package(name))
-        if name == 'BTN':
-            data["mt"][name] = MtPackages.BtnAdapter(data=None).read_package(self.mt_model.get_package(name))
-        if name == 'DSP':
-            data["mt"][name] = MtPackages.DspAdapter(data=None).read_package(self.mt_model.get_package(name))
-        if name == 'GCG':
-            data["mt"][name] = MtPackages.GcgAdapter(data=None).read_package(self.mt_model.get_package(name))
-        if name == 'SSM':
-            data["mt"][name] = MtPackages.SsmAdapter(data=None).read_package(self.mt_model.get_package(name))
-        # Not checked:
-        # if name == 'LKT':
-        #     data["mt"][name] = MtPackages.LktAdapter(data=None).read_package(self.mt_model.get_package(name))
-        # if name == 'PHC':
-        #     data["mt"][name] = MtPackages.PhcAdapter(data=None).read_package(self.mt_model.get_package(name))
-        # if name == 'RCT':
-        #     data["mt"][name] = MtPackages.RctAdapter(data=None).read_package(self.mt_model.get_package(name))
-        # if name == 'SFT':
-        #     data["mt"][name] = MtPackages.SftAdapter(data=None).read_package(self.mt_model.get_package(name))
-        # if name == 'TOB':
-        #     data["mt"][name] = MtPackages.TobAdapter(data=None).read_package(self.mt_model.get_package(name))
-        # if name == 'UZT':
-        #     data["mt"][name] = MtPackages.UztAdapter(data=None).read_package(self.mt_model.get_package(name))
+        adapter = PackageRegistry.adapter(name)(data=None)
+        if PackageRegistry.kind(name) == PackageRegistry.PACKAGE:
+            return adapter.read_package(model.get_package(name))
+        return adapter.read_package(model)
 
     @property
     def response_message(self):
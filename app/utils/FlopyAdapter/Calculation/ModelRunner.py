@@ -0,0 +1,135 @@
+"""
+Runs model executables like flopy's run_model,
+but can stop them after a wall-clock or CPU time limit or on cancellation.
+"""
+import os
+import signal
+import sys
+import threading
+from subprocess import Popen, PIPE, STDOUT
+from time import monotonic
+
+from flopy.mbase import which
+
+
+class ModelRunner:
+    """Runs one model executable in its own process group"""
+
+    _watch_interval = 0.2
+
+    # Environment variable with the folder the process groups of the running models are registered in,
+    # one empty file per group. The worker sets it per slot, the processes of an ensemble inherit it.
+    process_folder_variable = 'MODEL_PROCESS_FOLDER'
+
+    def __init__(self, time_limit=None, cpu_time_limit=None, cancel_event=None):
+        self._time_limit = time_limit
+        self._cpu_time_limit = cpu_time_limit
+        self._cancel_event = cancel_event
+        self.cancelled = False
+        self.timed_out = False
+
+    # Sets the CPU time limit and replaces itself with the model executable. The limit is not set with
+    # preexec_fn, which can deadlock the child when the models of a calculation are started by several threads.
+    _cpu_time_launcher = (
+        'import os, resource, sys; '
+        'limit = int(sys.argv[1]); '
+        'resource.setrlimit(resource.RLIMIT_CPU, (limit, limit + 1)); '
+        'os.execvp(sys.argv[2], sys.argv[2:])'
+    )
+
+    def command(self, argv) -> list:
+        if not self._cpu_time_limit:
+            return argv
+        return [sys.executable, '-c', self._cpu_time_launcher, str(int(self._cpu_time_limit))] + argv
+
+    @classmethod
+    def register(cls, pgid):
+        folder = os.environ.get(cls.process_folder_variable)
+        if folder:
+            open(os.path.join(folder, str(pgid)), 'w').close()
+
+    @classmethod
+    def unregister(cls, pgid):
+        folder = os.environ.get(cls.process_folder_variable)
+        if folder:
+            try:
+                os.remove(os.path.join(folder, str(pgid)))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def kill_registered(folder) -> int:
+        """Kills the process groups registered in the folder, e.g. of a worker which stopped"""
+        killed = 0
+        for name in os.listdir(folder) if os.path.isdir(folder) else []:
+            if not name.isdigit():
+                continue
+            try:
+                os.killpg(int(name), signal.SIGKILL)
+                killed += 1
+            except (ProcessLookupError, PermissionError):
+                pass
+            try:
+                os.remove(os.path.join(folder, name))
+            except FileNotFoundError:
+                pass
+        return killed
+
+    def watch(self, proc, finished):
+        deadline = monotonic() + self._time_limit if self._time_limit else None
+        while not finished.wait(self._watch_interval):
+            if self._cancel_event is not None and self._cancel_event.is_set():
+                self.cancelled = True
+            elif deadline is not None and monotonic() > deadline:
+                self.timed_out = True
+            else:
+                continue
+
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            return
+
+    def run(self, exe_name, namefile, model_ws, normal_msg='normal termination') -> (bool, list):
+        if which(exe_name) is None:
+            raise Exception('The program {} does not exist or is not executable.'.format(exe_name))
+
+        argv = [exe_name]
+        if namefile is not None:
+            argv.append(namefile)
+
+        proc = Popen(self.command(argv), stdout=PIPE, stderr=STDOUT, cwd=model_ws, start_new_session=True)
+        self.register(proc.pid)
+
+        finished = threading.Event()
+        watchdog = threading.Thread(target=self.watch, args=(proc, finished), daemon=True)
+        watchdog.start()
+
+        success = False
+        report = []
+        for line in iter(proc.stdout.readline, b''):
+            line = line.decode('utf-8', errors='replace').rstrip('\r\n')
+            if normal_msg.lower() in line.lower():
+                success = True
+            report.append(line)
+
+        proc.wait()
+        self.unregister(proc.pid)
+        finished.set()
+        watchdog.join()
+        proc.stdout.close()
+
+        if self.cancelled:
+            report.append('Model run cancelled.')
+            return False, report
+
+        if self.timed_out:
+            report.append('Model run aborted after the time limit of {} seconds.'.format(self._time_limit))
+            return False, report
+
+        if proc.returncode in [-signal.SIGXCPU, -signal.SIGKILL] and self._cpu_time_limit:
+            report.append('Model run aborted after the CPU time limit of {} seconds.'.format(self._cpu_time_limit))
+            return False, report
+
+        return success, report
@@ -0,0 +1,106 @@
+"""
+Registry of the package adapters by the package names of the configuration.
+The adapters are imported on first use, so a Modflow calculation
+does not import the adapters of MT3D, Modpath or Seawat.
+"""
+import importlib
+
+
+class PackageRegistry:
+    """Maps the package names to their adapters"""
+
+    # The adapter adds a package to the current model
+    PACKAGE = 'package'
+    # The adapter creates a new model
+    MODEL = 'model'
+    # The adapter creates a new model from the current model
+    MODEL_FROM_MODEL = 'model_from_model'
+
+    # name: (model type, adapter, kind)
+    packages = {
+        # Modflow packages
+        'mf': ('mf', 'MfAdapter', MODEL),
+        'dis': ('mf', 'DisAdapter', PACKAGE),
+        'drn': ('mf', 'DrnAdapter', PACKAGE),
+        'bas': ('mf', 'BasAdapter', PACKAGE),
+        'bas6': ('mf', 'BasAdapter', PACKAGE),
+        'lpf': ('mf', 'LpfAdapter', PACKAGE),
+        'upw': ('mf', 'UpwAdapter', PACKAGE),
+        'pcg': ('mf', 'PcgAdapter', PACKAGE),
+        'nwt': ('mf', 'NwtAdapter', PACKAGE),
+        'oc': ('mf', 'OcAdapter', PACKAGE),
+        'riv': ('mf', 'RivAdapter', PACKAGE),
+        'lak': ('mf', 'LakAdapter', PACKAGE),
+        'wel': ('mf', 'WelAdapter', PACKAGE),
+        'rch': ('mf', 'RchAdapter', PACKAGE),
+        'evt': ('mf', 'EvtAdapter', PACKAGE),
+        'chd': ('mf', 'ChdAdapter', PACKAGE),
+        'fhb': ('mf', 'FhbAdapter', PACKAGE),
+        'ghb': ('mf', 'GhbAdapter', PACKAGE),
+        'hob': ('mf', 'HobAdapter', PACKAGE),
+        'lmt': ('mf', 'LmtAdapter', PACKAGE),
+        'lmt6': ('mf', 'LmtAdapter', PACKAGE),
+
+        # MT3D packages
+        'mt': ('mt', 'MtAdapter', MODEL_FROM_MODEL),
+        'adv': ('mt', 'AdvAdapter', PACKAGE),
+        'btn': ('mt', 'BtnAdapter', PACKAGE),
+        'dsp': ('mt', 'DspAdapter', PACKAGE),
+        'gcg': ('mt', 'GcgAdapter', PACKAGE),
+        'lkt': ('mt', 'LktAdapter', PACKAGE),
+        'phc': ('mt', 'PhcAdapter', PACKAGE),
+        'rct': ('mt', 'RctAdapter', PACKAGE),
+        'sft': ('mt', 'SftAdapter', PACKAGE),
+        'ssm': ('mt', 'SsmAdapter', PACKAGE),
+        'tob': ('mt', 'TobAdapter', PACKAGE),
+        'uzt': ('mt', 'UztAdapter', PACKAGE),
+
+        # ModPath packages
+        'mp': ('mp', 'MpAdapter', MODEL),
+        'mpbas': ('mp', 'BasAdapter', MODEL_FROM_MODEL),
+        'mpsim': ('mp', 'SimAdapter', MODEL_FROM_MODEL),
+
+        # Seawat packages
+        'swt': ('swt', 'SwtAdapter', MODEL),
+        'vdf': ('swt', 'VdfAdapter', PACKAGE),
+        'vsc': ('swt', 'VscAdapter', PACKAGE),
+    }
+
+    adapter_packages = {
+        'mf': 'MfPackages',
+        'mt': 'MtPackages',
+        'mp': 'MpPackages',
+        'swt': 'SwtPackages',
+    }
+
+    @classmethod
+    def has(cls, name) -> bool:
+        return name.lower() in cls.packages
+
+    @classmethod
+    def kind(cls, name) -> str:
+        return cls.packages[name.lower()][2]
+
+    @classmethod
+    def adapter(cls, name):
+        """The adapter class of the package, imported on first use"""
+        model_type, adapter, _ = cls.packages[name.lower()]
+        adapter_package = importlib.import_module(
+            '..' + cls.adapter_packages[model_type], __package__
+        )
+        return getattr(adapter_package, adapter)
+
+    @classmethod
+    def create(cls, name, content, model):
+        """
+        Creates the package with the given content,
+        returns the new model for adapters creating a model, else the given model.
+        """
+        adapter = cls.adapter(name)(content)
+        kind = cls.kind(name)
+        if kind == cls.MODEL:
+            return adapter.get_package()
+        if kind == cls.MODEL_FROM_MODEL:
+            return adapter.get_package(model)
+        adapter.get_package(model)
+        return model
@@ -1,2 +1,7 @@
 from .InowasFlopyCalculationAdapter import InowasFlopyCalculationAdapter
 from .InowasFlopyImportAdapter import InowasFlopyImportAdapter
+from .IncrementalWriter import IncrementalWriter
+from .BinaryArrays import BinaryArrays
+from .ModelRunner import ModelRunner
+from .PackageRegistry import PackageRegistry
+from .InowasFlopyEnsembleAdapter import InowasFlopyEnsembleAdapter
@@ -0,0 +1,166 @@
+"""
+Compact encodings of the arrays in the package data.
+
+Instead of nested lists, arrays can be given as
+    {"encoding": "constant", "value": 1.5, "shape": [1, 100, 100]}  (shape is optional)
+    {"encoding": "base64", "dtype": "float32", "shape": [100, 100], "data": "<base64, little endian>"}
+    {"encoding": "npy", "file": "<name of an uploaded .npy file>"}
+Encoded arrays are decoded to numpy arrays without building python lists.
+"""
+import base64
+import os
+
+import numpy as np
+
+
+class ArrayEncoding:
+    """Decodes the compact array encodings of the package data"""
+
+    key = 'encoding'
+
+    dtypes = {
+        'float32': '<f4',
+        'float64': '<f8',
+        'int32': '<i4',
+    }
+
+    # Folder of the uploaded .npy files, set by the service
+    npy_folder = None
+
+    @classmethod
+    def is_encoded(cls, value) -> bool:
+        return isinstance(value, dict) and cls.key in value
+
+    @classmethod
+    def is_encoded_list(cls, value) -> bool:
+        """Lists of arrays, e.g. one per layer, with encoded arrays"""
+        return isinstance(value, list) and len(value) > 0 and cls.is_encoded(value[0])
+
+    @classmethod
+    def is_encoded_dict(cls, value) -> bool:
+        """Dicts of arrays, e.g. one per stress period, with encoded arrays"""
+        return isinstance(value, dict) and not cls.is_encoded(value) and any(
+            cls.is_encoded(item) or cls.is_encoded_list(item) for item in value.values())
+
+    @classmethod
+    def npy_path(cls, file) -> str:
+        # Only files in the npy folder can be referenced
+        filename = os.path.basename(file)
+        if cls.npy_folder is not None:
+            return os.path.join(cls.npy_folder, filename)
+        return filename
+
+    @classmethod
+    def dtype(cls, value) -> np.dtype:
+        if value.get('dtype', 'float32') not in cls.dtypes:
+            raise ValueError('Unsupported dtype: {}, supported are: {}.'.format(
+                value.get('dtype'), ', '.join(cls.dtypes)))
+        return np.dtype(cls.dtypes[value.get('dtype', 'float32')])
+
+    @classmethod
+    def decode_one(cls, value):
+        encoding = value[cls.key]
+
+        if encoding == 'constant':
+            if value.get('shape') is None:
+                return value['value']
+            return np.full(tuple(value['shape']), value['value'])
+
+        if encoding == 'base64':
+            array = np.frombuffer(base64.b64decode(value['data']), dtype=cls.dtype(value))
+            return array.reshape(tuple(value['shape']))
+
+        if encoding == 'npy':
+            return np.load(cls.npy_path(value['file']), allow_pickle=False)
+
+        raise ValueError('Unknown array encoding: {}.'.format(encoding))
+
+    @classmethod
+    def first_value(cls, value):
+        """The first value of an encoded array, the array is checked but not decoded"""
+        encoding = value[cls.key]
+
+        if encoding == 'constant':
+            return value['value']
+
+        if encoding == 'base64':
+            dtype = cls.dtype(value)
+            data = value['data']
+            # Every 4 base64 characters hold 3 bytes
+            size = len(data) // 4 * 3 - data[-2:].count('=')
+            if len(data) % 4 != 0 or size != dtype.itemsize * int(np.prod(value['shape'])):
+                raise ValueError('The base64 data of {} bytes does not match the shape {} of {}.'.format(
+                    size, value['shape'], value.get('dtype', 'float32')))
+            if size == 0:
+                return 0
+            return np.frombuffer(base64.b64decode(data[:4 * -(-dtype.itemsize // 3)])[:dtype.itemsize],
+                                 dtype=dtype)[0].item()
+
+        if encoding == 'npy':
+            array = np.load(cls.npy_path(value['file']), mmap_mode='r', allow_pickle=False)
+            return array.flat[0].item() if array.size > 0 else 0
+
+        raise ValueError('Unknown array encoding: {}.'.format(encoding))
+
+    @classmethod
+    def decode(cls, value):
+        """
+        Decodes an encoded array, a list of encoded arrays (e.g. one per layer)
+        or a dict of encoded arrays (e.g. one per stress period), all other values are returned unchanged.
+        """
+        if cls.is_encoded(value):
+            return cls.decode_one(value)
+
+        if cls.is_encoded_list(value):
+            return [cls.decode_one(item) if cls.is_encoded(item) else item for item in value]
+
+        if cls.is_encoded_dict(value):
+            return {key: cls.decode(item) for key, item in value.items()}
+
+        return value
+
+    @classmethod
+    def decode_to_list(cls, value):
+        """Decodes encoded arrays to (nested) lists, e.g. for json responses"""
+        if cls.is_encoded_dict(value):
+            return {key: cls.decode_to_list(item) for key, item in value.items()}
+
+        value = cls.decode(value)
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, list):
+            return [item.tolist() if isinstance(item, np.ndarray) else item for item in value]
+        return value
+
+    @classmethod
+    def placeholder(cls, value):
+        """
+        The first value of an encoded array, lists and dicts of encoded arrays get one placeholder per item.
+        The arrays are not decoded.
+        """
+        if cls.is_encoded(value):
+            return cls.first_value(value)
+
+        if cls.is_encoded_list(value):
+            return [cls.placeholder(item) for item in value]
+
+        if cls.is_encoded_dict(value):
+            return {key: cls.placeholder(item) for key, item in value.items()}
+
+        return value
+
+    @classmethod
+    def with_placeholders(cls, model_data):
+        """
+        Returns a copy of the model data with the encoded arrays replaced by their first value,
+        e.g. to validate the model data against the json schema.
+        """
+        if not isinstance(model_data, dict):
+            return model_data
+
+        result = {}
+        for package, package_data in model_data.items():
+            if isinstance(package_data, dict):
+                package_data = {key: cls.placeholder(value) for key, value in package_data.items()}
+            result[package] = package_data
+        return result
@@ -0,0 +1 @@
+from .ArrayEncoding import ArrayEncoding
@@ -1,5 +1,7 @@
 import flopy.modflow as mf
 
+from ..Encoding import ArrayEncoding
+
 
 class DrnAdapter:
     _data = None
@@ -28,7 +30,7 @@ class DrnAdapter:
                 default[key] = self.to_dict(self._data[key])
                 continue
 
-            default[key] = self._data[key]
+            default[key] = ArrayEncoding.decode(self._data[key])
         return default
 
     def to_dict(self, data):
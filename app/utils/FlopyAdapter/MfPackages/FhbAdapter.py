@@ -1,5 +1,7 @@
 import flopy.modflow as mf
 
+from ..Encoding import ArrayEncoding
+
 
 class FhbAdapter:
     _data = None
@@ -24,7 +26,7 @@ class FhbAdapter:
     def merge(self):
         default = self.default()
         for key in self._data:
-            default[key] = self._data[key]
+            default[key] = ArrayEncoding.decode(self._data[key])
 
         return default
 
@@ -1,6 +1,8 @@
 import flopy.modflow as mf
 import numpy as np
 
+from ..Encoding import ArrayEncoding
+
 
 class LakAdapter:
     _data = None
@@ -36,14 +38,14 @@ class LakAdapter:
 
             if key == 'lakarr' or key == 'bdlknc':
                 if self._data[key] is not None:
-                    default[key] = np.array(self._data[key])
+                    default[key] = np.array(ArrayEncoding.decode(self._data[key]))
                 continue
 
             if key == 'stages' and self._data[key] is not None:
                 default[key] = np.array(self._data[key])
                 continue
 
-            default[key] = self._data[key]
+            default[key] = ArrayEncoding.decode(self._data[key])
         return default
 
     def to_dict(self, data):
@@ -1,5 +1,7 @@
 import flopy.modflow as mf
 
+from ..Encoding import ArrayEncoding
+
 
 class OcAdapter:
     _data = None
@@ -24,7 +26,7 @@ class OcAdapter:
     def merge(self):
         default = self.default()
         for key in self._data:
-            default[key] = self._data[key]
+            default[key] = ArrayEncoding.decode(self._data[key])
 
         if 'stress_period_data' in self._data:
             default['stress_period_data'] = self.get_stress_period_data(self._data['stress_period_data'])
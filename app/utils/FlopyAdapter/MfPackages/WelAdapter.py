@@ -2,6 +2,8 @@ import flopy.modflow as mf
 import geojson
 import numpy as np
 
+from ..Encoding import ArrayEncoding
+
 
 class WelAdapter:
     _data = None
@@ -30,7 +32,7 @@ class WelAdapter:
                 default[key] = self.to_dict(self._data[key])
                 continue
 
-            default[key] = self._data[key]
+            default[key] = ArrayEncoding.decode(self._data[key])
         return default
 
     def to_dict(self, data):
@@ -1,19 +1,35 @@
-from .BasAdapter import BasAdapter
-from .ChdAdapter import ChdAdapter
-from .DisAdapter import DisAdapter
-from .DrnAdapter import DrnAdapter
-from .EvtAdapter import EvtAdapter
-from .FhbAdapter import FhbAdapter
-from .GhbAdapter import GhbAdapter
-from .HobAdapter import HobAdapter
-from .LakAdapter import LakAdapter
-from .LmtAdapter import LmtAdapter
-from .LpfAdapter import LpfAdapter
-from .MfAdapter import MfAdapter
-from .NwtAdapter import NwtAdapter
-from .OcAdapter import OcAdapter
-from .PcgAdapter import PcgAdapter
-from .RchAdapter import RchAdapter
-from .RivAdapter import RivAdapter
-from .UpwAdapter import UpwAdapter
-from .WelAdapter import WelAdapter
+"""
+The adapters are imported on first use.
+"""
+import importlib
+
+__all__ = [
+    'BasAdapter',
+    'ChdAdapter',
+    'DisAdapter',
+    'DrnAdapter',
+    'EvtAdapter',
+    'FhbAdapter',
+    'GhbAdapter',
+    'HobAdapter',
+    'LakAdapter',
+    'LmtAdapter',
+    'LpfAdapter',
+    'MfAdapter',
+    'NwtAdapter',
+    'OcAdapter',
+    'PcgAdapter',
+    'RchAdapter',
+    'RivAdapter',
+    'UpwAdapter',
+    'WelAdapter',
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    # Importing the submodule binds the module to the name, rebind it to the class
+    value = getattr(importlib.import_module('.' + name, __name__), name)
+    globals()[name] = value
+    return value
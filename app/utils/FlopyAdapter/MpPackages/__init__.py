@@ -1,3 +1,19 @@
-from .BasAdapter import BasAdapter
-from .MpAdapter import MpAdapter
-from .SimAdapter import SimAdapter
+"""
+The adapters are imported on first use.
+"""
+import importlib
+
+__all__ = [
+    'BasAdapter',
+    'MpAdapter',
+    'SimAdapter',
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    # Importing the submodule binds the module to the name, rebind it to the class
+    value = getattr(importlib.import_module('.' + name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,7 @@
 import flopy.mt3d as mt
 
+from ..Encoding import ArrayEncoding
+
 
 class AdvAdapter:
     _data = None
@@ -25,7 +27,7 @@ class AdvAdapter:
         default = self.default()
         for key in self._data:
             if not key.startswith('_'):
-                default[key] = self._data[key]
+                default[key] = ArrayEncoding.decode(self._data[key])
         return default
 
     def get_package(self, _mt):
@@ -1,6 +1,8 @@
 import numpy as np
 import flopy.mt3d as mt
 
+from ..Encoding import ArrayEncoding
+
 
 class BtnAdapter:
     _data = None
@@ -26,7 +28,7 @@ class BtnAdapter:
         default = self.default()
         for key in self._data:
             if not key.startswith('_'):
-                default[key] = self._data[key]
+                default[key] = ArrayEncoding.decode(self._data[key])
         return default
 
     def get_package(self, _mt):
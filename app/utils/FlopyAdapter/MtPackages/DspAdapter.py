@@ -1,6 +1,8 @@
 import numpy as np
 import flopy.mt3d as mt
 
+from ..Encoding import ArrayEncoding
+
 
 class DspAdapter:
     _data = None
@@ -25,7 +27,7 @@ class DspAdapter:
     def merge(self):
         default = self.default()
         for key in self._data:
-            default[key] = self._data[key]
+            default[key] = ArrayEncoding.decode(self._data[key])
         return default
 
     def get_package(self, _mt):
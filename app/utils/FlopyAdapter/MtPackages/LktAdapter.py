@@ -1,5 +1,7 @@
 import flopy.mt3d as mt
 
+from ..Encoding import ArrayEncoding
+
 
 class LktAdapter:
     _data = None
@@ -24,7 +26,7 @@ class LktAdapter:
     def merge(self):
         default = self.default()
         for key in self._data:
-            default[key] = self._data[key]
+            default[key] = ArrayEncoding.decode(self._data[key])
         return default
 
     def get_package(self, _mt):
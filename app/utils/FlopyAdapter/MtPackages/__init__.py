@@ -1,12 +1,28 @@
-from .AdvAdapter import AdvAdapter
-from .BtnAdapter import BtnAdapter
-from .DspAdapter import DspAdapter
-from .GcgAdapter import GcgAdapter
-from .LktAdapter import LktAdapter
-from .MtAdapter import MtAdapter
-from .PhcAdapter import PhcAdapter
-from .RctAdapter import RctAdapter
-from .SftAdapter import SftAdapter
-from .SsmAdapter import SsmAdapter
-from .TobAdapter import TobAdapter
-from .UztAdapter import UztAdapter
+"""
+The adapters are imported on first use.
+"""
+import importlib
+
+__all__ = [
+    'AdvAdapter',
+    'BtnAdapter',
+    'DspAdapter',
+    'GcgAdapter',
+    'LktAdapter',
+    'MtAdapter',
+    'PhcAdapter',
+    'RctAdapter',
+    'SftAdapter',
+    'SsmAdapter',
+    'TobAdapter',
+    'UztAdapter',
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    # Importing the submodule binds the module to the name, rebind it to the class
+    value = getattr(importlib.import_module('.' + name, __name__), name)
+    globals()[name] = value
+    return value
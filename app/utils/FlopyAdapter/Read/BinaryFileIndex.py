@@ -0,0 +1,126 @@
+"""
+Sidecar index of the records of the binary head, drawdown and concentration files.
+
+Flopy scans the headers of the whole file on every open. The headers of all records
+(kstp, kper, totim, layer, ...) and the byte position of their data are saved once
+in <file>.idx.npy when the calculation finished. The files are then opened from the index
+and read by seeking directly to the requested records.
+"""
+import os
+
+import flopy.utils.binaryfile as bf
+import numpy as np
+
+
+class IndexedLayerFile:
+    """Builds the record index of a flopy binary layer file from its sidecar index, if valid"""
+
+    def _build_index(self):
+        index = BinaryFileIndex.read(self.filename, self.realtype)
+        if index is None:
+            super()._build_index()
+            return
+
+        self.recordarray = np.empty(len(index), dtype=self.header_dtype)
+        for name in self.header_dtype.names:
+            self.recordarray[name] = index[name]
+        self.iposarray = index['ipos']
+        self.nrow = self.recordarray['nrow'][0]
+        self.ncol = self.recordarray['ncol'][0]
+        self.nlay = np.max(self.recordarray['ilay'])
+        self.totalbytes = int(self.iposarray[-1]) + BinaryFileIndex.databytes(index[-1], self.realtype)
+
+        # The unique times in order of the file, as flopy collects them
+        totim = self.recordarray['totim']
+        first = np.concatenate(([True], totim[1:] != totim[:-1]))
+        self.times = list(totim[first])
+        self.kstpkper = list(zip(self.recordarray['kstp'][first], self.recordarray['kper'][first]))
+
+
+class IndexedHeadFile(IndexedLayerFile, bf.HeadFile):
+    pass
+
+
+class IndexedUcnFile(IndexedLayerFile, bf.UcnFile):
+    pass
+
+
+class BinaryFileIndex:
+    suffix = '.idx.npy'
+
+    # Binary files by extension, with the text of their records
+    files = {
+        '.hds': (IndexedHeadFile, {'text': 'head'}),
+        '.ddn': (IndexedHeadFile, {'text': 'drawdown'}),
+        '.ucn': (IndexedUcnFile, {}),
+    }
+
+    @classmethod
+    def head_file(cls, filename, text='head'):
+        return IndexedHeadFile(filename=filename, text=text, precision='single')
+
+    @classmethod
+    def ucn_file(cls, filename):
+        return IndexedUcnFile(filename=filename, precision='single')
+
+    @staticmethod
+    def databytes(header, realtype):
+        return int(header['ncol']) * int(header['nrow']) * realtype(1).nbytes
+
+    @classmethod
+    def read(cls, filename, realtype):
+        """The index of the file, None if there is none or the file changed after it was written"""
+        try:
+            index_stat = os.stat(filename + cls.suffix)
+            file_stat = os.stat(filename)
+            if index_stat.st_mtime_ns < file_stat.st_mtime_ns:
+                return None
+            index = np.load(filename + cls.suffix)
+        except (OSError, ValueError):
+            return None
+
+        if len(index) == 0 or int(index[-1]['ipos']) + cls.databytes(index[-1], realtype) != file_stat.st_size:
+            return None
+        return index
+
+    @classmethod
+    def write(cls, layer_file):
+        """Writes the index of the opened flopy binary layer file"""
+        records = layer_file.recordarray
+        if len(records) == 0 or len(records) != len(layer_file.iposarray):
+            # Records of other texts are not indexed by flopy
+            return
+
+        index = np.empty(len(records), dtype=records.dtype.descr + [('ipos', '<i8')])
+        for name in records.dtype.names:
+            index[name] = records[name]
+        index['ipos'] = layer_file.iposarray
+
+        # Replaced at once, readers never see a partial index
+        temporary_file = '{}{}.{}'.format(layer_file.filename, cls.suffix, os.getpid())
+        with open(temporary_file, 'wb') as f:
+            np.save(f, index)
+        os.replace(temporary_file, layer_file.filename + cls.suffix)
+
+    @classmethod
+    def build(cls, workspace):
+        """Writes the index of all binary head, drawdown and concentration files, returns their names"""
+        indexed = []
+        for file in sorted(os.listdir(workspace)):
+            extension = os.path.splitext(file)[1].lower()
+            if extension not in cls.files:
+                continue
+
+            layer_file_class, kwargs = cls.files[extension]
+            filename = os.path.join(workspace, file)
+            try:
+                layer_file = layer_file_class(filename=filename, precision='single', **kwargs)
+            except Exception:
+                # Empty or unreadable files are read without index
+                continue
+            try:
+                cls.write(layer_file)
+            finally:
+                layer_file.close()
+            indexed.append(file)
+        return indexed
@@ -0,0 +1,78 @@
+"""
+Cell-major copy of the binary head, drawdown and concentration files.
+
+The files are written time-major, the time series of a cell needs a read from every record.
+The copy <file>.cells.npy holds the values as (nlay, nrow, ncol, ntimes), the values of a cell
+at all times are contiguous. It is written after the calculation for files with many time steps
+and read as memory map.
+"""
+import os
+
+import numpy as np
+
+from . import BinaryFileIndex, MemmapLayerFile, ResultFileCache
+
+
+class CellMajorFile:
+    suffix = '.cells.npy'
+
+    # Memory of the block of rows transposed at once
+    block_bytes = 64 * 1024 ** 2
+
+    @classmethod
+    def read(cls, filename, shape):
+        """The values (nlay, nrow, ncol, ntimes) as memory map, None if there is no valid copy of the file"""
+        try:
+            if os.stat(filename + cls.suffix).st_mtime_ns < os.stat(filename).st_mtime_ns:
+                return None
+            values = ResultFileCache.shared.get(filename + cls.suffix, lambda f: np.load(f, mmap_mode='r'))
+        except (OSError, ValueError):
+            return None
+        return values if values.shape == tuple(shape) else None
+
+    @classmethod
+    def write(cls, layer_file):
+        """Writes the cell-major copy of the opened MemmapLayerFile"""
+        nlay, nrow, ncol = layer_file.shape
+        ntimes = len(layer_file.get_times())
+        rows_per_block = max(1, cls.block_bytes // (ncol * ntimes * layer_file.realtype(1).nbytes))
+
+        # Replaced at once, readers never see a partial copy
+        temporary_file = '{}{}.{}'.format(layer_file.filename, cls.suffix, os.getpid())
+        values = np.lib.format.open_memmap(temporary_file, mode='w+', dtype=layer_file.realtype,
+                                           shape=(nlay, nrow, ncol, ntimes))
+        try:
+            for layer in range(nlay):
+                records, itim = layer_file.layer_records(layer)
+                for start in range(0, nrow, rows_per_block):
+                    stop = min(start + rows_per_block, nrow)
+                    block = np.full((stop - start, ncol, ntimes), np.nan, dtype=layer_file.realtype)
+                    for irec, time in zip(records, itim):
+                        block[:, :, time] = layer_file.record(irec)[start:stop]
+                    values[layer, start:stop] = block
+            values.flush()
+        finally:
+            del values
+        os.replace(temporary_file, layer_file.filename + cls.suffix)
+
+    @classmethod
+    def build(cls, workspace, min_times=1):
+        """Writes the cell-major copies of the binary files with at least min_times times, returns their names"""
+        written = []
+        for file in sorted(os.listdir(workspace)):
+            extension = os.path.splitext(file)[1].lower()
+            if extension not in BinaryFileIndex.files:
+                continue
+
+            layer_file_class, kwargs = BinaryFileIndex.files[extension]
+            filename = os.path.join(workspace, file)
+            try:
+                layer_file = MemmapLayerFile(layer_file_class(filename=filename, precision='single', **kwargs))
+            except Exception:
+                # Empty or unreadable files are not copied
+                continue
+            if len(layer_file.get_times()) < min_times:
+                continue
+            cls.write(layer_file)
+            written.append(file)
+        return written
@@ -6,11 +6,7 @@ Author: Ralf Junghanns
 EMail: ralf.junghanns@gmail.com
 """
 
-from .ReadBudget import ReadBudget
-from .ReadConcentration import ReadConcentration
-from .ReadDrawdown import ReadDrawdown
-from .ReadHead import ReadHead
-from .ReadFile import ReadFile
+from . import ReadBudget, ReadConcentration, ReadDrawdown, ReadHead, ReadFile
 
 
 class InowasFlopyReadAdapter:
@@ -0,0 +1,101 @@
+"""
+Sidecar statistics of the layers of the binary head, drawdown and concentration files.
+
+The minimum, maximum, mean and number of the valid cells of every layer and time are computed once
+when the calculation finished and saved in <file>.stats.npy, the color ranges of the images
+are read from there instead of scanning all layers of the time step on every request.
+"""
+import os
+
+import numpy as np
+
+from . import BinaryFileIndex, MemmapLayerFile, ResultFileCache
+
+
+class LayerStatistics:
+    suffix = '.stats.npy'
+
+    dtype = np.dtype([('idx', '<i4'), ('totim', '<f4'), ('layer', '<i4'), ('min', '<f8'), ('max', '<f8'),
+                      ('mean', '<f8'), ('count', '<i8')])
+
+    @staticmethod
+    def valid_cells(extension, data):
+        """Dry and inactive heads and drawdowns are below -999, inactive concentrations above 1e29"""
+        if extension == '.ucn':
+            return data <= 1e29
+        return data >= -999
+
+    @classmethod
+    def compute(cls, layer_file, extension):
+        """The statistics of all layers and times of the opened MemmapLayerFile"""
+        times = layer_file.get_times()
+        nlay = layer_file.nlay
+        statistics = np.zeros(len(times) * nlay, dtype=cls.dtype)
+        for idx, totim in enumerate(times):
+            data = layer_file.get_data(idx=idx)
+            valid = cls.valid_cells(extension, data)
+            count = np.count_nonzero(valid, axis=(1, 2))
+            rows = statistics[idx * nlay:(idx + 1) * nlay]
+            rows['idx'] = idx
+            rows['totim'] = totim
+            rows['layer'] = np.arange(nlay)
+            rows['count'] = count
+            rows['min'] = np.min(data, axis=(1, 2), where=valid, initial=np.inf)
+            rows['max'] = np.max(data, axis=(1, 2), where=valid, initial=-np.inf)
+            total = np.sum(data, axis=(1, 2), where=valid, dtype=np.float64)
+            rows['mean'] = np.divide(total, count, out=np.full(nlay, np.nan), where=count > 0)
+
+        # Layers without valid cells have no minimum and maximum
+        empty = statistics['count'] == 0
+        statistics['min'][empty] = np.nan
+        statistics['max'][empty] = np.nan
+        return statistics
+
+    @classmethod
+    def read(cls, filename):
+        """The statistics of the file, None if there are none or the file changed after they were written"""
+        try:
+            if os.stat(filename + cls.suffix).st_mtime_ns < os.stat(filename).st_mtime_ns:
+                return None
+            return ResultFileCache.shared.get(filename + cls.suffix, np.load)
+        except (OSError, TypeError, ValueError):
+            return None
+
+    @classmethod
+    def min_max(cls, filename, idx):
+        """[min, max] of the valid cells of all layers at the given index of the times, None if not available"""
+        statistics = cls.read(filename)
+        if statistics is None:
+            return None
+        rows = statistics[(statistics['idx'] == idx) & (statistics['count'] > 0)]
+        if len(rows) == 0:
+            return None
+        return [float(np.min(rows['min'])), float(np.max(rows['max']))]
+
+    @classmethod
+    def write(cls, filename, statistics):
+        # Replaced at once, readers never see partial statistics
+        temporary_file = '{}{}.{}'.format(filename, cls.suffix, os.getpid())
+        with open(temporary_file, 'wb') as f:
+            np.save(f, statistics)
+        os.replace(temporary_file, filename + cls.suffix)
+
+    @classmethod
+    def build(cls, workspace):
+        """Writes the statistics of all binary head, drawdown and concentration files, returns their names"""
+        computed = []
+        for file in sorted(os.listdir(workspace)):
+            extension = os.path.splitext(file)[1].lower()
+            if extension not in BinaryFileIndex.files:
+                continue
+
+            layer_file_class, kwargs = BinaryFileIndex.files[extension]
+            filename = os.path.join(workspace, file)
+            try:
+                layer_file = MemmapLayerFile(layer_file_class(filename=filename, precision='single', **kwargs))
+            except Exception:
+                # Empty or unreadable files have no statistics
+                continue
+            cls.write(filename, cls.compute(layer_file, extension))
+            computed.append(file)
+        return computed
@@ -0,0 +1,149 @@
+"""
+Zero-copy access to the layers of binary head, drawdown and concentration files.
+
+The data of an opened flopy binary layer file is returned as read-only numpy views
+of a memory map of the file, only the pages of the requested layers are read from disk.
+The flopy file is closed, all reads use the memory map and can be shared by threads.
+"""
+import mmap
+
+import numpy as np
+
+
+class MemmapLayerFile:
+    """The records of an opened flopy binary layer file as views of a memory map"""
+    _layer_file = None
+    _buffer = None
+
+    def __init__(self, layer_file):
+        self._layer_file = layer_file
+        with open(layer_file.filename, 'rb') as f:
+            # The views keep the memory map open after the file is closed
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        layer_file.close()
+
+    @property
+    def nlay(self):
+        return int(self._layer_file.nlay)
+
+    @property
+    def shape(self):
+        return self.nlay, int(self._layer_file.nrow), int(self._layer_file.ncol)
+
+    @property
+    def filename(self):
+        return self._layer_file.filename
+
+    @property
+    def realtype(self):
+        return self._layer_file.realtype
+
+    def get_times(self):
+        return self._layer_file.get_times()
+
+    def get_kstpkper(self):
+        return self._layer_file.get_kstpkper()
+
+    def select_totim(self, kstpkper=None, idx=None, totim=None):
+        """The totim of the given zero-based (kstp, kper), index of the times or totim, the last if none is given"""
+        recordarray = self._layer_file.recordarray
+        if kstpkper is not None:
+            records = np.where((recordarray['kstp'] == kstpkper[0] + 1) & (recordarray['kper'] == kstpkper[1] + 1))[0]
+            if len(records) == 0:
+                raise Exception('kstpkper not found: {}'.format(kstpkper))
+            return recordarray['totim'][records[0]]
+        if totim is not None:
+            return totim
+        if idx is not None:
+            return self._layer_file.times[idx]
+        return self._layer_file.times[-1]
+
+    def record(self, irec):
+        """The data of the record as 2D view"""
+        header = self._layer_file.recordarray[irec]
+        return np.ndarray((header['nrow'], header['ncol']), dtype=self._layer_file.realtype, buffer=self._buffer,
+                          offset=int(self._layer_file.iposarray[irec]))
+
+    def get_data(self, kstpkper=None, idx=None, totim=None, mflay=None):
+        """
+        The data of all layers (nlay, nrow, ncol) or of the zero-based layer mflay (nrow, ncol)
+        at the given time, layers without record are nan.
+        The data is a read-only view of the file if the records of the layers have equal distances.
+        """
+        layer_file = self._layer_file
+        totim = self.select_totim(kstpkper=kstpkper, idx=idx, totim=totim)
+        records = np.where(layer_file.recordarray['totim'] == totim)[0]
+        if len(records) == 0:
+            raise Exception('totim value ({}) not found in file...'.format(totim))
+
+        layers = layer_file.recordarray['ilay'][records] - 1
+        nrow = int(layer_file.recordarray['nrow'][records[0]])
+        ncol = int(layer_file.recordarray['ncol'][records[0]])
+        itemsize = layer_file.realtype(1).nbytes
+
+        if mflay is not None:
+            if not -layer_file.nlay <= mflay < layer_file.nlay:
+                raise IndexError('layer {} not found in file...'.format(mflay))
+            # A later record of the same layer replaces an earlier one
+            records = records[layers == mflay % layer_file.nlay]
+            if len(records) == 0:
+                return np.full((nrow, ncol), np.nan, dtype=layer_file.realtype)
+            return self.record(records[-1])
+
+        positions = layer_file.iposarray[records].astype(np.int64)
+        distances = np.unique(np.diff(positions))
+        if np.array_equal(layers, np.arange(layer_file.nlay)) and len(distances) <= 1:
+            stride = int(distances[0]) if len(distances) == 1 else nrow * ncol * itemsize
+            return np.ndarray((layer_file.nlay, nrow, ncol), dtype=layer_file.realtype, buffer=self._buffer,
+                              offset=int(positions[0]), strides=(stride, ncol * itemsize, itemsize))
+
+        data = np.full((layer_file.nlay, nrow, ncol), np.nan, dtype=layer_file.realtype)
+        for irec, layer in zip(records, layers):
+            data[layer] = self.record(irec)
+        return data
+
+    def get_ts(self, idx):
+        """
+        The values of the zero-based cell (layer, row, column) or list of cells at all times,
+        as flopy an array (ntimes, ncells + 1) with the times in the first column.
+        The values are read from the cell-major copy of the file if there is one,
+        otherwise the cells of a layer are gathered from each of its records at once.
+        """
+        layer_file = self._layer_file
+        cells = np.array([idx] if isinstance(idx, tuple) else idx, dtype=np.int64).reshape(-1, 3)
+        for k, i, j in cells:
+            if not (0 <= k < layer_file.nlay and 0 <= i < layer_file.nrow and 0 <= j < layer_file.ncol):
+                raise Exception('Invalid cell index. Cell {} not within model grid: {}'.format(
+                    (k, i, j), (layer_file.nlay, layer_file.nrow, layer_file.ncol)))
+
+        times = layer_file.times
+        result = np.full((len(times), len(cells) + 1), np.nan, dtype=layer_file.realtype)
+        result[:, 0] = times
+
+        # Imported on use, the module of the cell-major files uses this module
+        from . import CellMajorFile
+        cell_major = CellMajorFile.read(layer_file.filename, self.shape + (len(times),))
+        if cell_major is not None:
+            # The values of each cell at all times are contiguous
+            result[:, 1:] = cell_major[cells[:, 0], cells[:, 1], cells[:, 2]].T
+            return result
+
+        itemsize = layer_file.realtype(1).nbytes
+        positions = layer_file.iposarray.astype(np.int64)
+        raw = np.frombuffer(self._buffer, dtype=np.uint8)
+
+        for k in np.unique(cells[:, 0]):
+            columns = np.where(cells[:, 0] == k)[0]
+            records, itim = self.layer_records(k)
+            # The byte offsets (records, cells) of the values, read as bytes and viewed as values
+            offsets = positions[records, None] + (cells[columns, 1] * layer_file.ncol + cells[columns, 2]) * itemsize
+            values = raw[offsets[..., None] + np.arange(itemsize)].view(layer_file.realtype)[..., 0]
+            result[np.ix_(itim, columns + 1)] = values
+        return result
+
+    def layer_records(self, layer):
+        """The records of the zero-based layer and the indexes of their times"""
+        recordarray = self._layer_file.recordarray
+        records = np.where(recordarray['ilay'] - 1 == layer)[0]
+        time_index = {totim: itim for itim, totim in enumerate(self._layer_file.times)}
+        return records, np.array([time_index[totim] for totim in recordarray['totim'][records]], dtype=np.int64)
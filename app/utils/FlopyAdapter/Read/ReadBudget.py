@@ -1,6 +1,8 @@
 import os
 from flopy.utils.mflistfile import MfListBudget, SwtListBudget
 
+from . import ResultFileCache
+
 
 class ReadBudget:
     _filename = None
@@ -11,14 +13,20 @@ class ReadBudget:
                 self._filename = os.path.join(workspace, file)
         pass
 
+    @staticmethod
+    def open_list_budget(filename):
+        if filename.endswith("swt.list"):
+            list_budget = SwtListBudget(filename)
+        else:
+            list_budget = MfListBudget(filename)
+        if list_budget.isvalid():
+            # Flopy leaves the time step lengths of the cumulative budgets uninitialized
+            list_budget.cum['tslen'] = list_budget.inc['tslen']
+        return list_budget
+
     def get_list_budget(self):
         try:
-            if self._filename.endswith("swt.list"):
-                list_budget = SwtListBudget(self._filename)
-                return list_budget
-
-            list_budget = MfListBudget(self._filename)
-            return list_budget
+            return ResultFileCache.shared.get(self._filename, self.open_list_budget)
         except:
             return None
 
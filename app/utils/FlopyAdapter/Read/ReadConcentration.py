@@ -1,6 +1,9 @@
 import errno
 import os
-import flopy.utils.binaryfile as bf
+
+import numpy as np
+
+from . import BinaryFileIndex, MemmapLayerFile, ResultFileCache
 
 
 class ReadConcentration:
@@ -22,10 +25,25 @@ class ReadConcentration:
 
         return filename
 
+    @staticmethod
+    def open_layer_file(filename):
+        return MemmapLayerFile(BinaryFileIndex.ucn_file(filename))
+
+    def open_file(self, filename):
+        return ResultFileCache.shared.get(filename, self.open_layer_file)
+
+    @staticmethod
+    def layer_to_list(data):
+        """The layer rounded to 2 decimals as nested lists, inactive cells are None"""
+        data = np.round(data.astype(np.float64), 2)
+        values = data.astype(object)
+        values[data > 1e29] = None
+        return values.tolist()
+
     def read_times(self, substance=0):
         try:
             filename = self.get_concentration_file_from_substance(substance)
-            ucn_obj = bf.UcnFile(filename=filename, precision='single')
+            ucn_obj = self.open_file(filename)
             times = ucn_obj.get_times()
             if times is not None:
                 return times
@@ -43,7 +61,7 @@ class ReadConcentration:
     def read_kstpkper(self, substance=0):
         try:
             filename = self.get_concentration_file_from_substance(substance)
-            ucn_obj = bf.UcnFile(filename=filename, precision='single')
+            ucn_obj = self.open_file(filename)
             kstpkper = ucn_obj.get_kstpkper()
             if kstpkper is not None:
                 return kstpkper
@@ -60,8 +78,8 @@ class ReadConcentration:
 
     def read_number_of_layers(self):
         try:
-            ucn_obj = bf.UcnFile(filename=self._filename, precision='single')
-            number_of_layers = ucn_obj.get_data().shape[0]
+            ucn_obj = self.open_file(self._filename)
+            number_of_layers = int(ucn_obj.nlay)
             return number_of_layers
         except:
             return 0
@@ -72,49 +90,35 @@ class ReadConcentration:
     def read_layer_by_totim(self, substance=0, totim=0, layer=0):
         try:
             filename = self.get_concentration_file_from_substance(substance)
-            ucn_obj = bf.UcnFile(filename=filename, precision='single')
-            data = ucn_obj.get_data(totim=totim, mflay=layer).tolist()
-            for i in range(len(data)):
-                for j in range(len(data[i])):
-                    data[i][j] = round(data[i][j], 2)
-                    if data[i][j] > 1e29:
-                        data[i][j] = None
-            return data
+            ucn_obj = self.open_file(filename)
+            return self.layer_to_list(ucn_obj.get_data(totim=totim, mflay=layer))
         except:
             return []
 
     def read_layer_by_idx(self, substance=0, idx=0, layer=0):
         try:
             filename = self.get_concentration_file_from_substance(substance)
-            ucn_obj = bf.UcnFile(filename=filename, precision='single')
-            data = ucn_obj.get_data(idx=idx, mflay=layer).tolist()
-            for i in range(len(data)):
-                for j in range(len(data[i])):
-                    data[i][j] = round(data[i][j], 2)
-                    if data[i][j] > 1e29:
-                        data[i][j] = None
-            return data
+            ucn_obj = self.open_file(filename)
+            return self.layer_to_list(ucn_obj.get_data(idx=idx, mflay=layer))
         except:
             return []
 
     def read_layer_by_kstpkper(self, substance=0, kstpkper=(0, 0), layer=0):
         try:
             filename = self.get_concentration_file_from_substance(substance)
-            ucn_obj = bf.UcnFile(filename=filename, precision='single')
-            data = ucn_obj.get_data(kstpkper=kstpkper, mflay=layer).tolist()
-            for i in range(len(data)):
-                for j in range(len(data[i])):
-                    data[i][j] = round(data[i][j], 2)
-                    if data[i][j] > 1e29:
-                        data[i][j] = None
-            return data
+            ucn_obj = self.open_file(filename)
+            return self.layer_to_list(ucn_obj.get_data(kstpkper=kstpkper, mflay=layer))
         except:
             return []
 
     def read_ts(self, substance=0, layer=0, row=0, column=0):
+        return self.read_ts_by_cells([(layer, row, column)], substance=substance)
+
+    def read_ts_by_cells(self, cells, substance=0):
+        """Rows [totim, value, ...] with the values of the zero-based cells (layer, row, column)"""
         try:
             filename = self.get_concentration_file_from_substance(substance)
-            ucn_obj = bf.UcnFile(filename=filename, precision='single')
-            return ucn_obj.get_ts(idx=(layer, row, column)).tolist()
+            ucn_obj = self.open_file(filename)
+            return ucn_obj.get_ts(idx=list(cells)).tolist()
         except:
             return []
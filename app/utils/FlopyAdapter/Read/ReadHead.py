@@ -1,7 +1,8 @@
 import os
-import flopy.utils.binaryfile as bf
 import numpy as np
 
+from . import BinaryFileIndex, LayerStatistics, MemmapLayerFile, ResultFileCache
+
 
 class ReadHead:
     _filename = None
@@ -12,9 +13,24 @@ class ReadHead:
                 self._filename = os.path.join(workspace, file)
         pass
 
+    @staticmethod
+    def open_layer_file(filename):
+        return MemmapLayerFile(BinaryFileIndex.head_file(filename))
+
+    def open_file(self):
+        return ResultFileCache.shared.get(self._filename, self.open_layer_file)
+
+    @staticmethod
+    def layer_to_list(data):
+        """The layer rounded to 2 decimals as nested lists, dry and inactive cells are None"""
+        data = np.round(data.astype(np.float64), 2)
+        values = data.astype(object)
+        values[data < -999] = None
+        return values.tolist()
+
     def read_times(self):
         try:
-            heads = bf.HeadFile(filename=self._filename, precision='single')
+            heads = self.open_file()
             times = heads.get_times()
             if times is not None:
                 return times
@@ -31,7 +47,7 @@ class ReadHead:
 
     def read_kstpkper(self):
         try:
-            heads = bf.HeadFile(filename=self._filename, precision='single')
+            heads = self.open_file()
             kstpkper = heads.get_kstpkper()
             if kstpkper is not None:
                 return kstpkper
@@ -41,83 +57,77 @@ class ReadHead:
 
     def read_number_of_layers(self):
         try:
-            heads = bf.HeadFile(filename=self._filename, precision='single')
-            number_of_layers = heads.get_data().shape[0]
+            heads = self.open_file()
+            number_of_layers = int(heads.nlay)
             return number_of_layers
         except:
             return 0
 
+    def read_data(self, kstpkper=None):
+        """The heads of all layers at the given or the last saved time step, None if not readable"""
+        try:
+            heads = self.open_file()
+            data = heads.get_data(kstpkper=None if kstpkper is None else tuple(kstpkper))
+            return np.array(data)
+        except:
+            return None
+
     def read_layer(self, **kwargs):
         return self.read_layer_by_totim(**kwargs)
 
     def read_layer_by_totim(self, totim=0, layer=0):
         try:
-            heads = bf.HeadFile(filename=self._filename, precision='single')
-            data = heads.get_data(totim=totim, mflay=layer).tolist()
-            for i in range(len(data)):
-                for j in range(len(data[i])):
-                    data[i][j] = round(data[i][j], 2)
-                    if data[i][j] < -999:
-                        data[i][j] = None
-            return data
+            heads = self.open_file()
+            return self.layer_to_list(heads.get_data(totim=totim, mflay=layer))
         except:
             return []
 
     def read_layer_by_idx(self, idx=0, layer=0):
         try:
-            heads = bf.HeadFile(filename=self._filename, precision='single')
-            data = heads.get_data(idx=idx, mflay=layer).tolist()
-            for i in range(len(data)):
-                for j in range(len(data[i])):
-                    data[i][j] = round(data[i][j], 2)
-                    if data[i][j] < -999:
-                        data[i][j] = None
-            return data
+            heads = self.open_file()
+            return self.layer_to_list(heads.get_data(idx=idx, mflay=layer))
         except:
             return []
 
     def read_min_max_by_idx(self, idx=0):
         try:
-            heads = bf.HeadFile(filename=self._filename, precision='single')
-            data = heads.get_data(idx=idx).tolist()
-            min_value = np.max(data)
-            max_value = np.max(data)
-
-            for i in range(len(data)):
-                for j in range(len(data[i])):
-                    for k in range(len(data[i][j])):
-                        if data[i][j][k] < -999:
-                            data[i][j][k] = None
-                        elif data[i][j][k] > max_value:
-                            max_value = data[i][j][k]
-                        elif data[i][j][k] < min_value:
-                            min_value = data[i][j][k]
+            min_max = LayerStatistics.min_max(self._filename, idx)
+            if min_max is not None:
+                return min_max
 
+            heads = self.open_file()
+            data = heads.get_data(idx=idx)
+            max_value = float(np.max(data))
+            # Dry and inactive cells are no minimum
+            min_value = min(float(np.min(data, where=data >= -999, initial=np.inf)), max_value)
             return [min_value, max_value]
         except:
             return [0, 999]
 
+    def read_layer_array(self, idx=0, layer=0):
+        """The layer at the given index of the times as float array, dry and inactive cells are nan"""
+        heads = self.open_file()
+        data = heads.get_data(idx=idx, mflay=layer)
+        return np.where(data < -999, np.nan, data)
+
     def read_layer_by_kstpkper(self, kstpkper=(0, 0), layer=0):
         try:
-            heads = bf.HeadFile(filename=self._filename, precision='single')
-            data = heads.get_data(kstpkper=kstpkper, mflay=layer).tolist()
-            for i in range(len(data)):
-                for j in range(len(data[i])):
-                    data[i][j] = round(data[i][j], 2)
-                    if data[i][j] < -999:
-                        data[i][j] = None
-            return data
+            heads = self.open_file()
+            return self.layer_to_list(heads.get_data(kstpkper=kstpkper, mflay=layer))
         except:
             return []
 
     def read_ts(self, layer=0, row=0, column=0):
+        return self.read_ts_by_cells([(layer, row, column)])
+
+    def read_ts_by_cells(self, cells):
+        """Rows [totim, value, ...] with the values of the zero-based cells (layer, row, column), dry cells are None"""
         try:
-            heads = bf.HeadFile(filename=self._filename, precision='single')
-            data = heads.get_ts(idx=(layer, row, column)).tolist()
-            for i in range(len(data)):
-                data[i][0] = round(data[i][0], 0)
-                if data[i][1] < -999:
-                    data[i][1] = None
-            return data
+            heads = self.open_file()
+            data = heads.get_ts(idx=list(cells)).astype(np.float64)
+            data[:, 0] = np.round(data[:, 0])
+            values = data.astype(object)
+            values[:, 1:][data[:, 1:] < -999] = None
+            return values.tolist()
         except:
             return []
@@ -0,0 +1,172 @@
+import os
+import re
+
+
+class ReadListFile:
+    """Reads the solver output of the Modflow list file"""
+    _filename = None
+
+    # Outer and inner iterations of one time step, MODFLOW-NWT and the MODFLOW-2005 solvers (PCG, SIP, DE4, ...)
+    outer_patterns = [
+        re.compile(r'NWT REQUIRED\s+(\d+)\s+OUTER ITERATIONS'),
+        re.compile(r'(\d+)\s+CALLS TO \w+ ROUTINE FOR TIME STEP'),
+        re.compile(r'(\d+)\s+ITERATIONS FOR TIME STEP'),
+    ]
+    inner_patterns = [
+        re.compile(r'TOTAL OF\s+(\d+)\s+INNER ITERATIONS'),
+        re.compile(r'(\d+)\s+TOTAL ITERATIONS'),
+    ]
+
+    # Lines which name the time step they belong to
+    time_step_patterns = [
+        re.compile(r'TIME STEP\s+(\d+)\s+IN STRESS PERIOD\s+(\d+)'),
+        re.compile(r'AT END OF TIME STEP\s+(\d+),\s+STRESS PERIOD\s+(\d+)'),
+    ]
+
+    head_change_header = 'MAXIMUM HEAD CHANGE FOR EACH ITERATION'
+    head_change_pattern = re.compile(r'(-?\d*\.?\d+(?:[EeDd][-+]?\d+)?)\s*\(\s*\d+,\s*\d+,\s*\d+\)')
+    percent_discrepancy_pattern = re.compile(r'PERCENT DISCREPANCY =\s*(\S+)')
+    failure_pattern = re.compile(r'FAIL\w* TO (MEET SOLVER CONVERGENCE|CONVERGE)')
+    elapsed_pattern = re.compile(r'(\d+(?:\.\d+)?)\s+(Days|Hours|Minutes|Seconds)')
+    elapsed_units = {'Days': 86400, 'Hours': 3600, 'Minutes': 60, 'Seconds': 1}
+
+    telemetry = ['outer', 'inner', 'max_head_change', 'percent_discrepancy']
+
+    def __init__(self, workspace, name=None):
+        if name is not None:
+            self._filename = os.path.join(workspace, name + '.list')
+            return
+
+        for file in sorted(os.listdir(workspace)):
+            if file.endswith(".list") and self._filename is None:
+                self._filename = os.path.join(workspace, file)
+
+    def read_iterations(self):
+        """The outer and inner iterations of all time steps, None if the list file does not report them"""
+        convergence = self.read_convergence()
+        if convergence is None or convergence['summary']['outer'] is None:
+            return None
+        return {'outer': convergence['summary']['outer'], 'inner': convergence['summary']['inner'] or 0}
+
+    def read_convergence(self):
+        """
+        The solver telemetry of the time steps and its summary, None if the list file cannot be read.
+        Values the list file does not report are None,
+        e.g. the iterations if the solver printout is suppressed (PCG: mutpcg > 0).
+        The max_head_change of a time step is the maximum head change of its last iteration.
+        """
+        try:
+            steps = []
+            step = None
+            head_changes = None
+            elapsed = None
+            with open(self._filename, errors='replace') as f:
+                for line in f:
+                    if head_changes is not None:
+                        values = self.head_change_pattern.findall(line)
+                        if values:
+                            head_changes += values
+                            continue
+                        if 'LAYER,ROW,COL' not in line and re.search('[A-Z]{4,}', line):
+                            self.set_head_change(step, head_changes)
+                            head_changes = None
+
+                    for pattern in self.outer_patterns:
+                        match = pattern.search(line)
+                        if match:
+                            # NWT reports the iterations before the time step is named
+                            if step is None or step['outer'] is not None or step['kstp'] is not None:
+                                step = self.new_step(steps)
+                            step['outer'] = int(match.group(1))
+
+                    for pattern in self.inner_patterns:
+                        match = pattern.search(line)
+                        if match:
+                            if step is None:
+                                step = self.new_step(steps)
+                            step['inner'] = int(match.group(1))
+
+                    for pattern in self.time_step_patterns:
+                        match = pattern.search(line)
+                        if match:
+                            step = self.find_step(steps, step, int(match.group(1)) - 1, int(match.group(2)) - 1)
+
+                    if self.head_change_header in line:
+                        if step is None:
+                            step = self.new_step(steps)
+                        head_changes = []
+
+                    values = self.percent_discrepancy_pattern.findall(line)
+                    if values:
+                        if step is None:
+                            step = self.new_step(steps)
+                        step['percent_discrepancy'] = {
+                            'cumulative': self.to_float(values[0]),
+                            'rate': self.to_float(values[-1]),
+                        }
+
+                    if self.failure_pattern.search(line):
+                        if step is None:
+                            step = self.new_step(steps)
+                        step['converged'] = False
+
+                    if 'Elapsed run time' in line:
+                        elapsed = sum(float(value) * self.elapsed_units[unit]
+                                      for value, unit in self.elapsed_pattern.findall(line))
+
+            if head_changes is not None:
+                self.set_head_change(step, head_changes)
+
+            # Time steps which are only named in the list file, e.g. by the output control
+            steps = [step for step in steps
+                     if not step['converged'] or any(step[key] is not None for key in self.telemetry)]
+            return {'summary': self.summarize(steps, elapsed), 'steps': steps}
+        except:
+            return None
+
+    @staticmethod
+    def new_step(steps, kstp=None, kper=None):
+        step = {'kper': kper, 'kstp': kstp, 'outer': None, 'inner': None, 'max_head_change': None,
+                'percent_discrepancy': None, 'converged': True}
+        steps.append(step)
+        return step
+
+    @classmethod
+    def find_step(cls, steps, step, kstp, kper):
+        """The step the solver output belongs to, the list file names it after the solver output"""
+        if step is not None and step['kstp'] is None:
+            step['kstp'], step['kper'] = kstp, kper
+            return step
+        if step is not None and (step['kstp'], step['kper']) == (kstp, kper):
+            return step
+        return cls.new_step(steps, kstp, kper)
+
+    @classmethod
+    def set_head_change(cls, step, head_changes):
+        if head_changes:
+            step['max_head_change'] = cls.to_float(head_changes[-1])
+
+    @staticmethod
+    def to_float(value):
+        try:
+            return float(value.replace('D', 'E').replace('d', 'e'))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def summarize(steps, elapsed):
+        def values(key):
+            return [step[key] for step in steps if step[key] is not None]
+
+        discrepancies = [abs(value) for step in steps if step['percent_discrepancy'] is not None
+                         for value in step['percent_discrepancy'].values() if value is not None]
+        head_changes = [abs(value) for value in values('max_head_change')]
+        return {
+            'outer': sum(values('outer')) if values('outer') else None,
+            'inner': sum(values('inner')) if values('inner') else None,
+            'max_outer': max(values('outer')) if values('outer') else None,
+            'max_head_change': max(head_changes) if head_changes else None,
+            'max_percent_discrepancy': max(discrepancies) if discrepancies else None,
+            'failed_time_steps': len([step for step in steps if not step['converged']]),
+            'elapsed': elapsed,
+        }
@@ -0,0 +1,83 @@
+"""
+Shared least-recently-used cache of opened result files.
+
+Opening a binary head file or parsing a list file is much more expensive than reading one layer or budget from it.
+The readers get the opened files of this process from the cache, keyed by path, size and modification time,
+so a rerun of a calculation opens its files again. The cached objects are only read and shared by threads.
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class ResultFileCache:
+    # The cache of the process, configured by the app
+    shared = None
+
+    def __init__(self, max_bytes=256 * 1024 ** 2, max_entries=128):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, filename, open_file):
+        """The opened file from the cache, opened with open_file(filename) if it is not cached or changed"""
+        stat = os.stat(filename)
+        key = (filename, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        # Opened without lock, the same file may be opened by two threads at once
+        value = open_file(filename)
+        size = self.size_of(value)
+        with self._lock:
+            for outdated in [k for k in self._entries if k[0] == filename]:
+                self._remove(outdated)
+            if size <= self.max_bytes and self.max_entries > 0:
+                self._entries[key] = (value, size)
+                self.bytes += size
+            while self.bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def _remove(self, key):
+        # The file stays open until the last reader using it finished
+        _, size = self._entries.pop(key)
+        self.bytes -= size
+
+    @classmethod
+    def size_of(cls, value, depth=3):
+        """Estimated memory of the object with its numpy arrays, memory maps are not counted"""
+        if isinstance(value, np.ndarray):
+            return value.nbytes if value.flags.owndata else 0
+        if isinstance(value, (list, tuple)):
+            # The items of the lists are of the same type, e.g. the times
+            return sys.getsizeof(value) + (cls.size_of(value[0], depth) * len(value) if len(value) > 0 else 0)
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(cls.size_of(item, depth) for item in value.values())
+        if depth > 0 and hasattr(value, '__dict__'):
+            return sys.getsizeof(value) + sum(cls.size_of(item, depth - 1) for item in vars(value).values())
+        return sys.getsizeof(value)
+
+
+ResultFileCache.shared = ResultFileCache()
@@ -1,8 +1,30 @@
-from .InowasFlopyReadAdapter import InowasFlopyReadAdapter
-from .InowasFlopyReadFitness import InowasFlopyReadFitness
-from .InowasModflowReadAdapter import InowasModflowReadAdapter
-from .ReadBudget import ReadBudget
-from .ReadConcentration import ReadConcentration
-from .ReadDrawdown import ReadDrawdown
-from .ReadFile import ReadFile
-from .ReadHead import ReadHead
+"""
+The classes are imported on first use.
+"""
+import importlib
+
+__all__ = [
+    'BinaryFileIndex',
+    'CellMajorFile',
+    'InowasFlopyReadAdapter',
+    'InowasFlopyReadFitness',
+    'InowasModflowReadAdapter',
+    'LayerStatistics',
+    'MemmapLayerFile',
+    'ReadBudget',
+    'ReadConcentration',
+    'ReadDrawdown',
+    'ReadFile',
+    'ReadHead',
+    'ReadListFile',
+    'ResultFileCache',
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    # Importing the submodule binds the module to the name, rebind it to the class
+    value = getattr(importlib.import_module('.' + name, __name__), name)
+    globals()[name] = value
+    return value
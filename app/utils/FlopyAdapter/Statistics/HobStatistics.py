@@ -34,26 +34,25 @@ class HobStatistics:
         if not os.path.isfile(self._input_file):
             return {"error": 'File ' + self._input_file + ' not found.'}
 
-        f = open(self._input_file)
-
         header = False
 
         names = []
         observed = []
         simulated = []
 
-        for line in f:
-            if line.startswith('#'):
-                continue
+        with open(self._input_file) as f:
+            for line in f:
+                if line.startswith('#'):
+                    continue
 
-            if not header:
-                header = line.split('"')[1::2]
-                continue
+                if not header:
+                    header = line.split('"')[1::2]
+                    continue
 
-            values = line.split()
-            simulated.append(float(values[0]))
-            observed.append(float(values[1]))
-            names.append('_'.join(values[2].split('_')[:-1]))
+                values = line.split()
+                simulated.append(float(values[0]))
+                observed.append(float(values[1]))
+                names.append('_'.join(values[2].split('_')[:-1]))
 
         simulated = np.array(simulated)
         observed = np.array(observed)
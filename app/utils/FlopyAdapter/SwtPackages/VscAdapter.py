@@ -1,5 +1,7 @@
 import flopy.seawat as seawat
 
+from ..Encoding import ArrayEncoding
+
 
 class VscAdapter:
     _data = None
@@ -24,7 +26,7 @@ class VscAdapter:
     def merge(self):
         default = self.default()
         for key in self._data:
-            default[key] = self._data[key]
+            default[key] = ArrayEncoding.decode(self._data[key])
         return default
 
     def get_package(self, _swt):
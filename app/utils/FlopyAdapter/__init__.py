@@ -3,15 +3,21 @@ MIT License
 """
 __author__ = "Ralf Junghanns"
 
+import importlib
+
 from .version import __version__  # isort:skip
-from . import (
-    Calculation,
-    Read
-)
 
 __all__ = [
     "__author__",
     "__version__",
     "Calculation",
+    "Encoding",
     "Read",
 ]
+
+
+def __getattr__(name):
+    # The subpackages are imported on first use
+    if name not in __all__:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    return importlib.import_module('.' + name, __name__)
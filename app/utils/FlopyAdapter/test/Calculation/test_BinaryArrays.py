@@ -0,0 +1,62 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import flopy
+import numpy as np
+
+from ...Calculation import InowasFlopyCalculationAdapter, BinaryArrays, IncrementalWriter
+
+
+class BinaryArraysTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        with open(os.path.join(os.path.dirname(__file__), 'data/test_1.json')) as f:
+            self._data = json.load(f)['data']['mf']
+        self._data['mf']['modelname'] = 'mf'
+        self._data['mf']['model_ws'] = self._tmp_dir
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def create_model(self):
+        adapter = InowasFlopyCalculationAdapter('3.2.10', {}, 'binary')
+        with contextlib.redirect_stdout(io.StringIO()):
+            package_content = adapter.read_packages(self._data)
+            adapter.create_model(adapter.mf_package_order, package_content)
+        return adapter, package_content
+
+    def test_it_writes_big_arrays_as_binary_files_test(self):
+        self._data['dis']['top'][0][0] = 481
+        self._data['lpf']['hk'][0][0][0] = 1.5
+        adapter, package_content = self.create_model()
+        model = adapter._model
+
+        # 40 x 75 cells, uniform arrays stay inline
+        self.assertEqual(BinaryArrays(3000).apply(model), 2)
+        self.assertEqual(BinaryArrays(3001).apply(model), 0)
+        model.write_input()
+
+        self.assertTrue(os.path.isfile(os.path.join(self._tmp_dir, 'mf.dis.model_top.bin')))
+        with open(os.path.join(self._tmp_dir, 'mf.lpf')) as f:
+            self.assertIn('(BINARY)', f.read())
+
+        loaded = flopy.modflow.Modflow.load('mf.nam', model_ws=self._tmp_dir, check=False, load_only=['dis', 'lpf'])
+        np.testing.assert_array_equal(loaded.dis.top.array, model.dis.top.array)
+        np.testing.assert_array_equal(loaded.lpf.hk.array, model.lpf.hk.array)
+
+        # A missing binary file is written again
+        os.remove(os.path.join(self._tmp_dir, 'mf.dis.model_top.bin'))
+        writer = IncrementalWriter(self._tmp_dir, 'mf', {'binary_array_threshold': 3000})
+        self.assertEqual(sorted(writer.write(model, adapter._packages, package_content)), sorted(package_content))
+        self.assertEqual(writer.write(model, adapter._packages, package_content), [])
+        os.remove(os.path.join(self._tmp_dir, 'mf.dis.model_top.bin'))
+        self.assertEqual(writer.write(model, adapter._packages, package_content), ['dis'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from ...Calculation import InowasFlopyCalculationAdapter, IncrementalWriter
+
+
+class IncrementalWriterTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        with open(os.path.join(os.path.dirname(__file__), 'data/test_1.json')) as f:
+            self._data = json.load(f)['data']['mf']
+        self._data['mf']['modelname'] = 'mf'
+        self._data['mf']['model_ws'] = self._tmp_dir
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    @staticmethod
+    def write(data):
+        flopy = InowasFlopyCalculationAdapter('3.2.10', {}, 'incremental')
+        package_content = flopy.read_packages(data)
+        flopy.create_model(flopy.mf_package_order, package_content)
+        return IncrementalWriter(data['mf']['model_ws'], 'mf').write(flopy._model, flopy._packages, package_content)
+
+    def test_it_writes_only_changed_packages_test(self):
+        self.assertEqual(self.write(self._data), ['mf', 'dis', 'bas', 'ghb', 'wel', 'lpf', 'pcg', 'oc'])
+        self.assertEqual(self.write(self._data), [])
+
+        self._data['wel']['stress_period_data']['0'][0][3] = -1234
+        self.assertEqual(self.write(self._data), ['wel'])
+        with open(os.path.join(self._tmp_dir, 'mf.wel')) as f:
+            self.assertIn('-1234', f.read())
+
+        os.remove(os.path.join(self._tmp_dir, 'mf.lpf'))
+        self.assertEqual(self.write(self._data), ['lpf'])
+
+        self._data['dis']['perlen'] = [p * 2 for p in self._data['dis']['perlen']]
+        self.assertEqual(self.write(self._data), ['mf', 'dis', 'bas', 'ghb', 'wel', 'lpf', 'pcg', 'oc'])
+        self.assertTrue(os.path.isfile(os.path.join(self._tmp_dir, 'mf.nam')))
+
+    def test_the_input_files_can_be_moved_to_another_workspace_test(self):
+        self.write(self._data)
+        files = IncrementalWriter.input_files(self._tmp_dir)
+        self.assertEqual(files[0], 'input_hashes.json')
+        self.assertIn('mf.wel', files)
+
+        model_ws = os.path.join(self._tmp_dir, 'moved')
+        os.makedirs(model_ws)
+        for file in files:
+            shutil.copy2(os.path.join(self._tmp_dir, file), os.path.join(model_ws, file))
+        self._data['mf']['model_ws'] = model_ws
+        self.assertEqual(self.write(self._data), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
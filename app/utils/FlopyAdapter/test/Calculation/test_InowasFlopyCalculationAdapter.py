@@ -1,9 +1,19 @@
+import contextlib
+import io
 import os
 import unittest
 import json
 import random
+import shutil
+import stat
+import tempfile
 import traceback
 import tracemalloc
+from time import monotonic
+from types import SimpleNamespace
+
+import numpy as np
+
 from ...Calculation import InowasFlopyCalculationAdapter
 
 
@@ -109,3 +119,73 @@ class InowasModflowCalculationAdapterTest(unittest.TestCase):
             traceback.print_exc()
             raise e
 
+    def test_it_records_the_stage_timings_by_model_type(self):
+        flopy = InowasFlopyCalculationAdapter('3.2.10', {}, 'timings')
+        self.assertEqual(flopy.timings(), {})
+
+        flopy._model_type = 'mf'
+        with flopy.timer('write_input'):
+            pass
+        with flopy.timer('write_input'):
+            pass
+        with flopy.timer('run_model'):
+            pass
+
+        self.assertEqual(list(flopy.timings().keys()), ['mf'])
+        self.assertEqual(sorted(flopy.timings()['mf'].keys()), ['run_model', 'write_input'])
+        self.assertGreaterEqual(flopy.timings()['mf']['write_input'], 0)
+
+    def test_it_runs_the_post_flow_models_concurrently(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            models = []
+            for model_type, normal_msg in [('mt', 'Program completed'), ('mp', 'Normal termination')]:
+                exe_name = os.path.join(tmp_dir, model_type + '.sh')
+                with open(exe_name, 'w') as f:
+                    f.write('#!/bin/sh\nsleep 1\necho "%s %s"\n' % (model_type, normal_msg))
+                os.chmod(exe_name, os.stat(exe_name).st_mode | stat.S_IEXEC)
+                models.append((model_type, SimpleNamespace(exe_name=exe_name, namefile=None, model_ws=tmp_dir)))
+
+            flopy = InowasFlopyCalculationAdapter('3.2.10', {}, 'concurrent')
+            start = monotonic()
+            self.assertTrue(flopy.run_models_concurrently(models))
+            self.assertLess(monotonic() - start, 1.9)
+            self.assertEqual(flopy.response_message(), 'mt Program completedmp Normal termination')
+            self.assertEqual(sorted(flopy.timings().keys()), ['mp', 'mt'])
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_it_warm_starts_with_the_heads_of_a_previous_calculation(self):
+        with open(os.path.join(os.path.dirname(__file__), 'data/test_1.json')) as f:
+            data = json.load(f)['data']['mf']
+        data['mf']['model_ws'] = tempfile.mkdtemp()
+        data['bas']['ibound'][0][0][0] = 0
+        data['bas']['ibound'][0][0][1] = -1
+
+        try:
+            heads = np.full((1, 40, 75), 42.0)
+            heads[0][1][0] = -1e30
+            flopy = InowasFlopyCalculationAdapter('3.2.10', {}, 'warm_start', warm_start_heads=heads)
+            with contextlib.redirect_stdout(io.StringIO()):
+                package_content = flopy.read_packages(data)
+                flopy.create_model(flopy.mf_package_order, package_content)
+                strt = flopy._model.bas6.strt.array.copy()
+                flopy.warm_start(flopy._model, package_content)
+
+            # Inactive, constant-head and dry cells keep their initial heads
+            self.assertEqual(flopy.warm_start_cells, 40 * 75 - 3)
+            warm_strt = flopy._model.bas6.strt.array
+            self.assertEqual(warm_strt[0][2][5], 42.0)
+            for row, column in [(0, 0), (0, 1), (1, 0)]:
+                self.assertEqual(warm_strt[0][row][column], strt[0][row][column])
+            np.testing.assert_array_equal(package_content['bas']['strt'], warm_strt)
+            self.assertIsNot(package_content['bas'], data['bas'])
+
+            flopy = InowasFlopyCalculationAdapter('3.2.10', {}, 'warm_start', warm_start_heads=np.ones((2, 40, 75)))
+            with contextlib.redirect_stdout(io.StringIO()):
+                package_content = flopy.read_packages(data)
+                flopy.create_model(flopy.mf_package_order, package_content)
+                flopy.warm_start(flopy._model, package_content)
+            self.assertIsNone(flopy.warm_start_cells)
+        finally:
+            shutil.rmtree(data['mf']['model_ws'])
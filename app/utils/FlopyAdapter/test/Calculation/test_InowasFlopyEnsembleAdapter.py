@@ -0,0 +1,126 @@
+import contextlib
+import csv
+import io
+import json
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import unittest
+
+import flopy
+import numpy as np
+
+from ...Calculation import InowasFlopyEnsembleAdapter
+
+# Fake Modflow writing observations which depend on the hk of the member.
+# With a file "barrier" next to it, the members wait until the given number of members is running.
+FAKE_MODFLOW = """#!/bin/sh
+barrier="$(dirname "$0")/barrier"
+if [ -f "$barrier" ]; then
+    touch "$barrier.$$"
+    waited=0
+    while [ "$(ls "$barrier".* | wc -l)" -lt "$(cat "$barrier")" ]; do
+        if [ $waited -ge 300 ]; then
+            echo "The members do not run concurrently"
+            exit 1
+        fi
+        sleep 0.1
+        waited=$((waited + 1))
+    done
+fi
+hk=$(grep -m1 '#hk' mf.lpf | awk '{print $2}')
+printf '"SIMULATED EQUIVALENT" "OBSERVED VALUE" "OBSERVATION NAME"\\n' > mf.hob.out
+printf '1.0 1.5 a_1\\n2.0 2.0 b_1\\n3.0 %s c_1\\n' "$hk" >> mf.hob.out
+echo "Normal termination of simulation"
+"""
+
+
+class InowasFlopyEnsembleAdapterTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        with open(os.path.join(os.path.dirname(__file__), 'data/test_2.json')) as f:
+            self._data = json.load(f)['data']
+
+        exe_name = os.path.join(self._tmp_dir, 'mf2005.sh')
+        with open(exe_name, 'w') as f:
+            f.write(FAKE_MODFLOW)
+        os.chmod(exe_name, os.stat(exe_name).st_mode | stat.S_IEXEC)
+
+        self._data['mf']['mf']['modelname'] = 'mf'
+        self._data['mf']['mf']['exe_name'] = exe_name
+        self._data['mf']['mf']['model_ws'] = os.path.join(self._tmp_dir, 'ensemble')
+        self._data['mf']['lpf']['hk'] = 2.0
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def run_ensemble(self, members, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return InowasFlopyEnsembleAdapter('3.2.10', self._data, 'ensemble', members, processes=3, **kwargs)
+
+    def test_it_multiplies_the_parameters_test(self):
+        data = {
+            'lpf': {'hk': [[[1.0, 2.0]], [[3.0, 4.0]]], 'vka': [1.0, {'encoding': 'constant', 'value': 2.0}]},
+            'rch': {'rech': {'0': 0.001, '1': [[0.002, 0.003]]}}
+        }
+        varied = InowasFlopyEnsembleAdapter.apply_parameters(
+            data, {'lpf.hk': 2, 'lpf.vka': 3, 'rch.rech': 0.5, 'lpf.sy': 10}
+        )
+        np.testing.assert_array_equal(varied['lpf']['hk'], [[[2.0, 4.0]], [[6.0, 8.0]]])
+        np.testing.assert_array_equal(varied['lpf']['vka'], [3.0, 6.0])
+        self.assertEqual(varied['rch']['rech']['0'], 0.0005)
+        np.testing.assert_array_equal(varied['rch']['rech']['1'], [[0.001, 0.0015]])
+        # Keys without value are multiplied from the adapter defaults
+        self.assertAlmostEqual(varied['lpf']['sy'], 1.5)
+        self.assertEqual(data['lpf']['hk'], [[[1.0, 2.0]], [[3.0, 4.0]]])
+
+    def test_it_runs_the_members_in_parallel_on_shared_input_files_test(self):
+        members = [{'lpf.hk': 1.0}, {'lpf.hk': 2.0}, {'lpf.hk': 3.0, 'rch.rech': 0.5}]
+        # The members only terminate normally if all of them run at the same time
+        with open(os.path.join(self._tmp_dir, 'barrier'), 'w') as f:
+            f.write(str(len(members)))
+        ensemble = self.run_ensemble(members)
+        self.assertTrue(ensemble.success())
+
+        model_ws = self._data['mf']['mf']['model_ws']
+        shared_ws = os.path.join(model_ws, 'shared')
+        for member, parameters in enumerate(members):
+            member_ws = os.path.join(model_ws, 'members', str(member))
+            # Varied packages are written by the member, the others are linked from the shared folder
+            for file in ['mf.nam', 'mf.dis', 'mf.bas', 'mf.hob', 'mf.riv']:
+                self.assertTrue(os.path.samefile(os.path.join(member_ws, file), os.path.join(shared_ws, file)))
+            self.assertFalse(os.path.samefile(os.path.join(member_ws, 'mf.lpf'), os.path.join(shared_ws, 'mf.lpf')))
+            self.assertEqual('rch.rech' in parameters, not os.path.samefile(
+                os.path.join(member_ws, 'mf.rch'), os.path.join(shared_ws, 'mf.rch')))
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                model = flopy.modflow.Modflow.load('mf.nam', model_ws=member_ws, check=False,
+                                                   load_only=['dis', 'bas6', 'lpf'])
+            np.testing.assert_allclose(model.lpf.hk.array, 2.0 * parameters['lpf.hk'])
+
+        rows = ensemble.summary()
+        self.assertEqual([row['member'] for row in rows], [0, 1, 2])
+        self.assertEqual([row['parameters'] for row in rows], members)
+        self.assertEqual([row['n'] for row in rows], [3, 3, 3])
+        # The fake observation c is the hk of the member
+        self.assertEqual([round(row['rMax'], 6) for row in rows], [1.0, 1.0, 3.0])
+
+        with open(os.path.join(model_ws, 'ensemble_summary.csv')) as f:
+            table = list(csv.DictReader(f))
+        self.assertEqual([row['lpf.hk'] for row in table], ['1.0', '2.0', '3.0'])
+        self.assertEqual([row['rch.rech'] for row in table], ['', '', '0.5'])
+        with open(os.path.join(model_ws, 'ensemble_summary.json')) as f:
+            self.assertEqual(json.load(f), json.loads(json.dumps(rows)))
+
+    def test_it_cancels_the_members_test(self):
+        cancel_event = threading.Event()
+        cancel_event.set()
+        ensemble = self.run_ensemble([{'lpf.hk': 1.0}, {'lpf.hk': 2.0}], cancel_event=cancel_event)
+        self.assertTrue(ensemble.cancelled)
+        self.assertFalse(ensemble.success())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import unittest
+from time import monotonic, sleep
+from ...Calculation import ModelRunner
+
+
+class ModelRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def executable(self, script):
+        filename = os.path.join(self._tmp_dir, 'model.sh')
+        with open(filename, 'w') as f:
+            f.write('#!/bin/sh\n' + script + '\n')
+        os.chmod(filename, os.stat(filename).st_mode | stat.S_IEXEC)
+        return filename
+
+    def test_it_reports_normal_termination_test(self):
+        exe_name = self.executable('echo "Running"; echo "Normal termination of simulation"')
+        success, report = ModelRunner().run(exe_name, None, self._tmp_dir)
+        self.assertTrue(success)
+        self.assertEqual(report, ['Running', 'Normal termination of simulation'])
+
+    def test_it_stops_the_model_after_the_time_limit_test(self):
+        exe_name = self.executable('echo "Running"; sleep 30; echo "Normal termination of simulation"')
+        runner = ModelRunner(time_limit=0.5)
+        start = monotonic()
+        success, report = runner.run(exe_name, None, self._tmp_dir)
+        self.assertLess(monotonic() - start, 10)
+        self.assertFalse(success)
+        self.assertTrue(runner.timed_out)
+        self.assertEqual(report[-1], 'Model run aborted after the time limit of 0.5 seconds.')
+
+    def test_it_stops_the_model_after_the_cpu_time_limit_test(self):
+        exe_name = self.executable('echo "Running"; while :; do :; done')
+        runner = ModelRunner(cpu_time_limit=1, time_limit=30)
+        success, report = runner.run(exe_name, None, self._tmp_dir)
+        self.assertFalse(success)
+        self.assertFalse(runner.timed_out)
+        self.assertEqual(report, ['Running', 'Model run aborted after the CPU time limit of 1 seconds.'])
+
+    def test_it_stops_the_model_on_cancellation_test(self):
+        exe_name = self.executable('sleep 30')
+        cancel_event = threading.Event()
+        threading.Timer(0.5, cancel_event.set).start()
+        runner = ModelRunner(cancel_event=cancel_event)
+        success, report = runner.run(exe_name, None, self._tmp_dir)
+        self.assertFalse(success)
+        self.assertTrue(runner.cancelled)
+        self.assertEqual(report, ['Model run cancelled.'])
+
+    def test_it_kills_the_registered_models_test(self):
+        process_folder = os.path.join(self._tmp_dir, 'processes')
+        os.makedirs(process_folder)
+        os.environ[ModelRunner.process_folder_variable] = process_folder
+        self.addCleanup(os.environ.pop, ModelRunner.process_folder_variable)
+
+        exe_name = self.executable('echo "Running"; sleep 30; echo "Normal termination of simulation"')
+        result = []
+        thread = threading.Thread(target=lambda: result.append(ModelRunner().run(exe_name, None, self._tmp_dir)))
+        thread.start()
+        start = monotonic()
+        while not os.listdir(process_folder) and monotonic() - start < 10:
+            sleep(0.05)
+
+        self.assertEqual(ModelRunner.kill_registered(process_folder), 1)
+        thread.join()
+        self.assertLess(monotonic() - start, 10)
+        self.assertEqual(result, [(False, ['Running'])])
+        self.assertEqual(os.listdir(process_folder), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
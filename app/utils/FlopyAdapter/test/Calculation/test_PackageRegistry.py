@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import flopy
+
+from ...Calculation import InowasFlopyCalculationAdapter, PackageRegistry
+
+
+class PackageRegistryTest(unittest.TestCase):
+
+    def test_it_has_an_adapter_for_each_package_test(self):
+        adapter = InowasFlopyCalculationAdapter
+        names = adapter.mf_package_order + adapter.mt_package_order + adapter.swt_package_order + ['mp', 'mpbas', 'mpsim']
+        for name in names:
+            self.assertTrue(PackageRegistry.has(name), name)
+            self.assertTrue(hasattr(PackageRegistry.adapter(name), 'get_package'), name)
+
+        self.assertFalse(PackageRegistry.has('unknown'))
+        self.assertIs(PackageRegistry.adapter('BAS6'), PackageRegistry.adapter('bas'))
+
+    def test_it_creates_models_and_packages_test(self):
+        model = PackageRegistry.create('mf', {'modelname': 'mf', 'model_ws': '.'}, None)
+        self.assertIsInstance(model, flopy.modflow.Modflow)
+        self.assertIs(PackageRegistry.create('dis', {'nlay': 1, 'nrow': 2, 'ncol': 3}, model), model)
+        self.assertIs(PackageRegistry.create('lmt6', {}, model), model)
+        self.assertEqual(model.get_package_list(), ['DIS', 'LMT6'])
+
+        mt_model = PackageRegistry.create('mt', {'modelname': 'mt', 'model_ws': '.'}, model)
+        self.assertIsInstance(mt_model, flopy.mt3d.Mt3dms)
+
+    def test_it_imports_the_adapters_on_first_use_test(self):
+        app_folder = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+        code = '\n'.join([
+            'import sys',
+            'from utils.FlopyAdapter.Calculation import PackageRegistry',
+            'PackageRegistry.adapter("dis")',
+            'print(sorted(m for m in sys.modules if "Packages." in m or "Statistics." in m))',
+        ])
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=app_folder, check=True, stdout=subprocess.PIPE, universal_newlines=True
+        ).stdout
+        self.assertEqual(output.strip(), "['utils.FlopyAdapter.MfPackages.DisAdapter']")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import base64
+import os
+import shutil
+import tempfile
+import unittest
+
+import flopy
+import numpy as np
+
+from ...Encoding import ArrayEncoding
+from ...MfPackages import DisAdapter, LpfAdapter
+
+
+class ArrayEncodingTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        ArrayEncoding.npy_folder = self._tmp_dir
+
+    def tearDown(self):
+        ArrayEncoding.npy_folder = None
+        shutil.rmtree(self._tmp_dir)
+
+    @staticmethod
+    def base64(array):
+        return {
+            'encoding': 'base64',
+            'dtype': str(array.dtype),
+            'shape': list(array.shape),
+            'data': base64.b64encode(array.astype(array.dtype.newbyteorder('<')).tobytes()).decode('ascii')
+        }
+
+    def test_it_decodes_the_encodings_test(self):
+        self.assertEqual(ArrayEncoding.decode({'encoding': 'constant', 'value': 1.5}), 1.5)
+        np.testing.assert_array_equal(
+            ArrayEncoding.decode({'encoding': 'constant', 'value': 2, 'shape': [2, 3]}), np.full((2, 3), 2))
+
+        for dtype in [np.float32, np.float64, np.int32]:
+            array = np.arange(12, dtype=dtype).reshape((3, 4))
+            decoded = ArrayEncoding.decode(self.base64(array))
+            self.assertEqual(decoded.dtype, dtype)
+            np.testing.assert_array_equal(decoded, array)
+
+        array = np.random.default_rng(0).uniform(size=(2, 3, 4))
+        np.save(os.path.join(self._tmp_dir, 'hk.npy'), array)
+        np.testing.assert_array_equal(ArrayEncoding.decode({'encoding': 'npy', 'file': 'hk.npy'}), array)
+        np.testing.assert_array_equal(ArrayEncoding.decode({'encoding': 'npy', 'file': '/etc/../hk.npy'}), array)
+
+        layers = ArrayEncoding.decode([{'encoding': 'constant', 'value': 1}, self.base64(np.ones((3, 4)))])
+        self.assertEqual(layers[0], 1)
+        np.testing.assert_array_equal(layers[1], np.ones((3, 4)))
+
+        for value in [1, [[1, 2], [3, 4]], {'0': [[0, 1, 1, -100]]}, None, 'filename']:
+            self.assertEqual(ArrayEncoding.decode(value), value)
+
+        with self.assertRaises(ValueError):
+            ArrayEncoding.decode({'encoding': 'base64', 'dtype': 'object', 'shape': [1], 'data': ''})
+        with self.assertRaises(ValueError):
+            ArrayEncoding.decode({'encoding': 'gzip'})
+
+    def test_it_replaces_encoded_arrays_with_placeholders_test(self):
+        model_data = {
+            'packages': ['dis'],
+            'dis': {'nlay': 1, 'top': self.base64(np.full((3, 4), 7.5)), 'botm': [{'encoding': 'constant', 'value': 0}]}
+        }
+        self.assertEqual(ArrayEncoding.with_placeholders(model_data), {
+            'packages': ['dis'], 'dis': {'nlay': 1, 'top': 7.5, 'botm': [0]}
+        })
+        self.assertEqual(model_data['dis']['nlay'], 1)
+        self.assertTrue(ArrayEncoding.is_encoded(model_data['dis']['top']))
+
+        np.save(os.path.join(self._tmp_dir, 'rech.npy'), np.full((3, 4), 0.002))
+        rech = {'0': {'encoding': 'npy', 'file': 'rech.npy'}, '1': self.base64(np.arange(1, 13, dtype=np.int32))}
+        self.assertEqual(ArrayEncoding.placeholder(rech), {'0': 0.002, '1': 1})
+        with self.assertRaises(ValueError):
+            ArrayEncoding.placeholder({**self.base64(np.ones((3, 4))), 'shape': [3, 5]})
+
+    def test_it_decodes_arrays_by_stress_period_test(self):
+        rech = {'0': {'encoding': 'constant', 'value': 0.001}, '1': self.base64(np.full((2, 2), 0.5))}
+        decoded = ArrayEncoding.decode(rech)
+        self.assertEqual(decoded['0'], 0.001)
+        np.testing.assert_array_equal(decoded['1'], np.full((2, 2), 0.5))
+        self.assertEqual(ArrayEncoding.decode_to_list(rech), {'0': 0.001, '1': [[0.5, 0.5], [0.5, 0.5]]})
+
+    def test_the_adapters_create_packages_from_encoded_arrays_test(self):
+        top = np.random.default_rng(0).uniform(10, 20, (3, 4)).astype(np.float32)
+        hk = np.random.default_rng(1).uniform(1, 10, (2, 3, 4))
+        np.save(os.path.join(self._tmp_dir, 'hk.npy'), hk)
+
+        model = flopy.modflow.Modflow()
+        DisAdapter({
+            'nlay': 2, 'nrow': 3, 'ncol': 4, 'top': self.base64(top),
+            'botm': [{'encoding': 'constant', 'value': 5}, {'encoding': 'constant', 'value': 0}]
+        }).get_package(model)
+        LpfAdapter({'hk': {'encoding': 'npy', 'file': 'hk.npy'}, 'laytyp': [0, 0]}).get_package(model)
+
+        np.testing.assert_array_equal(model.dis.top.array, top)
+        np.testing.assert_array_equal(model.dis.botm.array[1], np.zeros((3, 4)))
+        np.testing.assert_allclose(model.lpf.hk.array, hk.astype(np.float32))
+
+
+if __name__ == '__main__':
+    unittest.main()
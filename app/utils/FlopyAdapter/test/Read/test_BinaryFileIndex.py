@@ -0,0 +1,98 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import flopy.utils.binaryfile as bf
+import numpy as np
+
+from ...Read import BinaryFileIndex, ReadConcentration, ReadDrawdown, ReadHead, ResultFileCache
+
+
+class BinaryFileIndexTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        dirname = os.path.join(os.path.dirname(__file__), 'data')
+        with open(os.path.join(dirname, 'test_read_head_example', 'RP1.hds'), 'rb') as f:
+            heads = f.read()
+        with open(os.path.join(self._tmp_dir, 'RP1.hds'), 'wb') as f:
+            f.write(heads)
+        with open(os.path.join(self._tmp_dir, 'RP1.ddn'), 'wb') as f:
+            f.write(heads.replace(b'            HEAD', b'        DRAWDOWN'))
+        self.write_ucn_file(os.path.join(self._tmp_dir, 'MT3D001.UCN'), nlay=2, nrow=3, ncol=4, ntimes=5)
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    @staticmethod
+    def write_ucn_file(filename, nlay, nrow, ncol, ntimes):
+        header_dtype = bf.BinaryHeader.set_dtype(bintype='Ucn', precision='single')
+        with open(filename, 'wb') as f:
+            for time in range(ntimes):
+                for layer in range(nlay):
+                    header = np.array([(time + 1, 1, 1, 10.0 * (time + 1), b'CONCENTRATION   ', ncol, nrow,
+                                        layer + 1)], dtype=header_dtype)
+                    f.write(header.tobytes())
+                    f.write(np.full((nrow, ncol), time + layer / 10, dtype=np.float32).tobytes())
+
+    def test_the_readers_return_the_same_data_from_the_index_test(self):
+        readers = [ReadHead(self._tmp_dir), ReadDrawdown(self._tmp_dir), ReadConcentration(self._tmp_dir)]
+
+        def read_all():
+            return [(
+                reader.read_times(), reader.read_idx(), reader.read_kstpkper(), reader.read_number_of_layers(),
+                reader.read_layer_by_idx(idx=1, layer=0), reader.read_layer_by_totim(totim=reader.read_times()[-1]),
+                reader.read_layer_by_kstpkper(kstpkper=reader.read_kstpkper()[-1], layer=0),
+                reader.read_ts(layer=0, row=1, column=2)
+            ) for reader in readers]
+
+        expected = read_all()
+        self.assertEqual(BinaryFileIndex.build(self._tmp_dir), ['MT3D001.UCN', 'RP1.ddn', 'RP1.hds'])
+        ResultFileCache.shared.clear()
+        for file in ['MT3D001.UCN', 'RP1.ddn', 'RP1.hds']:
+            self.assertTrue(os.path.isfile(os.path.join(self._tmp_dir, file + '.idx.npy')))
+        self.assertEqual(read_all(), expected)
+
+        filename = os.path.join(self._tmp_dir, 'RP1.hds')
+        heads = BinaryFileIndex.head_file(filename)
+        self.assertEqual(len(heads.get_times()), 24)
+        np.testing.assert_array_equal(heads.get_data(idx=5),
+                                      bf.HeadFile(filename, precision='single').get_data(idx=5))
+
+    def test_the_files_are_opened_without_reading_the_headers_test(self):
+        filename = os.path.join(self._tmp_dir, 'RP1.hds')
+        BinaryFileIndex.build(self._tmp_dir)
+
+        # Without index flopy reads the header of every record
+        reads = []
+        original_build_index = bf.BinaryLayerFile._build_index
+
+        def build_index(layer_file):
+            reads.append(layer_file.filename)
+            original_build_index(layer_file)
+
+        bf.BinaryLayerFile._build_index = build_index
+        try:
+            BinaryFileIndex.head_file(filename).get_times()
+            self.assertEqual(reads, [])
+
+            os.remove(filename + '.idx.npy')
+            BinaryFileIndex.head_file(filename).get_times()
+            self.assertEqual(reads, [filename])
+        finally:
+            bf.BinaryLayerFile._build_index = original_build_index
+
+    def test_an_outdated_index_is_ignored_test(self):
+        filename = os.path.join(self._tmp_dir, 'MT3D001.UCN')
+        BinaryFileIndex.build(self._tmp_dir)
+        self.assertIsNotNone(BinaryFileIndex.read(filename, np.float32))
+
+        # The file of a rerun with more time steps
+        self.write_ucn_file(filename, nlay=2, nrow=3, ncol=4, ntimes=7)
+        self.assertIsNone(BinaryFileIndex.read(filename, np.float32))
+        self.assertEqual(len(ReadConcentration(self._tmp_dir).read_times()), 7)
+        self.assertIsNone(BinaryFileIndex.read(os.path.join(self._tmp_dir, 'missing.hds'), np.float32))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import flopy.utils.binaryfile as bf
+import numpy as np
+
+from ...Read import BinaryFileIndex, CellMajorFile, MemmapLayerFile, ReadHead
+
+
+class CellMajorFileTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        self._filename = os.path.join(self._tmp_dir, 'mf.hds')
+        self.write_head_file(self._filename, nlay=3, nrow=5, ncol=4, ntimes=6)
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    @staticmethod
+    def write_head_file(filename, nlay, nrow, ncol, ntimes, layers=None):
+        header_dtype = bf.BinaryHeader.set_dtype(bintype='Head', precision='single')
+        rng = np.random.default_rng(1)
+        with open(filename, 'wb') as f:
+            for step in range(ntimes):
+                for layer in (layers if layers is not None else range(nlay)):
+                    header = np.array([(step + 1, 1, 1.0, 10.0 * (step + 1), b'            HEAD', ncol, nrow,
+                                        layer + 1)], dtype=header_dtype)
+                    f.write(header.tobytes())
+                    f.write(rng.random((nrow, ncol), dtype=np.float32).tobytes())
+
+    def open_file(self):
+        return MemmapLayerFile(BinaryFileIndex.head_file(self._filename))
+
+    def test_the_time_series_are_read_from_the_cell_major_copy_test(self):
+        cells = [(2, 4, 3), (0, 0, 0), (1, 2, 1), (2, 0, 3)]
+        expected = self.open_file().get_ts(cells)
+
+        block_bytes = CellMajorFile.block_bytes
+        CellMajorFile.block_bytes = 2 * 4 * 6 * 4
+        try:
+            self.assertEqual(CellMajorFile.build(self._tmp_dir), ['mf.hds'])
+        finally:
+            CellMajorFile.block_bytes = block_bytes
+
+        values = CellMajorFile.read(self._filename, (3, 5, 4, 6))
+        self.assertEqual(values.shape, (3, 5, 4, 6))
+        self.assertTrue(values[2, 4, 3].flags.c_contiguous)
+        np.testing.assert_array_equal(values[1, 2, 1], expected[:, 3])
+        np.testing.assert_array_equal(self.open_file().get_ts(cells), expected)
+        np.testing.assert_array_equal(self.open_file().get_ts(cells),
+                                      bf.HeadFile(self._filename, precision='single').get_ts(cells))
+        self.assertIsNone(CellMajorFile.read(self._filename, (3, 5, 4, 7)))
+
+        # Only the copy is read
+        time.sleep(0.01)
+        copy = np.load(self._filename + CellMajorFile.suffix, mmap_mode='r+')
+        copy[0, 0, 0] = -1
+        copy.flush()
+        del copy
+        self.assertEqual(list(self.open_file().get_ts((0, 0, 0))[:, 1]), [-1] * 6)
+
+    def test_layers_without_records_are_nan_test(self):
+        self.write_head_file(self._filename, nlay=3, nrow=5, ncol=4, ntimes=2, layers=[0, 2])
+        CellMajorFile.build(self._tmp_dir)
+        series = ReadHead(self._tmp_dir).read_ts_by_cells([(1, 0, 0), (2, 0, 0)])
+        self.assertTrue(all(np.isnan(row[1]) for row in series))
+        np.testing.assert_array_equal(
+            self.open_file().get_ts([(1, 0, 0), (2, 0, 0)]),
+            bf.HeadFile(self._filename, precision='single').get_ts([(1, 0, 0), (2, 0, 0)])
+        )
+
+    def test_only_files_with_many_times_are_copied_test(self):
+        self.assertEqual(CellMajorFile.build(self._tmp_dir, min_times=7), [])
+        self.assertFalse(os.path.exists(self._filename + CellMajorFile.suffix))
+        self.assertEqual(CellMajorFile.build(self._tmp_dir, min_times=6), ['mf.hds'])
+
+        # The file of a rerun
+        time.sleep(0.01)
+        self.write_head_file(self._filename, nlay=3, nrow=5, ncol=4, ntimes=6)
+        self.assertIsNone(CellMajorFile.read(self._filename, (3, 5, 4, 6)))
+
+
+if __name__ == '__main__':
+    unittest.main()
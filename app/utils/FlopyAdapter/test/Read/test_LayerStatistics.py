@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import flopy.utils.binaryfile as bf
+import numpy as np
+
+from ...Read import LayerStatistics, ReadDrawdown, ReadHead
+
+
+class LayerStatisticsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        self._filename = os.path.join(self._tmp_dir, 'mf.hds')
+        self.write_file(self._filename, 'Head', b'            HEAD')
+        self.write_file(os.path.join(self._tmp_dir, 'mf.ddn'), 'Head', b'        DRAWDOWN')
+        self.write_file(os.path.join(self._tmp_dir, 'MT3D001.UCN'), 'Ucn', b'CONCENTRATION   ')
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    @staticmethod
+    def layer(time, layer, bintype):
+        data = np.arange(12, dtype=np.float32).reshape(3, 4) + 100 * time + 10 * layer
+        data[0, 0] = 1e30 if bintype == 'Ucn' else -1e30
+        if layer == 1 and time == 1:
+            # A layer without valid cells
+            data[:, :] = data[0, 0]
+        return data
+
+    def write_file(self, filename, bintype, text, nlay=2, ntimes=3):
+        header_dtype = bf.BinaryHeader.set_dtype(bintype=bintype, precision='single')
+        with open(filename, 'wb') as f:
+            for step in range(ntimes):
+                for layer in range(nlay):
+                    kstp = (step + 1, 1, 1) if bintype == 'Ucn' else (step + 1, 1, 1.0)
+                    header = np.array([kstp + (10.0 * (step + 1), text, 4, 3, layer + 1)], dtype=header_dtype)
+                    f.write(header.tobytes())
+                    f.write(self.layer(step, layer, bintype).tobytes())
+
+    def test_it_computes_the_statistics_of_every_layer_and_time_test(self):
+        self.assertEqual(LayerStatistics.build(self._tmp_dir), ['MT3D001.UCN', 'mf.ddn', 'mf.hds'])
+
+        for file, bintype in [('mf.hds', 'Head'), ('MT3D001.UCN', 'Ucn')]:
+            statistics = LayerStatistics.read(os.path.join(self._tmp_dir, file))
+            self.assertEqual(len(statistics), 6)
+            self.assertEqual(list(statistics['idx']), [0, 0, 1, 1, 2, 2])
+            self.assertEqual(list(statistics['layer']), [0, 1, 0, 1, 0, 1])
+            self.assertEqual(list(statistics['totim']), [10.0, 10.0, 20.0, 20.0, 30.0, 30.0])
+            for row in statistics:
+                valid = self.layer(row['idx'], row['layer'], bintype).ravel()[1:]
+                if row['idx'] == 1 and row['layer'] == 1:
+                    self.assertEqual(row['count'], 0)
+                    self.assertTrue(np.isnan(row['min']) and np.isnan(row['max']) and np.isnan(row['mean']))
+                    continue
+                self.assertEqual(row['count'], 11)
+                self.assertEqual((row['min'], row['max']), (valid.min(), valid.max()))
+                self.assertAlmostEqual(row['mean'], valid.mean(), places=5)
+
+    def test_the_readers_use_the_statistics_for_the_color_range_test(self):
+        readers = [ReadHead(self._tmp_dir), ReadDrawdown(self._tmp_dir)]
+        expected = [[reader.read_min_max_by_idx(idx) for idx in range(3)] for reader in readers]
+        self.assertEqual(expected[0], [[1.0, 21.0], [101.0, 111.0], [201.0, 221.0]])
+
+        LayerStatistics.build(self._tmp_dir)
+        self.assertEqual(LayerStatistics.min_max(self._filename, 2), [201.0, 221.0])
+        self.assertEqual([[reader.read_min_max_by_idx(idx) for idx in range(3)] for reader in readers], expected)
+        self.assertIsNone(LayerStatistics.min_max(self._filename, 3))
+
+    def test_outdated_statistics_are_ignored_test(self):
+        LayerStatistics.build(self._tmp_dir)
+        self.assertIsNotNone(LayerStatistics.read(self._filename))
+
+        # The file of a rerun
+        time.sleep(0.01)
+        self.write_file(self._filename, 'Head', b'            HEAD', ntimes=4)
+        self.assertIsNone(LayerStatistics.read(self._filename))
+        self.assertIsNone(LayerStatistics.min_max(self._filename, 0))
+        self.assertEqual(ReadHead(self._tmp_dir).read_min_max_by_idx(3), [301.0, 321.0])
+        self.assertIsNone(LayerStatistics.read(os.path.join(self._tmp_dir, 'missing.hds')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import flopy.utils.binaryfile as bf
+import numpy as np
+
+from ...Read import BinaryFileIndex, MemmapLayerFile, ReadHead
+
+
+class MemmapLayerFileTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        self._filename = os.path.join(self._tmp_dir, 'mf.hds')
+        self.write_head_file(self._filename, nlay=3, nrow=4, ncol=5, ntimes=4)
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    @staticmethod
+    def write_head_file(filename, nlay, nrow, ncol, ntimes, layers=None):
+        header_dtype = bf.BinaryHeader.set_dtype(bintype='Head', precision='single')
+        with open(filename, 'wb') as f:
+            for time in range(ntimes):
+                for layer in (layers if layers is not None else range(nlay)):
+                    header = np.array([(time + 1, 1, 1.0, 10.0 * (time + 1), b'            HEAD', ncol, nrow,
+                                        layer + 1)], dtype=header_dtype)
+                    f.write(header.tobytes())
+                    data = np.arange(nrow * ncol, dtype=np.float32).reshape(nrow, ncol) + 100 * time + 10 * layer
+                    data[0, 0] = -1e30
+                    f.write(data.tobytes())
+
+    def test_it_returns_the_data_of_flopy_as_views_test(self):
+        heads = bf.HeadFile(self._filename, precision='single')
+        memmap = MemmapLayerFile(BinaryFileIndex.head_file(self._filename))
+
+        for time, totim in enumerate(heads.get_times()):
+            data = memmap.get_data(totim=totim)
+            np.testing.assert_array_equal(data, heads.get_data(totim=totim))
+            self.assertFalse(data.flags.owndata)
+            self.assertFalse(data.flags.writeable)
+            np.testing.assert_array_equal(memmap.get_data(idx=time), data)
+            np.testing.assert_array_equal(memmap.get_data(kstpkper=(time, 0)), data)
+
+            for layer in range(3):
+                layer_data = memmap.get_data(idx=time, mflay=layer)
+                np.testing.assert_array_equal(layer_data, heads.get_data(totim=totim, mflay=layer))
+                self.assertFalse(layer_data.flags.owndata)
+
+        np.testing.assert_array_equal(memmap.get_data(), heads.get_data())
+        np.testing.assert_array_equal(memmap.get_ts((2, 3, 4)), heads.get_ts((2, 3, 4)))
+        np.testing.assert_array_equal(memmap.get_ts([(0, 0, 0), (1, 2, 3)]), heads.get_ts([(0, 0, 0), (1, 2, 3)]))
+        cells = [(2, 0, 1), (0, 0, 0), (2, 3, 4), (1, 2, 3), (2, 0, 1)]
+        np.testing.assert_array_equal(memmap.get_ts(cells), heads.get_ts(cells))
+        self.assertRaises(Exception, memmap.get_ts, (3, 0, 0))
+        self.assertRaises(IndexError, memmap.get_data, idx=0, mflay=3)
+        self.assertRaises(Exception, memmap.get_data, kstpkper=(9, 0))
+
+    def test_it_returns_nan_for_layers_without_records_test(self):
+        self.write_head_file(self._filename, nlay=3, nrow=4, ncol=5, ntimes=2, layers=[0, 2])
+        memmap = MemmapLayerFile(BinaryFileIndex.head_file(self._filename))
+
+        data = memmap.get_data(idx=1)
+        self.assertEqual(data.shape, (3, 4, 5))
+        self.assertTrue(np.all(np.isnan(data[1])))
+        self.assertTrue(np.all(np.isnan(memmap.get_data(idx=1, mflay=1))))
+        heads = bf.HeadFile(self._filename, precision='single')
+        np.testing.assert_array_equal(data, heads.get_data(totim=20.0))
+        np.testing.assert_array_equal(memmap.get_ts([(1, 0, 1), (2, 0, 1)]), heads.get_ts([(1, 0, 1), (2, 0, 1)]))
+
+    def test_it_selects_the_times_of_the_readers_by_index_test(self):
+        rh = ReadHead(self._tmp_dir)
+        for idx, totim in enumerate(rh.read_times()):
+            self.assertEqual(rh.read_layer_by_idx(idx=idx, layer=2), rh.read_layer_by_totim(totim=totim, layer=2))
+
+        layer = rh.read_layer_array(idx=3, layer=1)
+        self.assertTrue(np.isnan(layer[0, 0]))
+        self.assertEqual(layer[3, 4], 300 + 10 + 19)
+        self.assertEqual(rh.read_min_max_by_idx(idx=3), [301.0, 339.0])
+        self.assertEqual(rh.read_data().shape, (3, 4, 5))
+
+        cells = [(2, 3, 4), (0, 0, 0), (1, 1, 1)]
+        series = rh.read_ts_by_cells(cells)
+        self.assertEqual(len(series), 4)
+        self.assertEqual(series[0], [10.0, 39.0, None, 16.0])
+        for column, cell in enumerate(cells, start=1):
+            self.assertEqual([[row[0], row[column]] for row in series], rh.read_ts(*cell))
+        self.assertEqual(rh.read_ts_by_cells([(0, 0, 0), (0, 4, 0)]), [])
+        self.assertEqual(rh.read_data()[2, 3, 4], 339.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 import os
 import unittest
+
+import numpy as np
+
 from ...Read import ReadHead
 
 
@@ -63,6 +66,18 @@ class ReadHeadTest(unittest.TestCase):
             self.assertEqual(data_totim, rh.read_layer_by_idx(idx=idx))
             self.assertEqual(data_totim, rh.read_layer_by_kstpkper(rh.read_kstpkper()[idx]))
 
+    def test_it_reads_the_heads_of_all_layers_test(self):
+        dirname = os.path.dirname(__file__)
+        rh = ReadHead(os.path.join(dirname, 'data/test_read_head_example'))
+
+        steady = rh.read_data((0, 0))
+        self.assertEqual(steady.shape, (1, 6, 11))
+        self.assertEqual([round(float(value), 2) for value in steady[0][0]], rh.read_layer_by_idx(idx=0)[0])
+
+        final = rh.read_data()
+        self.assertEqual([round(float(value), 2) for value in final[0][0]], rh.read_layer_by_idx(idx=23)[0])
+        self.assertIsNone(rh.read_data((0, 99)))
+
     def test_it_reads_the_timeseries_by_layer_row_column_test(self):
         dirname = os.path.dirname(__file__)
         rh = ReadHead(os.path.join(dirname, 'data/test_read_head_example'))
@@ -75,6 +90,17 @@ class ReadHeadTest(unittest.TestCase):
                           [151.0, 450.0]]
                          )
 
+    def test_it_rounds_the_layers_and_replaces_dry_cells_with_none_test(self):
+        data = np.array([[0.125, 2.675, -999.004, -999.006], [450.14, -1e30, np.nan, 1.005]], dtype=np.float32)
+        expected = [[round(float(value), 2) for value in row] for row in data]
+        expected[0][3] = expected[1][1] = None
+
+        layer = ReadHead.layer_to_list(data)
+        self.assertEqual(layer[0], expected[0])
+        self.assertEqual(layer[1][:2] + layer[1][3:], expected[1][:2] + expected[1][3:])
+        self.assertTrue(np.isnan(layer[1][2]))
+        self.assertEqual([type(value) for value in layer[0]], [float, float, float, type(None)])
+
 
 if __name__ == "__main__":
     unittest.main()
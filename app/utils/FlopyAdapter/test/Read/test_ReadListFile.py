@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ...Read import ReadListFile
+
+
+class ReadListFileTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def write_list_file(self, name, content):
+        with open(os.path.join(self._tmp_dir, name), 'w') as f:
+            f.write(content)
+
+    def test_it_reads_the_pcg_iterations_test(self):
+        self.write_list_file('mf.list', '\n'.join([
+            '     5 CALLS TO PCG ROUTINE FOR TIME STEP   1 IN STRESS PERIOD    1',
+            '    18 TOTAL ITERATIONS',
+            '     3 CALLS TO PCG ROUTINE FOR TIME STEP   2 IN STRESS PERIOD    1',
+            '     7 TOTAL ITERATIONS',
+        ]))
+        self.assertEqual(ReadListFile(self._tmp_dir).read_iterations(), {'outer': 8, 'inner': 25})
+        self.assertEqual(ReadListFile(self._tmp_dir, 'mf').read_iterations(), {'outer': 8, 'inner': 25})
+
+    def test_it_reads_the_nwt_iterations_test(self):
+        self.write_list_file('swt.list', '\n'.join([
+            ' ------------------------------------------------',
+            '      NWT REQUIRED          12 OUTER ITERATIONS ',
+            '      AND A TOTAL OF        40 INNER ITERATIONS.',
+            ' ------------------------------------------------',
+        ]))
+        self.assertEqual(ReadListFile(self._tmp_dir, 'swt').read_iterations(), {'outer': 12, 'inner': 40})
+
+    def test_it_returns_none_without_solver_output_test(self):
+        dirname = os.path.dirname(__file__)
+        self.assertIsNone(ReadListFile(os.path.join(dirname, 'data/test_read_head_example')).read_iterations())
+        self.assertIsNone(ReadListFile(self._tmp_dir, 'mf').read_iterations())
+
+    def test_it_reads_the_convergence_of_the_time_steps_test(self):
+        self.write_list_file('mf.list', '\n'.join([
+            '     3 CALLS TO PCG ROUTINE FOR TIME STEP   1 IN STRESS PERIOD    1',
+            '    14 TOTAL ITERATIONS',
+            '',
+            ' MAXIMUM HEAD CHANGE FOR EACH ITERATION:',
+            '',
+            '    HEAD CHANGE   LAYER,ROW,COL    HEAD CHANGE   LAYER,ROW,COL    HEAD CHANGE   LAYER,ROW,COL',
+            ' ------------------------------------------------------------------------------------------',
+            '      -12.35      (  1,  5,  3)    0.2054     (  1,  6,  9)   -0.3125E-02 (  2,  1,  1)',
+            '',
+            ' MAXIMUM RESIDUAL FOR EACH ITERATION:',
+            '',
+            '      1234.5      (  1,  5,  3)    12.054     (  1,  6,  9)    0.1250     (  2,  1,  1)',
+            '',
+            ' HEAD WILL BE SAVED ON UNIT   51 AT END OF TIME STEP    1, STRESS PERIOD    1',
+            '  VOLUMETRIC BUDGET FOR ENTIRE MODEL AT END OF TIME STEP    1, STRESS PERIOD   1',
+            ' PERCENT DISCREPANCY =           0.01     PERCENT DISCREPANCY =          -0.25',
+            '         TIME SUMMARY AT END OF TIME STEP    1 IN STRESS PERIOD    1',
+            '    50 CALLS TO PCG ROUTINE FOR TIME STEP   2 IN STRESS PERIOD    1',
+            '  1500 TOTAL ITERATIONS',
+            ' FAILURE TO MEET SOLVER CONVERGENCE CRITERIA',
+            ' HEAD WILL BE SAVED ON UNIT   51 AT END OF TIME STEP    2, STRESS PERIOD    1',
+            ' HEAD WILL BE SAVED ON UNIT   51 AT END OF TIME STEP    1, STRESS PERIOD    2',
+            ' Elapsed run time:  1 Minutes,  3.500 Seconds',
+        ]))
+        convergence = ReadListFile(self._tmp_dir, 'mf').read_convergence()
+        self.assertEqual(convergence['steps'], [
+            {'kper': 0, 'kstp': 0, 'outer': 3, 'inner': 14, 'max_head_change': -0.003125,
+             'percent_discrepancy': {'cumulative': 0.01, 'rate': -0.25}, 'converged': True},
+            {'kper': 0, 'kstp': 1, 'outer': 50, 'inner': 1500, 'max_head_change': None,
+             'percent_discrepancy': None, 'converged': False},
+        ])
+        self.assertEqual(convergence['summary'], {
+            'outer': 53, 'inner': 1514, 'max_outer': 50, 'max_head_change': 0.003125,
+            'max_percent_discrepancy': 0.25, 'failed_time_steps': 1, 'elapsed': 63.5
+        })
+
+    def test_it_assigns_the_nwt_iterations_to_the_following_time_step_test(self):
+        self.write_list_file('mf.list', '\n'.join([
+            '      NWT REQUIRED          12 OUTER ITERATIONS ',
+            '      AND A TOTAL OF        40 INNER ITERATIONS.',
+            ' HEAD WILL BE SAVED ON UNIT   51 AT END OF TIME STEP    1, STRESS PERIOD    1',
+            '      NWT REQUIRED           2 OUTER ITERATIONS ',
+            '      AND A TOTAL OF         5 INNER ITERATIONS.',
+            ' HEAD WILL BE SAVED ON UNIT   51 AT END OF TIME STEP    1, STRESS PERIOD    2',
+        ]))
+        steps = ReadListFile(self._tmp_dir, 'mf').read_convergence()['steps']
+        self.assertEqual([(step['kper'], step['kstp'], step['outer'], step['inner']) for step in steps],
+                         [(0, 0, 12, 40), (1, 0, 2, 5)])
+
+    def test_it_reads_the_convergence_without_solver_output_test(self):
+        dirname = os.path.dirname(__file__)
+        convergence = ReadListFile(os.path.join(dirname, 'data/test_read_head_example')).read_convergence()
+        self.assertEqual(len(convergence['steps']), 6)
+        self.assertEqual(convergence['summary']['max_percent_discrepancy'], 0.0)
+        self.assertIsNone(convergence['summary']['outer'])
+        self.assertIsNone(ReadListFile(self._tmp_dir, 'mf').read_convergence())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from ...Read import ReadBudget, ReadHead, ResultFileCache
+
+
+class ResultFileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+        self._opened = []
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def write_file(self, name, size):
+        filename = os.path.join(self._tmp_dir, name)
+        with open(filename, 'wb') as f:
+            f.write(b'0' * size)
+        return filename
+
+    def open_file(self, filename):
+        self._opened.append(filename)
+        return np.zeros(os.path.getsize(filename), dtype=np.uint8)
+
+    def test_it_opens_the_files_once_until_they_change_test(self):
+        cache = ResultFileCache()
+        filename = self.write_file('mf.hds', 100)
+
+        first = cache.get(filename, self.open_file)
+        self.assertIs(cache.get(filename, self.open_file), first)
+        self.assertEqual((cache.hits, cache.misses, len(cache), cache.bytes), (1, 1, 1, 100))
+
+        # The file of a rerun replaces the outdated entry
+        self.write_file('mf.hds', 200)
+        self.assertEqual(len(cache.get(filename, self.open_file)), 200)
+        self.assertEqual((cache.hits, cache.misses, len(cache), cache.bytes), (1, 2, 1, 200))
+        self.assertEqual(self._opened, [filename, filename])
+
+        os.remove(filename)
+        self.assertRaises(OSError, cache.get, filename, self.open_file)
+
+    def test_it_evicts_the_least_recently_used_files_test(self):
+        cache = ResultFileCache(max_bytes=250, max_entries=10)
+        files = [self.write_file('{}.hds'.format(i), 100) for i in range(3)]
+
+        cache.get(files[0], self.open_file)
+        cache.get(files[1], self.open_file)
+        cache.get(files[0], self.open_file)
+        cache.get(files[2], self.open_file)
+        self.assertEqual((len(cache), cache.bytes, cache.evictions), (2, 200, 1))
+
+        cache.get(files[0], self.open_file)
+        cache.get(files[1], self.open_file)
+        self.assertEqual(self._opened, [files[0], files[1], files[2], files[1]])
+
+        # Files larger than the budget are not cached
+        large = self.write_file('large.hds', 300)
+        cache.get(large, self.open_file)
+        cache.get(large, self.open_file)
+        self.assertEqual(self._opened[-2:], [large, large])
+
+        cache = ResultFileCache(max_bytes=1000, max_entries=1)
+        cache.get(files[0], self.open_file)
+        cache.get(files[1], self.open_file)
+        self.assertEqual(len(cache), 1)
+
+    def test_the_readers_share_the_opened_files_test(self):
+        dirname = os.path.join(os.path.dirname(__file__), 'data', 'test_read_head_example')
+        ResultFileCache.shared.clear()
+        hits, misses = ResultFileCache.shared.hits, ResultFileCache.shared.misses
+
+        heads = ReadHead(dirname)
+        times = heads.read_times()
+        nlay = heads.read_number_of_layers()
+        layer = heads.read_layer_by_idx(idx=len(times) - 1)
+        ReadHead(dirname).read_min_max_by_idx(idx=len(times) - 1)
+        ReadBudget(dirname).read_times()
+        ReadBudget(dirname).read_budget_by_idx(idx=0)
+
+        self.assertEqual((nlay, len(layer)), (1, 6))
+        self.assertEqual(ResultFileCache.shared.misses - misses, 2)
+        self.assertEqual(ResultFileCache.shared.hits - hits, 4)
+        self.assertGreater(ResultFileCache.shared.bytes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Wakeup channel between the app and the worker.
+
+The app writes one byte into a named pipe for every queued calculation.
+Idle worker slots block on the pipe and claim the new job right away.
+Polling the database remains as fallback, e.g. if the pipe is missing
+or the app runs on a different host.
+"""
+import os
+import select
+import stat
+from time import sleep
+
+WAKEUP_FIFO = '/db/worker.fifo'
+
+
+def open_channel(path=WAKEUP_FIFO):
+    try:
+        os.mkfifo(path)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+
+    if not stat.S_ISFIFO(os.stat(path).st_mode):
+        return None
+
+    # Opening the pipe read-write keeps a writer attached, so it never signals EOF
+    return os.open(path, os.O_RDWR | os.O_NONBLOCK)
+
+
+def wait(channel, timeout):
+    """
+    Blocks until a wakeup arrives or the timeout (seconds) expires.
+    Returns True if woken up by the app.
+    """
+    if channel is None:
+        sleep(timeout)
+        return False
+
+    readable, _, _ = select.select([channel], [], [], timeout)
+    if not readable:
+        return False
+
+    try:
+        os.read(channel, 1)
+    except BlockingIOError:
+        # Another worker slot consumed the wakeup
+        return False
+
+    return True
+
+
+def notify(path=WAKEUP_FIFO):
+    try:
+        channel = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+    except OSError:
+        # No pipe or no worker listening, the worker falls back to polling
+        return False
+
+    try:
+        os.write(channel, b'1')
+    except BlockingIOError:
+        # The pipe is full, enough wakeups are pending
+        pass
+    finally:
+        os.close(channel)
+
+    return True
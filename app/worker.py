@@ -2,40 +2,209 @@ import os
 from datetime import datetime
 import json
 import logging
+import multiprocessing
+import multiprocessing.connection
+import shutil
+import signal
+import socket
 import sqlite3 as sql
+import tempfile
+import threading
 import traceback
-from time import sleep
+import uuid
+from datetime import timedelta
+from time import monotonic
+
+import configuration
+import db
+import deduplication
+import ensemble
+import scheduler
+import wakeup
+from utils.FlopyAdapter.Calculation import IncrementalWriter, InowasFlopyCalculationAdapter, \
+    InowasFlopyEnsembleAdapter, ModelRunner
+from utils.FlopyAdapter.Encoding import ArrayEncoding
+from utils.FlopyAdapter.Read import BinaryFileIndex, CellMajorFile, LayerStatistics, ReadHead, ReadListFile
 
-from utils.FlopyAdapter.Calculation import InowasFlopyCalculationAdapter
-
-DB_LOCATION = '/db/modflow.db'
 MODFLOW_FOLDER = '/modflow'
-
-
-def db_connect():
-    return sql.connect(DB_LOCATION)
-
-
-def db_init():
-    conn = db_connect()
-    conn.execute(
-        'CREATE TABLE IF NOT EXISTS calculations (id INTEGER PRIMARY KEY AUTOINCREMENT, calculation_id TEXT, state INTEGER, message TEXT, created_at DATE, updated_at DATE)'
+WORKER_SLOTS = int(os.environ.get('WORKER_SLOTS', 1))
+WORKER_POLL_INTERVAL = float(os.environ.get('WORKER_POLL_INTERVAL', 10))
+WORKER_LEASE_DURATION = float(os.environ.get('WORKER_LEASE_DURATION', 120))
+WORKER_HEARTBEAT_INTERVAL = WORKER_LEASE_DURATION / 4
+WORKER_MAX_ATTEMPTS = int(os.environ.get('WORKER_MAX_ATTEMPTS', 3))
+WORKER_CANCEL_CHECK_INTERVAL = float(os.environ.get('WORKER_CANCEL_CHECK_INTERVAL', 2))
+# Seconds a stopping worker waits for the database, a transaction of the interrupted thread may hold the lock
+WORKER_RELEASE_TIMEOUT = float(os.environ.get('WORKER_RELEASE_TIMEOUT', 5))
+
+# Default limits in seconds for all model runs of a calculation, 0 means unlimited.
+# Calculations can override them with time_limit and cpu_time_limit in the configuration.
+CALCULATION_TIME_LIMIT = float(os.environ.get('CALCULATION_TIME_LIMIT', 0))
+CALCULATION_CPU_TIME_LIMIT = float(os.environ.get('CALCULATION_CPU_TIME_LIMIT', 0))
+
+# Default for writing arrays with at least BINARY_ARRAY_THRESHOLD values as external binary files.
+# Calculations can override them with binary_arrays and binary_array_threshold in the configuration.
+BINARY_ARRAYS = os.environ.get('BINARY_ARRAYS', 'false').lower() in ['1', 'true', 'yes']
+BINARY_ARRAY_THRESHOLD = int(os.environ.get('BINARY_ARRAY_THRESHOLD', 10000))
+
+# Local folder, e.g. a tmpfs, the models are written and run in before their files are moved
+# into the MODFLOW_FOLDER in one pass. Empty runs the models directly in the MODFLOW_FOLDER.
+WORKER_SCRATCH_FOLDER = os.environ.get('WORKER_SCRATCH_FOLDER', '')
+
+# Cell-major copies of the binary output files with at least CELL_MAJOR_TIME_STEPS saved times
+# for fast time series, 0 disables them. Calculations can force or disable them with cell_major_results.
+CELL_MAJOR_TIME_STEPS = int(os.environ.get('CELL_MAJOR_TIME_STEPS', 1000))
+
+# Processes running the members of an ensemble, 0 means one per CPU
+ENSEMBLE_PROCESSES = int(os.environ.get('ENSEMBLE_PROCESSES', 0))
+
+# Solver packages of the Modflow models, the solver labels the convergence metrics
+SOLVER_PACKAGES = ['pcg', 'pcgn', 'nwt', 'sip', 'de4', 'gmg', 'sor']
+
+
+def new_worker_id():
+    return '{}-{}-{}'.format(socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8])
+
+
+# noinspection SqlResolve
+def claim_next_calculation_job(worker_id):
+    """
+    Claims the next queued calculation in scheduler order for the given worker.
+    The job is selected and claimed in one immediate transaction, so concurrent workers
+    can never take the same job. Returns the claimed row, None if the queue is empty.
+    """
+    conn = db.connect()
+    now = datetime.now()
+    with conn:
+        conn.execute('BEGIN IMMEDIATE')
+        row = conn.execute(
+            'SELECT id, calculation_id FROM calculations queued WHERE state = 0 ORDER BY {} LIMIT 1'.format(
+                scheduler.CLAIM_ORDER),
+            {'now': now, 'aging': scheduler.SCHEDULER_AGING}
+        ).fetchone()
+        if row is None:
+            return None
+
+        cursor = conn.execute(
+            'UPDATE calculations SET state = 100, worker_id = :worker_id, updated_at = :now, '
+            'heartbeat_at = :now, lease_expires_at = :lease_expires_at, attempts = COALESCE(attempts, 0) + 1 '
+            'WHERE id = :id AND state = 0',
+            {'worker_id': worker_id, 'now': now, 'lease_expires_at': now + timedelta(seconds=WORKER_LEASE_DURATION),
+             'id': row['id']}
+        )
+    return row if cursor.rowcount == 1 else None
+
+
+# noinspection SqlResolve
+def renew_lease(idx, worker_id):
+    """
+    Extends the lease of a running calculation.
+    Returns False if the calculation is not leased by this worker anymore.
+    """
+    conn = db.connect()
+    now = datetime.now()
+    with conn:
+        cursor = conn.execute(
+            'UPDATE calculations SET heartbeat_at = ?, lease_expires_at = ? WHERE id = ? AND worker_id = ? AND state = ?',
+            (now, now + timedelta(seconds=WORKER_LEASE_DURATION), idx, worker_id, 100)
+        )
+    return cursor.rowcount == 1
+
+
+# noinspection SqlResolve
+def is_leased(idx, worker_id):
+    cursor = db.connect().execute(
+        'SELECT Count() FROM calculations WHERE id = ? AND worker_id = ? AND state = ?', (idx, worker_id, 100)
     )
-
-
-def get_next_new_calculation_job():
-    conn = db_connect()
-    conn.row_factory = sql.Row
-    cursor = conn.cursor()
-
-    cursor.execute('SELECT id, calculation_id FROM calculations WHERE state = ? ORDER BY id LIMIT ?', (0, 1))
-    return cursor.fetchone()
-
-
-def read_json(file):
-    with open(file) as filedata:
-        data = json.loads(filedata.read())
-    return data
+    return cursor.fetchone()[0] == 1
+
+
+def start_heartbeat(idx, worker_id, cancelled):
+    """
+    Renews the lease in a background thread until the returned event is set.
+    If the calculation was cancelled or the lease was lost, the cancelled event is set.
+    """
+    stopped = threading.Event()
+
+    def beat():
+        last_renewal = monotonic()
+        while not stopped.wait(WORKER_CANCEL_CHECK_INTERVAL):
+            if monotonic() - last_renewal >= WORKER_HEARTBEAT_INTERVAL:
+                leased = renew_lease(idx, worker_id)
+                last_renewal = monotonic()
+            else:
+                leased = is_leased(idx, worker_id)
+
+            if not leased:
+                print('Worker {} lost the lease of calculation {}, stopping it.'.format(worker_id, idx))
+                cancelled.set()
+                return
+
+    threading.Thread(target=beat, name='heartbeat-{}'.format(idx), daemon=True).start()
+    return stopped
+
+
+# noinspection SqlResolve
+def reap_expired_leases():
+    """
+    Requeues running calculations whose worker stopped sending heartbeats.
+    Calculations which already used up all attempts fail with state 500.
+    """
+    conn = db.connect()
+    now = datetime.now()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        rows = conn.execute(
+            'SELECT id, calculation_id, attempts FROM calculations WHERE state = ? AND '
+            '(lease_expires_at < ? OR (lease_expires_at IS NULL AND updated_at < ?))',
+            (100, now, now - timedelta(seconds=WORKER_LEASE_DURATION))
+        ).fetchall()
+
+        for row in rows:
+            if (row['attempts'] or 0) >= WORKER_MAX_ATTEMPTS:
+                state, message = 500, 'Worker lease expired {} times, calculation aborted.'.format(row['attempts'])
+            else:
+                state, message = 0, 'Worker lease expired, calculation requeued.'
+
+            conn.execute(
+                'UPDATE calculations SET state = ?, message = ?, worker_id = NULL, lease_expires_at = NULL, '
+                'updated_at = ? WHERE id = ?',
+                (state, message, now, row['id'])
+            )
+            print('Calculation {}: {}'.format(row['calculation_id'], message))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    for row in rows:
+        target_directory = os.path.join(MODFLOW_FOLDER, row['calculation_id'])
+        if os.path.isdir(target_directory):
+            write_state(target_directory, 500 if (row['attempts'] or 0) >= WORKER_MAX_ATTEMPTS else 0)
+
+    return len(rows)
+
+
+# noinspection SqlResolve
+def release_calculation_jobs(worker_id, conn=None):
+    """
+    Puts the running calculations of a stopping worker back into the queue,
+    without counting the attempt.
+    """
+    conn = conn or db.connect()
+    with conn:
+        rows = conn.execute(
+            'SELECT calculation_id FROM calculations WHERE state = ? AND worker_id = ?', (100, worker_id)
+        ).fetchall()
+        conn.execute(
+            'UPDATE calculations SET state = ?, worker_id = NULL, lease_expires_at = NULL, '
+            'attempts = MAX(COALESCE(attempts, 1) - 1, 0), updated_at = ? WHERE state = ? AND worker_id = ?',
+            (0, datetime.now(), 100, worker_id)
+        )
+
+    for row in rows:
+        target_directory = os.path.join(MODFLOW_FOLDER, row['calculation_id'])
+        if os.path.isdir(target_directory):
+            write_state(target_directory, 0)
 
 
 def write_state(target_directory, state):
@@ -45,6 +214,17 @@ def write_state(target_directory, state):
     f.close()
 
 
+# noinspection SqlResolve
+def save_timings(idx, timings, convergence=None):
+    conn = db.connect()
+    with conn:
+        conn.execute(
+            'UPDATE calculations SET timings = ?, convergence = ?, '
+            'timings_id = (SELECT COALESCE(MAX(timings_id), 0) + 1 FROM calculations) WHERE id = ?',
+            (json.dumps(timings), json.dumps(convergence) if convergence is not None else None, idx)
+        )
+
+
 def model_check(target_directory, flopy):
     file = os.path.join(target_directory, 'check.log')
     f = open(file, "w")
@@ -52,7 +232,140 @@ def model_check(target_directory, flopy):
     f.close()
 
 
-def calculate(idx, calculation_id, logger):
+def read_warm_start_heads(content, logger):
+    """
+    Heads of the finished calculation warm_start_from as initial heads, at the end of the
+    first stress period (warm_start_heads: steady, the default) or of the last time step (final).
+    Returns the heads and the warm start report, or None and None to start with the configured heads.
+    """
+    source_id = os.path.basename(str(content.get('warm_start_from')))
+    source_directory = os.path.join(MODFLOW_FOLDER, source_id)
+    state_file = os.path.join(source_directory, 'state.log')
+    state = None
+    if os.path.isfile(state_file):
+        with open(state_file) as f:
+            state = f.read().strip()
+    if state != '200':
+        logger.warning('No warm start, calculation %s is not finished.' % source_id)
+        return None, None
+
+    reader = ReadHead(source_directory)
+    kstpkper = None
+    mode = content.get('warm_start_heads', 'steady')
+    if mode == 'steady':
+        first_period = [step for step in reader.read_kstpkper() if step[1] == 0]
+        if len(first_period) == 0:
+            logger.warning('No warm start, calculation %s has no heads of the first stress period.' % source_id)
+            return None, None
+        kstpkper = first_period[-1]
+
+    heads = reader.read_data(kstpkper)
+    if heads is None:
+        logger.warning('No warm start, the heads of calculation %s are not readable.' % source_id)
+        return None, None
+
+    logger.debug('Warm start from %s with the %s heads.' % (source_id, mode))
+    return heads, {
+        'warm_start_from': source_id,
+        'warm_start_heads': mode,
+        'kstpkper': [int(value) for value in kstpkper] if kstpkper is not None else None,
+    }
+
+
+def report_warm_start(target_directory, report, model_name, cells, logger):
+    """Writes the warm start report with the solver iterations saved against the previous calculation"""
+    source = ReadListFile(os.path.join(MODFLOW_FOLDER, report['warm_start_from']), model_name).read_iterations()
+    current = ReadListFile(target_directory, model_name).read_iterations()
+    saved = None
+    if source is not None and current is not None:
+        saved = {key: source[key] - current[key] for key in current}
+
+    report = {**report, 'cells': cells, 'iterations': {'warm_start_from': source, 'calculation': current},
+              'iterations_saved': saved}
+    logger.info('Warm start: %s' % json.dumps(report))
+    with open(os.path.join(target_directory, 'warm_start.json'), 'w') as f:
+        json.dump(report, f)
+
+
+def create_scratch_directory(calculation_id):
+    """Returns a new, empty workspace for the calculation in the scratch folder, None without scratch folder"""
+    if not WORKER_SCRATCH_FOLDER:
+        return None
+
+    scratch_directory = os.path.join(WORKER_SCRATCH_FOLDER, calculation_id)
+    shutil.rmtree(scratch_directory, ignore_errors=True)
+    os.makedirs(scratch_directory)
+    return scratch_directory
+
+
+def copy_input_files(source_directory, workspace):
+    """
+    Copies the input files of the last run in source_directory and their hashes into the workspace,
+    so only the changed packages are written again. Returns the number of copied files.
+    """
+    copied = 0
+    for file in IncrementalWriter.input_files(source_directory):
+        source = os.path.join(source_directory, file)
+        if os.path.isabs(file) or file.startswith(os.pardir) or not os.path.isfile(source):
+            continue
+        target = os.path.join(workspace, file)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Copied, not linked, the writes in the workspace must not change the source
+        shutil.copy2(source, target)
+        copied += 1
+    return copied
+
+
+def move_scratch_directory(scratch_directory, target_directory):
+    """
+    Moves all files of the scratch workspace into the calculation folder and removes the workspace.
+    Files hardlinked in the workspace, e.g. the shared input files of ensembles, stay hardlinked.
+    """
+    moved = {}
+    for root, directories, files in os.walk(scratch_directory):
+        target_root = os.path.join(target_directory, os.path.relpath(root, scratch_directory))
+        os.makedirs(target_root, exist_ok=True)
+        for file in files:
+            source = os.path.join(root, file)
+            target = os.path.join(target_root, file)
+            # Replaced, not overwritten, the file may be hardlinked into other calculations
+            if os.path.lexists(target):
+                os.remove(target)
+
+            inode = os.stat(source).st_ino
+            if inode in moved:
+                deduplication.link_or_copy(moved[inode], target)
+                continue
+            shutil.move(source, target)
+            moved[inode] = target
+
+    shutil.rmtree(scratch_directory, ignore_errors=True)
+
+
+def response_message(flopy):
+    """The short response message of the adapter, the traceback if the adapter was not created"""
+    if flopy is None:
+        return traceback.format_exc()
+    return flopy.short_response_message()
+
+
+def report_convergence(target_directory, data):
+    """Writes the solver convergence of the Modflow model, returns its summary with the solver"""
+    model_name = 'swt' if 'swt' in data else 'mf'
+    packages = [package.lower() for package in data.get(model_name, {}).get('packages', [])]
+    solver = next((package for package in packages if package in SOLVER_PACKAGES), None)
+
+    convergence = ReadListFile(target_directory, model_name).read_convergence()
+    if convergence is None:
+        return None
+
+    convergence = {'solver': solver, **convergence}
+    with open(os.path.join(target_directory, 'convergence.json'), 'w') as f:
+        json.dump(convergence, f)
+    return {'solver': solver, **convergence['summary']}
+
+
+def calculate(idx, calculation_id, logger, cancelled=None):
     print('Calculating: ' + calculation_id)
     logger.debug('Calculating: ' + calculation_id)
 
@@ -62,7 +375,8 @@ def calculate(idx, calculation_id, logger):
     filename = os.path.join(target_directory, 'configuration.json')
     logger.debug('Filename: {0}'.format(filename))
 
-    content = read_json(filename)
+    content = configuration.read_configuration(filename)
+    ArrayEncoding.npy_folder = os.path.join(MODFLOW_FOLDER, configuration.ARRAY_FOLDER)
     author = content.get("author")
     project = content.get("project")
     calculation_id = content.get("calculation_id")
@@ -70,6 +384,17 @@ def calculate(idx, calculation_id, logger):
     m_type = content.get("type")
     version = content.get("version")
     data = content.get("data")
+    time_limit = float(content.get("time_limit", CALCULATION_TIME_LIMIT) or 0)
+    cpu_time_limit = float(content.get("cpu_time_limit", CALCULATION_CPU_TIME_LIMIT) or 0)
+    binary_array_threshold = None
+    if content.get("binary_arrays", BINARY_ARRAYS):
+        binary_array_threshold = int(content.get("binary_array_threshold", BINARY_ARRAY_THRESHOLD))
+    cell_major_time_steps = CELL_MAJOR_TIME_STEPS
+    if content.get("cell_major_results") is not None:
+        cell_major_time_steps = 1 if content.get("cell_major_results") else 0
+    warm_start_heads, warm_start = None, None
+    if content.get("warm_start_from") and 'mf' in data and not ensemble.members(content):
+        warm_start_heads, warm_start = read_warm_start_heads(content, logger)
 
     logger.debug('Summary:')
     logger.debug('Author: %s' % author)
@@ -78,51 +403,128 @@ def calculate(idx, calculation_id, logger):
     logger.debug('Calculation Id: %s' % calculation_id)
     logger.debug('Type: %s' % m_type)
     logger.debug('Version: %s' % version)
+    logger.debug('Time limit: %s' % (time_limit or 'none'))
+    logger.debug('CPU time limit: %s' % (cpu_time_limit or 'none'))
+    logger.debug('Binary array threshold: %s' % (binary_array_threshold or 'none'))
     logger.debug(
         "Running flopy calculation for model-id '{0}' with calculation-id '{1}'".format(model_id, calculation_id))
 
+    scratch_directory = create_scratch_directory(calculation_id)
+    model_ws = scratch_directory or target_directory
+    logger.debug('Model workspace: %s' % model_ws)
+
+    # The input files of the last run, of the calculation input_from if this calculation never ran
+    input_directory = target_directory
+    if content.get("input_from") and not os.path.isfile(os.path.join(target_directory, IncrementalWriter.hash_file)):
+        input_directory = os.path.join(MODFLOW_FOLDER, os.path.basename(str(content.get("input_from"))))
+    if input_directory != model_ws:
+        logger.debug('Input files copied from %s: %d' % (input_directory, copy_input_files(input_directory, model_ws)))
+
     if 'mf' in data:
         data['mf']['mf']['modelname'] = 'mf'
-        data['mf']['mf']['model_ws'] = target_directory
+        data['mf']['mf']['model_ws'] = model_ws
 
     if 'mt' in data:
         data['mt']['mt']['modelname'] = 'mt'
-        data['mt']['mt']['model_ws'] = target_directory
+        data['mt']['mt']['model_ws'] = model_ws
 
     if 'mp' in data:
         data['mp']['mp']['modelname'] = 'mp'
-        data['mp']['mp']['model_ws'] = target_directory
+        data['mp']['mp']['model_ws'] = model_ws
 
     if 'swt' in data:
         data['swt']['swt']['modelname'] = 'swt'
-        data['swt']['swt']['model_ws'] = target_directory
+        data['swt']['swt']['model_ws'] = model_ws
 
-    conn = db_connect()
+    conn = db.connect()
     conn.set_trace_callback(logger.debug)
     cur = conn.cursor()
     write_state(target_directory, 100)
-    cur.execute('UPDATE calculations SET state = ?, updated_at = ? WHERE id = ?', (100, datetime.now(), idx))
-    conn.commit()
 
     flopy = None
     try:
-        flopy = InowasFlopyCalculationAdapter(version, data, calculation_id)
-        state = 200 if flopy.success else 400
+        try:
+            if ensemble.members(content):
+                logger.debug('Ensemble members: %d' % len(ensemble.members(content)))
+                flopy = InowasFlopyEnsembleAdapter(version, data, calculation_id, ensemble.members(content),
+                                                   processes=ENSEMBLE_PROCESSES, time_limit=time_limit,
+                                                   cpu_time_limit=cpu_time_limit, cancel_event=cancelled,
+                                                   binary_array_threshold=binary_array_threshold)
+            else:
+                flopy = InowasFlopyCalculationAdapter(version, data, calculation_id, time_limit=time_limit,
+                                                      cpu_time_limit=cpu_time_limit, cancel_event=cancelled,
+                                                      binary_array_threshold=binary_array_threshold,
+                                                      warm_start_heads=warm_start_heads)
+        finally:
+            # Also the files of failed and cancelled runs, before the state is set
+            if scratch_directory is not None:
+                start = monotonic()
+                move_scratch_directory(scratch_directory, target_directory)
+                if flopy is not None:
+                    stages = flopy.timings().setdefault('swt' if 'swt' in data else 'mf', {})
+                    stages['move_scratch'] = monotonic() - start
+        if getattr(flopy, 'cancelled', False):
+            # The state was already set by whoever cancelled the calculation,
+            # but the state file may have been overwritten when the run started
+            logger.info('Calculation cancelled.')
+            row = cur.execute('SELECT state FROM calculations WHERE id = ?', (idx,)).fetchone()
+            if row is not None and row['state'] == 499:
+                write_state(target_directory, 499)
+            return
+
+        state = 200 if flopy.success() else 400
+        message = flopy.short_response_message()
+        if flopy.timed_out:
+            # Also when a post-flow model exceeded the limit after Modflow terminated normally
+            logger.info('Calculation time limit exceeded.')
+            state = 400
+            message = 'Time limit exceeded.\n' + message
         logger.debug('Flopy-state: ' + str(state))
         logger.info(str(flopy.response_message()))
 
-        cur.execute('UPDATE calculations SET state = ?, message = ?, updated_at = ? WHERE id = ?',
-                    (state, flopy.short_response_message(), datetime.now(), idx))
+        try:
+            with flopy.timer('index_output_files', 'swt' if 'swt' in data else 'mf'):
+                logger.debug('Indexed output files: %s' % BinaryFileIndex.build(target_directory))
+        except:
+            logger.error(traceback.format_exc())
+
+        try:
+            with flopy.timer('output_statistics', 'swt' if 'swt' in data else 'mf'):
+                logger.debug('Layer statistics of output files: %s' % LayerStatistics.build(target_directory))
+        except:
+            logger.error(traceback.format_exc())
+
+        if cell_major_time_steps > 0:
+            try:
+                with flopy.timer('cell_major_results', 'swt' if 'swt' in data else 'mf'):
+                    logger.debug('Cell-major copies of output files: %s' % CellMajorFile.build(
+                        target_directory, min_times=cell_major_time_steps))
+            except:
+                logger.error(traceback.format_exc())
+
+        if warm_start is not None:
+            try:
+                report_warm_start(target_directory, warm_start, 'swt' if 'swt' in data else 'mf',
+                                  flopy.warm_start_cells, logger)
+            except:
+                logger.error(traceback.format_exc())
+
+        # Only calculations which are still running, not cancelled or requeued in the meantime
+        cur.execute('UPDATE calculations SET state = ?, message = ?, updated_at = ? WHERE id = ? AND state = ?',
+                    (state, message, datetime.now(), idx, 100))
         conn.commit()
-        write_state(target_directory, state)
+        if cur.rowcount == 1:
+            write_state(target_directory, state)
     except:
-        write_state(target_directory, 500)
-        cur.execute('UPDATE calculations SET state = ?, message = ?, updated_at = ? WHERE id = ?',
-                    (500, flopy.short_response_message(), datetime.now(), idx))
+        cur.execute('UPDATE calculations SET state = ?, message = ?, updated_at = ? WHERE id = ? AND state = ?',
+                    (500, response_message(flopy), datetime.now(), idx, 100))
+        conn.commit()
+        if cur.rowcount == 1:
+            write_state(target_directory, 500)
         logger.error(traceback.format_exc())
         pass
     finally:
-        conn.close()
+        conn.set_trace_callback(None)
         if flopy not in [None, False]:
             try:
                 model_check(target_directory, flopy)
@@ -130,6 +532,17 @@ def calculate(idx, calculation_id, logger):
                 logger.error(traceback.format_exc())
                 pass
 
+            convergence = None
+            if not ensemble.members(content):
+                try:
+                    convergence = report_convergence(target_directory, data)
+                    logger.debug('Convergence: %s' % json.dumps(convergence))
+                except:
+                    logger.error(traceback.format_exc())
+
+            logger.debug('Timings: %s' % json.dumps(flopy.timings()))
+            save_timings(idx, flopy.timings(), convergence)
+
 
 def set_logger(target_directory, calculation_id):
     logger = logging.getLogger('Calculation_log_' + calculation_id)
@@ -152,38 +565,112 @@ def set_logger(target_directory, calculation_id):
     return logger
 
 
-def run():
+def run(worker_id):
+    print('Worker {} started.'.format(worker_id))
+    wakeup_channel = wakeup.open_channel()
     while True:
-        row = get_next_new_calculation_job()
+        reap_expired_leases()
+        row = claim_next_calculation_job(worker_id)
 
         if not row:
-            sleep(1)
+            wakeup.wait(wakeup_channel, WORKER_POLL_INTERVAL)
             continue
 
         idx = row['id']
         calculation_id = row['calculation_id']
         target_directory = os.path.join(MODFLOW_FOLDER, calculation_id)
+        deduplication.unshare_files(target_directory)
         logger = set_logger(target_directory, calculation_id)
+        cancelled = threading.Event()
+        heartbeat = start_heartbeat(idx, worker_id, cancelled)
 
         try:
-            calculate(idx, calculation_id, logger)
+            calculate(idx, calculation_id, logger, cancelled)
         except:
-            conn = db_connect()
-            conn.set_trace_callback(logger.debug)
+            conn = db.connect()
             cur = conn.cursor()
-            cur.execute('UPDATE calculations SET state = ?, message = ?, updated_at = ? WHERE id = ?',
-                        (500, traceback.format_exc(), datetime.now(), idx))
+            # Only calculations which are still running, not cancelled or requeued in the meantime
+            cur.execute('UPDATE calculations SET state = ?, message = ?, updated_at = ? WHERE id = ? AND state = ?',
+                        (500, traceback.format_exc(), datetime.now(), idx, 100))
             conn.commit()
             logger.debug('Flopy-state: ' + str(500))
             logger.debug(traceback.format_exc())
             logger.error(traceback.format_exc())
-            write_state(target_directory, 500)
+            if cur.rowcount == 1:
+                write_state(target_directory, 500)
         finally:
+            heartbeat.set()
             root = logging.getLogger()
             list(map(root.removeHandler, root.handlers))
             list(map(root.removeFilter, root.filters))
 
 
+def run_slot(process_folder=None):
+    """
+    Runs a worker, its models register their process groups in the process folder.
+    On SIGTERM the models are killed before their calculations are released.
+    """
+    worker_id = new_worker_id()
+    process_folder = process_folder or tempfile.mkdtemp(prefix='worker-processes-')
+    os.environ[ModelRunner.process_folder_variable] = process_folder
+
+    def terminate(signum, frame):
+        print('Worker {} stopped, releasing its calculations.'.format(worker_id))
+        ModelRunner.kill_registered(process_folder)
+        # The thread's connection may be in the middle of a transaction
+        try:
+            conn = db.open_connection(timeout=WORKER_RELEASE_TIMEOUT)
+            try:
+                release_calculation_jobs(worker_id, conn)
+            finally:
+                conn.close()
+        except sql.Error:
+            print('Worker {} could not release its calculations, they are requeued when their leases expire.'
+                  .format(worker_id))
+        os._exit(0)
+
+    signal.signal(signal.SIGTERM, terminate)
+    run(worker_id)
+
+
+def run_pool(slots):
+    """
+    Runs the given number of worker slots, each in its own process.
+    Slots which terminate unexpectedly are restarted.
+    """
+    if slots <= 1:
+        run_slot()
+        return
+
+    processes = {}
+    process_folders = {}
+    for slot in range(slots):
+        process_folders[slot] = tempfile.mkdtemp(prefix='worker-slot-{}-processes-'.format(slot))
+        processes[slot] = multiprocessing.Process(
+            target=run_slot, args=(process_folders[slot],), name='worker-slot-{}'.format(slot))
+        processes[slot].start()
+
+    def terminate(signum, frame):
+        for process in processes.values():
+            process.terminate()
+        for process in processes.values():
+            process.join()
+        os._exit(0)
+
+    signal.signal(signal.SIGTERM, terminate)
+
+    while True:
+        sentinels = {process.sentinel: slot for slot, process in processes.items()}
+        for sentinel in multiprocessing.connection.wait(list(sentinels)):
+            slot = sentinels[sentinel]
+            print('Worker slot {} exited with code {}, restarting.'.format(slot, processes[slot].exitcode))
+            # The models of the dead slot must not keep writing into folders of requeued calculations
+            ModelRunner.kill_registered(process_folders[slot])
+            processes[slot] = multiprocessing.Process(
+                target=run_slot, args=(process_folders[slot],), name='worker-slot-{}'.format(slot))
+            processes[slot].start()
+
+
 if __name__ == '__main__':
-    db_init()
-    run()
+    db.init()
+    run_pool(WORKER_SLOTS)